@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+描画プリミティブのベンチマークスクリプト
+"""
+
+import math
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from design_kit import gradients
+from design_kit.gradients import radial_gradient
+
+
+def legacy_circular_gradient(width, height, center_color, edge_color):
+    """旧実装（1ピクセルずつ sqrt + draw.point）"""
+    img = Image.new('RGB', (width, height))
+    draw = ImageDraw.Draw(img)
+    center_x, center_y = width // 2, height // 2
+    max_radius = math.sqrt(center_x**2 + center_y**2)
+
+    for y in range(height):
+        for x in range(width):
+            distance = math.sqrt((x - center_x)**2 + (y - center_y)**2)
+            ratio = min(distance / max_radius, 1.0)
+
+            r = int(center_color[0] + (edge_color[0] - center_color[0]) * ratio)
+            g = int(center_color[1] + (edge_color[1] - center_color[1]) * ratio)
+            b = int(center_color[2] + (edge_color[2] - center_color[2]) * ratio)
+
+            draw.point((x, y), fill=(r, g, b))
+    return img
+
+
+def timed(func, repeat=1):
+    """最速実行時間（秒）と最後の結果を返す"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_circular_gradient(size=1024):
+    """App Store アイコン用円形グラデーションの新旧比較"""
+    colors = ((106, 90, 255), (72, 219, 251))
+
+    legacy_time, legacy = timed(lambda: legacy_circular_gradient(size, size, *colors))
+    gradients.images.clear()
+    cold_time, vectorized = timed(lambda: radial_gradient(size, size, colors))
+    warm_time, _ = timed(lambda: radial_gradient(size, size, colors), repeat=5)
+
+    identical = np.array_equal(np.asarray(legacy), np.asarray(vectorized))
+    print(f"🎯 円形グラデーション {size}x{size}")
+    print(f"   旧実装:           {legacy_time * 1000:10.1f} ms")
+    print(f"   ベクトル化:       {cold_time * 1000:10.1f} ms")
+    print(f"   ベクトル化(キャッシュ): {warm_time * 1000:6.1f} ms")
+    print(f"   高速化:           {legacy_time / cold_time:10.1f}x")
+    print(f"   出力一致:         {'✅' if identical else '❌'}")
+    return identical
+
+
+if __name__ == "__main__":
+    print("⏱️ 描画ベンチマーク実行中...")
+    ok = bench_circular_gradient()
+    print("✨ ベンチマーク完了！" if ok else "❌ 出力が一致しません")
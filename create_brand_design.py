@@ -1,25 +1,37 @@
 #!/usr/bin/env python3
 """
 MindBridge ブランドデザイン・ロゴ生成スクリプト
+
+ロゴ・アプリアイコン・GitHub バナーは PNG に加えて SVG / PDF でも書き出す
+（同じ描画コードを VectorCanvas に流すため、どのサイズでも劣化しない）。
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import json
-import math
+
+from design_kit.fonts import get_font
+from design_kit.gradients import paste_gradient, radial_gradient
+from design_kit.icons import APP_ICON_SIZES, render_icon_set, save_icon_set
+from design_kit.sdf import ShapeBatch
+from design_kit.vector import VectorCanvas
+
+# PNG と一緒に書き出すベクター形式
+VECTOR_FORMATS = ('svg', 'pdf')
+
+# ブランドカラーパレット
+BRAND_COLORS = {
+    "primary": (106, 90, 255),      # 紫ブルー
+    "secondary": (255, 107, 107),    # コーラルピンク  
+    "accent": (72, 219, 251),        # シアン
+    "dark": (30, 30, 35),            # ダークグレー
+    "light": (248, 249, 250),        # ライトグレー
+    "gradient_start": (106, 90, 255),
+    "gradient_end": (72, 219, 251)
+}
 
 def create_mindbridge_brand():
     """MindBridge ブランドのロゴとデザインを作成"""
-    
-    # ブランドカラーパレット
-    brand_colors = {
-        "primary": (106, 90, 255),      # 紫ブルー
-        "secondary": (255, 107, 107),    # コーラルピンク  
-        "accent": (72, 219, 251),        # シアン
-        "dark": (30, 30, 35),            # ダークグレー
-        "light": (248, 249, 250),        # ライトグレー
-        "gradient_start": (106, 90, 255),
-        "gradient_end": (72, 219, 251)
-    }
+    brand_colors = BRAND_COLORS
     
     # メインロゴ作成
     create_main_logo(brand_colors)
@@ -33,129 +45,145 @@ def create_mindbridge_brand():
     # ブランドガイド保存
     save_brand_guide(brand_colors)
 
-def create_main_logo(colors):
+def create_main_logo(colors=BRAND_COLORS):
     """メインロゴを作成"""
     width, height = 800, 300
     img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
     
     # 背景グラデーション
-    create_gradient_background(draw, width, height, colors["gradient_start"], colors["gradient_end"])
+    create_gradient_background(img, width, height, colors["gradient_start"], colors["gradient_end"])
+    
+    # 図形は SDF でまとめてラスタライズ
+    shapes = ShapeBatch()
+    draw_logo_shapes(shapes, width, height, colors)
+    shapes.render(img)
+    draw_logo_text(ImageDraw.Draw(img), width, height, colors)
+    
+    img.save("MindBridge_Logo.png", 'PNG')
+    print("✅ Created: MindBridge_Logo.png")
     
-    # "Mind" + "Bridge" のビジュアル表現
+    # 同じロゴをベクターで
+    canvas = VectorCanvas((width, height))
+    canvas.linear_gradient((0, 0, width, height), [colors["gradient_start"], colors["gradient_end"]])
+    draw_logo_shapes(canvas, width, height, colors)
+    draw_logo_text(canvas, width, height, colors)
+    save_vector(canvas, "MindBridge_Logo")
+
+def draw_logo_shapes(shapes, width, height, colors):
+    """"Mind" + "Bridge" のビジュアル表現"""
     center_x, center_y = width // 2, height // 2
     
     # 左側の"Mind"を表現する脳の形
     mind_x = center_x - 120
-    draw_brain_icon(draw, mind_x, center_y, 80, colors["light"])
+    draw_brain_icon(shapes, mind_x, center_y, 80, colors["light"])
     
     # 中央のブリッジ（接続線）
     bridge_start_x = mind_x + 80
     bridge_end_x = center_x + 40
-    draw_neural_bridge(draw, bridge_start_x, center_y, bridge_end_x, center_y, colors["accent"])
+    draw_neural_bridge(shapes, bridge_start_x, center_y, bridge_end_x, center_y, colors["accent"])
     
     # 右側の"Bridge"を表現するデバイス
     device_x = center_x + 80
-    draw_device_icon(draw, device_x, center_y, 60, colors["light"])
-    
-    # テキストロゴ
-    try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Arial Bold.ttf", 48)
-        subtitle_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 20)
-        
-        # "MindBridge"
-        text_y = center_y + 60
-        draw.text((center_x - 120, text_y), "MindBridge", fill=colors["light"], font=title_font, anchor="mm")
-        
-        # サブタイトル
-        subtitle_y = text_y + 50
-        draw.text((center_x - 120, subtitle_y), "Private AI Assistant", fill=colors["light"], font=subtitle_font, anchor="mm")
-        
-    except:
-        pass
+    draw_device_icon(shapes, device_x, center_y, 60, colors["light"])
+
+def draw_logo_text(draw, width, height, colors):
+    """テキストロゴ"""
+    center_x, center_y = width // 2, height // 2
+    title_font = get_font(48, bold=True, family='arial')
+    subtitle_font = get_font(20, family='arial')
     
-    img.save("MindBridge_Logo.png", 'PNG')
-    print("✅ Created: MindBridge_Logo.png")
+    # "MindBridge"
+    text_y = center_y + 60
+    draw.text((center_x - 120, text_y), "MindBridge", fill=colors["light"], font=title_font, anchor="mm")
+    
+    # サブタイトル
+    subtitle_y = text_y + 50
+    draw.text((center_x - 120, subtitle_y), "Private AI Assistant", fill=colors["light"], font=subtitle_font, anchor="mm")
 
-def create_app_icons(colors):
+def create_app_icons(colors=BRAND_COLORS):
     """アプリアイコン（全サイズ）を作成"""
-    sizes = [
-        (1024, 1024), (180, 180), (120, 120), (87, 87), (80, 80),
-        (60, 60), (58, 58), (40, 40), (29, 29), (20, 20)
-    ]
-    
-    for width, height in sizes:
-        img = Image.new('RGB', (width, height), colors["primary"])
-        draw = ImageDraw.Draw(img)
-        
-        # 円形グラデーション背景
-        create_circular_gradient(draw, width, height, colors["primary"], colors["accent"])
-        
-        # アイコンデザイン
-        center_x, center_y = width // 2, height // 2
-        scale = width / 1024.0
-        
+    
+    def draw_icon(shapes, width, height):
         # 脳とデバイスを接続するシンプルなデザイン
-        draw_brain_bridge_icon(draw, center_x, center_y, int(200 * scale), colors["light"], scale)
-        
-        # 保存
-        filename = f"AppIcon-{width}x{height}.png"
-        img.save(filename, 'PNG', quality=100)
+        scale = width / 1024.0
+        draw_brain_bridge_icon(shapes, width // 2, height // 2, int(200 * scale), colors["light"], scale)
+    
+    def draw_icon_master(img, width, height):
+        # 円形グラデーション背景
+        create_circular_gradient(img, width, height, colors["primary"], colors["accent"])
+        shapes = ShapeBatch()
+        draw_icon(shapes, width, height)
+        shapes.render(img)
+    
+    # マスターを1回だけ描画し、全サイズを縮小チェーンで作成
+    images = render_icon_set(draw_icon_master, APP_ICON_SIZES)
+    
+    # 保存
+    for filename in save_icon_set(images):
         print(f"✅ Created: {filename}")
+    
+    # マスターサイズのベクター
+    canvas = VectorCanvas((1024, 1024))
+    canvas.radial_gradient((0, 0, 1024, 1024), [colors["primary"], colors["accent"]])
+    draw_icon(canvas, 1024, 1024)
+    save_vector(canvas, "AppIcon")
 
-def create_github_assets(colors):
+def create_github_assets(colors=BRAND_COLORS):
     """GitHub用アセットを作成"""
     
     # GitHub バナー
     banner_width, banner_height = 1280, 640
     banner = Image.new('RGB', (banner_width, banner_height), colors["dark"])
-    draw = ImageDraw.Draw(banner)
     
     # グラデーション背景
-    create_gradient_background(draw, banner_width, banner_height, 
+    create_gradient_background(banner, banner_width, banner_height, 
                              colors["primary"], colors["accent"])
-    
-    # ロゴとテキスト
-    center_x, center_y = banner_width // 2, banner_height // 2
-    
-    try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Arial Bold.ttf", 72)
-        subtitle_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 32)
-        desc_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 24)
-        
-        # タイトル
-        draw.text((center_x, center_y - 80), "🧠 MindBridge", fill=(255, 255, 255), 
-                 font=title_font, anchor="mm")
-        
-        # サブタイトル
-        draw.text((center_x, center_y - 20), "Private AI Assistant for iOS", 
-                 fill=(255, 255, 255), font=subtitle_font, anchor="mm")
-        
-        # 説明
-        draw.text((center_x, center_y + 30), "Qwen3-4B • Offline • Open Source • Privacy-First", 
-                 fill=(200, 200, 200), font=desc_font, anchor="mm")
-        
-    except:
-        pass
+    draw_banner_text(ImageDraw.Draw(banner), banner_width, banner_height)
     
     banner.save("GitHub_Banner.png", 'PNG', quality=100)
     print("✅ Created: GitHub_Banner.png")
     
+    canvas = VectorCanvas((banner_width, banner_height))
+    canvas.linear_gradient((0, 0, banner_width, banner_height), [colors["primary"], colors["accent"]])
+    draw_banner_text(canvas, banner_width, banner_height)
+    save_vector(canvas, "GitHub_Banner")
+    
     # GitHub アバター/ロゴ
     avatar_size = 400
     avatar = Image.new('RGB', (avatar_size, avatar_size), colors["primary"])
-    draw = ImageDraw.Draw(avatar)
+    shapes = ShapeBatch()
     
     # 円形背景
-    draw.ellipse([10, 10, avatar_size-10, avatar_size-10], fill=colors["primary"])
+    shapes.ellipse([10, 10, avatar_size-10, avatar_size-10], fill=colors["primary"])
     
     # シンプルなアイコン
     center = avatar_size // 2
-    draw_brain_bridge_icon(draw, center, center, 150, colors["light"], 1.0)
+    draw_brain_bridge_icon(shapes, center, center, 150, colors["light"], 1.0)
+    shapes.render(avatar)
     
     avatar.save("GitHub_Avatar.png", 'PNG', quality=100)
     print("✅ Created: GitHub_Avatar.png")
 
+def draw_banner_text(draw, banner_width, banner_height):
+    """GitHub バナーのロゴとテキスト"""
+    center_x, center_y = banner_width // 2, banner_height // 2
+    
+    title_font = get_font(72, bold=True, family='arial')
+    subtitle_font = get_font(32, family='arial')
+    desc_font = get_font(24, family='arial')
+    
+    # タイトル
+    draw.text((center_x, center_y - 80), "🧠 MindBridge", fill=(255, 255, 255), 
+             font=title_font, anchor="mm")
+    
+    # サブタイトル
+    draw.text((center_x, center_y - 20), "Private AI Assistant for iOS", 
+             fill=(255, 255, 255), font=subtitle_font, anchor="mm")
+    
+    # 説明
+    draw.text((center_x, center_y + 30), "Qwen3-4B • Offline • Open Source • Privacy-First", 
+             fill=(200, 200, 200), font=desc_font, anchor="mm")
+
 def draw_brain_icon(draw, x, y, size, color):
     """脳のアイコンを描画"""
     # シンプルな脳の形（楕円とカーブ）
@@ -180,17 +208,17 @@ def draw_device_icon(draw, x, y, size, color):
     device_height = int(size * 0.7)
     
     # 本体
-    draw_rounded_rectangle(draw, x - device_width//2, y - device_height//2,
-                          x + device_width//2, y + device_height//2,
-                          8, color)
+    draw.rounded_rectangle([x - device_width//2, y - device_height//2,
+                            x + device_width//2, y + device_height//2],
+                           radius=8, fill=color)
     
     # 画面
     screen_margin = 4
-    draw_rounded_rectangle(draw, x - device_width//2 + screen_margin, 
-                          y - device_height//2 + screen_margin*2,
-                          x + device_width//2 - screen_margin, 
-                          y + device_height//2 - screen_margin*3,
-                          4, (100, 100, 100))
+    draw.rounded_rectangle([x - device_width//2 + screen_margin, 
+                            y - device_height//2 + screen_margin*2,
+                            x + device_width//2 - screen_margin, 
+                            y + device_height//2 - screen_margin*3],
+                           radius=4, fill=(100, 100, 100))
 
 def draw_neural_bridge(draw, x1, y1, x2, y2, color):
     """ニューラルネットワーク風の接続線を描画"""
@@ -229,45 +257,21 @@ def draw_brain_bridge_icon(draw, center_x, center_y, size, color, scale):
     draw.ellipse([center_x - center_radius, center_y - center_radius,
                   center_x + center_radius, center_y + center_radius], fill=color)
 
-def create_gradient_background(draw, width, height, start_color, end_color):
+def create_gradient_background(img, width, height, start_color, end_color):
     """グラデーション背景を作成"""
-    for y in range(height):
-        ratio = y / height
-        r = int(start_color[0] + (end_color[0] - start_color[0]) * ratio)
-        g = int(start_color[1] + (end_color[1] - start_color[1]) * ratio)
-        b = int(start_color[2] + (end_color[2] - start_color[2]) * ratio)
-        color = (r, g, b)
-        draw.line([(0, y), (width, y)], fill=color)
+    paste_gradient(img, (0, 0, width, height), [start_color, end_color])
 
-def create_circular_gradient(draw, width, height, center_color, edge_color):
+def create_circular_gradient(img, width, height, center_color, edge_color):
     """円形グラデーションを作成"""
-    center_x, center_y = width // 2, height // 2
-    max_radius = math.sqrt(center_x**2 + center_y**2)
-    
-    for y in range(height):
-        for x in range(width):
-            distance = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-            ratio = min(distance / max_radius, 1.0)
-            
-            r = int(center_color[0] + (edge_color[0] - center_color[0]) * ratio)
-            g = int(center_color[1] + (edge_color[1] - center_color[1]) * ratio)
-            b = int(center_color[2] + (edge_color[2] - center_color[2]) * ratio)
-            
-            draw.point((x, y), fill=(r, g, b))
+    img.paste(radial_gradient(width, height, [center_color, edge_color]), (0, 0))
 
-def draw_rounded_rectangle(draw, x1, y1, x2, y2, radius, fill):
-    """角丸四角形を描画"""
-    # メイン四角形
-    draw.rectangle([x1 + radius, y1, x2 - radius, y2], fill=fill)
-    draw.rectangle([x1, y1 + radius, x2, y2 - radius], fill=fill)
-    
-    # 角の円
-    draw.ellipse([x1, y1, x1 + 2*radius, y1 + 2*radius], fill=fill)
-    draw.ellipse([x2 - 2*radius, y1, x2, y1 + 2*radius], fill=fill)
-    draw.ellipse([x1, y2 - 2*radius, x1 + 2*radius, y2], fill=fill)
-    draw.ellipse([x2 - 2*radius, y2 - 2*radius, x2, y2], fill=fill)
+def save_vector(canvas, stem):
+    """VectorCanvas を VECTOR_FORMATS の各形式で保存"""
+    for extension in VECTOR_FORMATS:
+        canvas.save(f"{stem}.{extension}")
+        print(f"✅ Created: {stem}.{extension}")
 
-def save_brand_guide(colors):
+def save_brand_guide(colors=BRAND_COLORS):
     """ブランドガイドをJSONで保存"""
     brand_guide = {
         "brand_name": "MindBridge",
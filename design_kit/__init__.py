@@ -0,0 +1,5 @@
+"""
+MindBridge アセット生成用の共有描画ユーティリティ
+
+スクリーンショット・アイコン・バナーの各生成スクリプトから共通で利用する。
+"""
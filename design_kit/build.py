@@ -0,0 +1,458 @@
+"""
+アセット生成のビルドオーケストレーター
+
+アイコン・App Store スクリーンショット・ブランド素材・シーンの各生成処理を、
+インポートしても副作用のないジョブ ("モジュール:関数" と引数) として列挙し、
+マシンのコア数に合わせたプロセスプールで並列に実行する。
+
+各ジョブは出力先の中の作業ディレクトリをカレントディレクトリにして実行し、成功したジョブの
+ファイルだけを os.replace で出力先に移す（書きかけのファイルや失敗したジョブの出力は残らない）。
+同じパスを複数のジョブが書く場合は、逐次実行と同じく後のジョブの出力を残す。
+最後にジョブごとの所要時間と失敗をまとめて表示する。
+
+ジョブごとに入力（シーン仕様・会話・ローカライズ文字列・端末プロファイル・テーマの色・解決されたフォントファイル・
+ジョブのモジュールから import をたどったプロジェクト内のソース）のハッシュを指紋として、
+出力先のマニフェストに出力ファイルと一緒に記録する。指紋が前回と同じで出力がそろっているジョブは
+実行せず前回の出力を使う。マニフェストはジョブが終わるたびに保存するため、
+中断したビルドはもう一度実行すると終わっていないジョブから再開する。
+
+    python -m design_kit.build -o build/assets            # すべて（変更のあったジョブだけ）
+    python -m design_kit.build --only 'scene:*' --jobs 4  # シーンだけ
+    python -m design_kit.build -o build/assets --force    # 前回の出力を使わずすべて実行
+"""
+
+import argparse
+import ast
+import fnmatch
+import hashlib
+import importlib
+import io
+import json
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import time
+import traceback
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from functools import lru_cache
+
+from .corpus import CORPUS_PATH
+from .devices import APP_STORE_DEVICES, DEFAULT_DEVICE, device_names, get_device
+from .font_index import FontNotFoundError, get_index
+from .fonts import BOLD_WEIGHT, FALLBACK_FAMILIES, FONT_FAMILIES, REGULAR_WEIGHT
+from .paths import PROJECT_ROOT
+from .scene import (OUTPUT_DIR as SCENE_OUTPUT_DIR, THEMES, SceneError, input_value, load_scene, scene_inputs,
+                    scene_names, scene_path)
+
+MANIFEST_NAME = ".build_manifest.json"
+MANIFEST_VERSION = 2
+
+# ハッシュを計算した時刻からこの時間以内に更新されたファイルは、次もハッシュを計算し直す
+# （更新時刻の刻みの中で同じサイズのまま書き換えられると、サイズと更新時刻では変更を見分けられない）
+RACY_WINDOW_NS = 2 * 10**9
+
+# ジョブの作業ディレクトリの接頭辞（中断したビルドの作業ディレクトリは次のビルドの開始時に消す）
+STAGING_PREFIX = ".build-"
+
+# target は "モジュール:関数"（ワーカーで import するため pickle できる形で持つ）
+# inputs はソース以外の入力: ('file', パス) / ('device', 名前) / ('theme', 名前) と
+# シーンが読む ('conversation', ID) / ('strings', ロケール, キー)
+Job = namedtuple('Job', 'name target args inputs', defaults=((),))
+JobResult = namedtuple('JobResult', 'name seconds staging files error log')
+
+
+class BuildError(RuntimeError):
+    """ジョブの実行に失敗した"""
+
+
+def discover_jobs(devices=()):
+    """生成ジョブを、逐次実行していたスクリプトと同じ順に列挙する
+
+    devices を渡すと、シーンをその端末のピクセル密度で描くジョブも加える。
+    """
+    jobs = [Job('app_icon', 'create_app_icon:create_app_icon', ())]
+    for device in APP_STORE_DEVICES:
+        jobs.append(Job(f'app_store:{device}', 'create_app_store_screenshots:create_app_store_screenshots',
+                        ([device],), (('device', device), ('file', CORPUS_PATH))))
+    jobs.append(Job('app_store:feature_showcase', 'create_app_store_screenshots:create_feature_showcase', ()))
+    for part in ('create_main_logo', 'create_app_icons', 'create_github_assets', 'save_brand_guide'):
+        jobs.append(Job(f'brand:{part}', f'create_brand_design:{part}', ()))
+    for name in scene_names():
+        jobs.append(Job(f'scene:{name}', 'design_kit.scene:render_scenes', ([name],),
+                        scene_job_inputs(name, DEFAULT_DEVICE)))
+        for device in devices:
+            jobs.append(Job(f'scene:{name}@{device}', 'design_kit.scene:render_scenes',
+                            ([name], os.path.join(SCENE_OUTPUT_DIR, device), device),
+                            scene_job_inputs(name, device)))
+    return jobs
+
+
+def scene_job_inputs(name, device):
+    """シーンのジョブの入力（仕様ファイル・テーマ・端末と、使う会話・ローカライズ文字列）"""
+    path = scene_path(name)
+    try:
+        spec = load_scene(path)
+    except SceneError:
+        # 読み込めない仕様はジョブの失敗として報告する
+        return (('file', path),)
+    return (('file', path), ('theme', spec.get('theme', 'dark')), ('device', device), *scene_inputs(spec))
+
+
+def select_jobs(jobs, patterns):
+    """名前が patterns（fnmatch）のどれかに一致するジョブ"""
+    if not patterns:
+        return list(jobs)
+    return [job for job in jobs if any(fnmatch.fnmatchcase(job.name, pattern) for pattern in patterns)]
+
+
+def resolve(target):
+    """"モジュール:関数" を関数にする"""
+    module, _, function = target.partition(':')
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+    return getattr(importlib.import_module(module), function)
+
+
+def _module_file(name):
+    """プロジェクト内のモジュールのソースファイル（プロジェクト外のモジュールなら None）"""
+    base = os.path.join(PROJECT_ROOT, *name.split('.'))
+    for path in (base + '.py', os.path.join(base, '__init__.py')):
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+@lru_cache(maxsize=None)
+def source_files(module):
+    """module と、そこから import をたどって届くプロジェクト内のモジュールのソースファイル"""
+    files = set()
+    pending = [module]
+    while pending:
+        name = pending.pop()
+        path = _module_file(name)
+        if path is None or path in files:
+            continue
+        files.add(path)
+        if '.' in name:
+            pending.append(name.rpartition('.')[0])
+        package = name if path.endswith('__init__.py') else name.rpartition('.')[0]
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                pending.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ''
+                if node.level:
+                    parts = package.split('.')[:len(package.split('.')) + 1 - node.level]
+                    base = '.'.join(parts + [node.module] if node.module else parts)
+                # from パッケージ import サブモジュール の場合もあるため両方を候補にする
+                pending.append(base)
+                pending.extend(f"{base}.{alias.name}" for alias in node.names)
+    return tuple(sorted(files))
+
+
+def font_files():
+    """論理ファミリー（標準・太字）とフォールバック候補が索引で解決されるフォントファイル"""
+    index = get_index()
+    paths = set()
+    for families in list(FONT_FAMILIES.values()) + [[family] for family in FALLBACK_FAMILIES]:
+        for weight in (REGULAR_WEIGHT, BOLD_WEIGHT):
+            try:
+                paths.add(index.find(families, weight).path)
+            except FontNotFoundError:
+                pass
+    return sorted(paths)
+
+
+class Manifest:
+    """ジョブの指紋と出力ファイルの記録（出力先に保存する）
+
+    ファイルのハッシュもサイズと更新時刻をキーに記録し、変わっていないファイルは読み直さない。
+    ただしハッシュの計算時に更新されたばかりだったファイルは、その後の書き換えを見逃さないよう毎回読み直す。
+    """
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_NAME)
+        self.jobs = {}
+        self.digests = {}
+
+    def load(self):
+        """保存済みのマニフェストを読み込む。使えない場合は False"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != MANIFEST_VERSION:
+            return False
+        self.jobs = data['jobs']
+        self.digests = data['digests']
+        return True
+
+    def save(self):
+        data = {
+            'version': MANIFEST_VERSION,
+            'jobs': self.jobs,
+            'digests': self.digests,
+        }
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def digest(self, path):
+        """ファイルの中身の SHA-256（ファイルがなければ None）"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        signature = [stat.st_size, stat.st_mtime_ns]
+        cached = self.digests.get(path)
+        if cached and cached[:2] == signature and stat.st_mtime_ns + RACY_WINDOW_NS < cached[3]:
+            return cached[2]
+        hashed = time.time_ns()
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                sha.update(chunk)
+        self.digests[path] = signature + [sha.hexdigest(), hashed]
+        return sha.hexdigest()
+
+    def is_fresh(self, name, fingerprint):
+        """前回の指紋と同じで、出力ファイルがすべて残っているか"""
+        entry = self.jobs.get(name)
+        return (entry is not None and entry['fingerprint'] == fingerprint
+                and all(os.path.exists(os.path.join(self.output_dir, path)) for path in entry['files']))
+
+    def files(self, name):
+        return self.jobs[name]['files']
+
+    def writers(self, path):
+        """前回 path を出力したジョブの名前"""
+        return [name for name, entry in self.jobs.items() if path in entry['files']]
+
+    def forget(self, name):
+        self.jobs.pop(name, None)
+
+    def record(self, name, fingerprint, files):
+        self.jobs[name] = {'fingerprint': fingerprint, 'files': list(files)}
+        self.save()
+
+
+def fingerprint(job, manifest, fonts):
+    """ジョブの入力すべてのハッシュ（fonts はフォントの指紋で、全ジョブ共通）"""
+    module = job.target.partition(':')[0]
+    parts = [job.target, repr(job.args), fonts]
+    parts.extend([os.path.relpath(path, PROJECT_ROOT), manifest.digest(path)] for path in source_files(module))
+    for item in job.inputs:
+        kind = item[0]
+        if kind == 'file':
+            data = manifest.digest(item[1])
+        elif kind == 'device':
+            data = get_device(item[1])
+        elif kind == 'theme':
+            data = THEMES.get(item[1])
+        elif kind in ('conversation', 'strings'):
+            data = input_value(item)
+        else:
+            raise BuildError(f"未知の入力です: {kind} ({job.name})")
+        parts.append([*item, data])
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def font_fingerprint(manifest):
+    """解決されたフォントファイルの中身と、索引にあるフォントファイルの一覧のハッシュ
+
+    索引全体を含めるのは、どのフェイスにもない文字を索引全体から探すフォールバックがあるため。
+    """
+    index = get_index()
+    parts = [[path, manifest.digest(path)] for path in font_files()]
+    parts.append(sorted([path, entry['size'], entry['mtime']] for path, entry in index.files.items()))
+    return hashlib.sha256(json.dumps(parts).encode('utf-8')).hexdigest()
+
+
+def _files(root):
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            yield os.path.relpath(os.path.join(dirpath, filename), root)
+
+
+def _ignore_interrupt():
+    """ワーカーは Ctrl+C を無視する（中断は親プロセスがまとめて扱う）"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def run_job(job, output_dir):
+    """ワーカーでジョブを作業ディレクトリの中で実行し、JobResult を返す（例外は error に入れる）"""
+    staging = tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=output_dir)
+    log = io.StringIO()
+    cwd = os.getcwd()
+    start = time.perf_counter()
+    error = None
+    try:
+        os.chdir(staging)
+        with redirect_stdout(log):
+            resolve(job.target)(*job.args)
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        os.chdir(cwd)
+    seconds = time.perf_counter() - start
+    return JobResult(job.name, seconds, staging, sorted(_files(staging)), error, log.getvalue())
+
+
+class Build:
+    """ジョブをプロセスプールで実行し、出力を出力先に反映する
+
+    force が偽なら、マニフェストの指紋と一致するジョブは実行せず前回の出力を使う。
+    """
+
+    def __init__(self, jobs, output_dir='.', workers=None, force=False):
+        self.jobs = list(jobs)
+        self.output_dir = os.path.abspath(output_dir)
+        self.workers = workers or os.cpu_count() or 1
+        self.force = force
+        self.manifest = Manifest(self.output_dir)
+        self.order = {}
+        self.results = {}
+        self.skipped = []
+        self.owners = {}
+        self.overwritten = []
+        self.seconds = 0.0
+
+    def run(self, verbose=False):
+        """変更のあったジョブを実行し、ジョブ名 → JobResult の辞書を返す"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._clean_staging()
+        self.manifest.load()
+        start = time.perf_counter()
+        self.order = order = {job.name: i for i, job in enumerate(self.jobs)}
+        fonts = font_fingerprint(self.manifest)
+        pending = {}
+        for job in self.jobs:
+            pending[job.name] = fingerprint(job, self.manifest, fonts)
+            if not self.force and self.manifest.is_fresh(job.name, pending[job.name]):
+                # 前回の出力を、実行するジョブの出力と同じ順位で扱う（後のジョブの出力は上書きしない）
+                del pending[job.name]
+                self.skipped.append(job.name)
+                for path in self.manifest.files(job.name):
+                    self.owners[path] = order[job.name]
+        self.manifest.save()
+        if self.skipped:
+            print(f"⏭️ 変更なし: {len(self.skipped)} jobs（前回の出力を使用）")
+
+        jobs = [job for job in self.jobs if job.name in pending]
+        if jobs:
+            pool = ProcessPoolExecutor(max_workers=min(self.workers, len(jobs)), initializer=_ignore_interrupt)
+            try:
+                futures = {pool.submit(run_job, job, self.output_dir): job for job in jobs}
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception:
+                        # ワーカーのプロセスごと失敗した場合
+                        result = JobResult(job.name, 0.0, None, [], traceback.format_exc(), '')
+                    self.results[job.name] = result
+                    self._install(result, order[job.name])
+                    if result.error is None:
+                        self.manifest.record(job.name, pending[job.name], result.files)
+                    status = '❌' if result.error else '✅'
+                    print(f"{status} {job.name} ({result.seconds:.2f}s, {len(result.files)} files)")
+                    if verbose and result.log:
+                        print(result.log.rstrip())
+            finally:
+                # 中断された場合も、まだ始まっていないジョブは実行しない（次回のビルドで再開する）
+                pool.shutdown(cancel_futures=True)
+        self.seconds = time.perf_counter() - start
+        return self.results
+
+    def _clean_staging(self):
+        """中断したビルドが残した作業ディレクトリを消す"""
+        for entry in os.scandir(self.output_dir):
+            if entry.is_dir() and entry.name.startswith(STAGING_PREFIX):
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    def _install(self, result, rank):
+        """成功したジョブの出力を出力先に移す（先に終わった後のジョブの出力は上書きしない）"""
+        try:
+            if result.error is not None:
+                return
+            for path in result.files:
+                owner = self.owners.get(path)
+                if owner is not None:
+                    self.overwritten.append((path, owner, rank))
+                    if owner > rank:
+                        continue
+                destination = os.path.join(self.output_dir, path)
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                os.replace(os.path.join(result.staging, path), destination)
+                self.owners[path] = rank
+                # 上書きされた後のジョブ（このビルドにないジョブを含む）の出力は次回作り直す
+                for name in self.manifest.writers(path):
+                    if name != result.name and self.order.get(name, rank + 1) > rank:
+                        self.manifest.forget(name)
+        finally:
+            if result.staging:
+                shutil.rmtree(result.staging, ignore_errors=True)
+
+    def failures(self):
+        return [result for result in self.results.values() if result.error]
+
+    def report(self):
+        """ジョブごとの所要時間と失敗のサマリー"""
+        results = sorted(self.results.values(), key=lambda r: -r.seconds)
+        total = sum(r.seconds for r in results)
+        files = len(self.owners)
+        lines = [f"\n🏗️ ビルド: {len(results)} jobs / {files} files → {self.output_dir}",
+                 f"   {self.seconds:.2f}s（ジョブ合計 {total:.2f}s, {self.workers} workers, "
+                 f"{total / self.seconds if self.seconds else 0:.1f}x）"]
+        if self.skipped:
+            lines.append(f"   ⏭️ 変更なし {len(self.skipped)} jobs（前回の出力を使用）")
+        for result in results[:10]:
+            lines.append(f"   {result.seconds:7.2f}s  {'❌' if result.error else '  '} {result.name}")
+        if len(results) > 10:
+            lines.append(f"   … 他 {len(results) - 10} jobs")
+        overlaps = Counter(tuple(sorted((earlier, later))) for _, earlier, later in self.overwritten)
+        for (first, second), count in sorted(overlaps.items()):
+            lines.append(f"   ⚠️ {self.jobs[first].name} の {count} files を {self.jobs[second].name} の出力で上書き")
+        for result in self.failures():
+            lines.append(f"   ❌ {result.name}: {result.error.strip().splitlines()[-1]}")
+        return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="すべてのアセット生成ジョブを並列に実行する")
+    parser.add_argument('-o', '--output', default='.', help="出力先ディレクトリ（既定: カレントディレクトリ）")
+    parser.add_argument('-j', '--jobs', type=int, help="ワーカー数（既定: CPU コア数）")
+    parser.add_argument('--only', action='append', metavar='PATTERN', help="実行するジョブ名のパターン（複数指定可）")
+    parser.add_argument('--devices', help="シーンを端末ごとにも描く（端末名のカンマ区切り、all / app_store）")
+    parser.add_argument('--force', action='store_true', help="前回の出力を使わず、すべてのジョブを実行し直す")
+    parser.add_argument('--list', action='store_true', help="ジョブの一覧を表示して終了")
+    parser.add_argument('-v', '--verbose', action='store_true', help="ジョブの出力も表示する")
+    args = parser.parse_args(argv)
+
+    jobs = select_jobs(discover_jobs(device_names(args.devices) if args.devices else ()), args.only)
+    if args.list:
+        for job in jobs:
+            print(job.name)
+        return 0
+    if not jobs:
+        raise BuildError(f"一致するジョブがありません: {', '.join(args.only)}")
+
+    build = Build(jobs, args.output, args.jobs, args.force)
+    build.run(args.verbose)
+    print(build.report())
+    for result in build.failures():
+        print(f"\n--- {result.name} ---\n{result.error}", file=sys.stderr)
+    return 1 if build.failures() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+画面の枠（クローム）のレイヤーキャッシュ
+
+ステータスバー・ナビゲーションバー・入力欄・端末の外枠は、どの画面でもほとんど同じ見た目になる。
+バリエーション（テーマ × 端末サイズ × タイトル以外のボタン構成）ごとに1回だけ透明なレイヤーに描き、
+以降の画面ではそのレイヤーを合成するだけにする。画面ごとに描くのはタイトルなどの可変のテキストだけになる。
+
+レイヤーは透明な RGBA 画像に描く（透明な下地に描いたアンチエイリアスの縁は色がそのままでアルファだけが下がる）。
+透明な部分は切り詰め、(レイヤー, 左上の座標) として保存する。
+長く動かし続ける監視プロセスでもメモリが増え続けないよう、レイヤーの合計サイズに上限を設けて古いものから捨てる。
+"""
+
+from collections import OrderedDict
+
+from PIL import Image
+
+from .displaylist import DisplayList
+
+# キャッシュするレイヤーの合計サイズの上限（バイト）
+DEFAULT_BUDGET = 32 * 1024 * 1024
+
+
+def _size(entry):
+    layer, _ = entry
+    return layer.width * layer.height * 4 if layer is not None else 0
+
+
+class ChromeLayers:
+    """キーごとに1回だけ描いた RGBA レイヤー（メモリ上限付きの LRU）"""
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        self.budget = budget
+        self.nbytes = 0
+        self.evictions = 0
+        self._layers = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, size, paint):
+        """key のレイヤーと左上の座標を返す（なければ paint(draw) で描いて保存）
+
+        draw は size の大きさの DisplayList。何も描かれなかった場合は (None, None) を返す。
+        """
+        entry = self._layers.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._layers.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        draw = DisplayList(size)
+        paint(draw)
+        layer = draw.optimize().replay(Image.new('RGBA', size, (0, 0, 0, 0)))
+        box = layer.getbbox()
+        entry = (layer.crop(box), box[:2]) if box else (None, None)
+        size = _size(entry)
+        if size <= self.budget:
+            self._layers[key] = entry
+            self.nbytes += size
+            self._evict()
+        return entry
+
+    def _evict(self):
+        while self.nbytes > self.budget:
+            _, entry = self._layers.popitem(last=False)
+            self.nbytes -= _size(entry)
+            self.evictions += 1
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'layers': len(self._layers),
+            'bytes': self.nbytes,
+            'evictions': self.evictions,
+        }
+
+    def report(self):
+        """ヒット率の1行サマリー"""
+        stats = self.stats()
+        return (f"🪟 クロームレイヤー: {stats['hits']} hits / {stats['misses']} misses "
+                f"({stats['hit_rate']:.0%}), {stats['layers']} layers, {stats['bytes'] / 1024:.0f} KiB")
+
+    def clear(self):
+        self._layers.clear()
+        self.nbytes = 0
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+
+
+chrome_layers = ChromeLayers()
@@ -0,0 +1,141 @@
+"""
+半透明レイヤーの合成
+
+作業バッファは premultiplied RGBA (Pillow の 'RGBa' モード) で保持し、
+各レイヤーは自分のバウンディングボックスの範囲だけを numpy でブレンドする。
+不透明なテキストや図形は TextDraw でバッファに直接描き、RGB への変換は保存時に1回だけ行う。
+"""
+
+import numpy as np
+from PIL import Image
+
+from .gradients import parse_color
+from .shapes import rounded_rect_mask
+from .textcache import TextDraw
+
+
+def _over(src, dst):
+    return src + dst * (1.0 - src[..., 3:4])
+
+
+def _multiply(src, dst):
+    out = _over(src, dst)
+    sa, da = src[..., 3:4], dst[..., 3:4]
+    out[..., :3] = src[..., :3] * (1.0 - da) + dst[..., :3] * (1.0 - sa) + src[..., :3] * dst[..., :3]
+    return out
+
+
+def _screen(src, dst):
+    out = src + dst
+    out -= src * dst
+    return out
+
+
+# ブレンドモード（入力・出力はいずれも 0..1 の premultiplied RGBA）
+BLEND_MODES = {
+    'over': _over,
+    'multiply': _multiply,
+    'screen': _screen,
+}
+
+
+def premultiply(image):
+    """RGBA 画像を 0..1 の premultiplied float 配列に変換"""
+    rgba = np.asarray(image.convert('RGBA'), dtype=np.float32) / 255.0
+    rgba[..., :3] *= rgba[..., 3:4]
+    return rgba
+
+
+class Compositor:
+    """premultiplied RGBA の作業バッファにレイヤーを重ねる"""
+
+    def __init__(self, size, background=(0, 0, 0, 0)):
+        color = parse_color(background)
+        if len(color) == 3:
+            color += (255,)
+        self.image = Image.new('RGBA', size, color).convert('RGBa')
+
+    @classmethod
+    def from_image(cls, image):
+        """既存の画像（グラデーション背景など）を作業バッファにする"""
+        compositor = cls.__new__(cls)
+        compositor.image = image.convert('RGBA').convert('RGBa')
+        return compositor
+
+    @property
+    def size(self):
+        return self.image.size
+
+    def draw(self):
+        """バッファに直接描く TextDraw（不透明な塗り・テキスト用）"""
+        return TextDraw(self.image)
+
+    def _clip(self, box):
+        x1, y1, x2, y2 = box
+        width, height = self.image.size
+        return max(x1, 0), max(y1, 0), min(x2, width), min(y2, height)
+
+    def _blend(self, box, src, mode):
+        """box の範囲だけバッファを取り出し、src を mode で重ねて書き戻す"""
+        dst = np.asarray(self.image.crop(box), dtype=np.float32) / 255.0
+        out = BLEND_MODES[mode](src, dst)
+        data = np.clip(out * 255.0 + 0.5, 0, 255).astype(np.uint8)
+        region = Image.frombuffer('RGBa', (box[2] - box[0], box[3] - box[1]), data.tobytes(), 'raw', 'RGBa', 0, 1)
+        self.image.paste(region, box[:2])
+
+    def _solid(self, box, color, opacity):
+        color = parse_color(color)
+        alpha = (color[3] if len(color) == 4 else 255) / 255.0 * opacity
+        src = np.empty((box[3] - box[1], box[2] - box[0], 4), dtype=np.float32)
+        src[..., :3] = np.array(color[:3], dtype=np.float32) / 255.0 * alpha
+        src[..., 3] = alpha
+        return src
+
+    def fill(self, box, color, mode='over', radius=0, opacity=1.0):
+        """box (右下は含まない) を単色で塗る。radius > 0 なら角丸"""
+        x1, y1, x2, y2 = (int(round(v)) for v in box)
+        if radius:
+            mask = rounded_rect_mask(x2 - x1, y2 - y1, min(radius, (x2 - x1) // 2, (y2 - y1) // 2))
+            self.paint(mask, (x1, y1), color, mode, opacity)
+            return
+
+        clipped = self._clip((x1, y1, x2, y2))
+        if clipped[0] >= clipped[2] or clipped[1] >= clipped[3]:
+            return
+        self._blend(clipped, self._solid(clipped, color, opacity), mode)
+
+    def paint(self, mask, position, color, mode='over', opacity=1.0):
+        """L モードの mask の形に単色を塗る（影・グローなど）"""
+        x, y = position
+        clipped = self._clip((x, y, x + mask.width, y + mask.height))
+        if clipped[0] >= clipped[2] or clipped[1] >= clipped[3]:
+            return
+
+        crop = (clipped[0] - x, clipped[1] - y, clipped[2] - x, clipped[3] - y)
+        src = self._solid(clipped, color, opacity)
+        src *= np.asarray(mask.crop(crop), dtype=np.float32)[..., None] / 255.0
+        self._blend(clipped, src, mode)
+
+    def composite(self, layer, position=(0, 0), mode='over', opacity=1.0):
+        """RGBA 画像 layer を position に重ねる"""
+        x, y = position
+        clipped = self._clip((x, y, x + layer.width, y + layer.height))
+        if clipped[0] >= clipped[2] or clipped[1] >= clipped[3]:
+            return
+
+        crop = (clipped[0] - x, clipped[1] - y, clipped[2] - x, clipped[3] - y)
+        src = premultiply(layer.crop(crop))
+        if opacity != 1.0:
+            src *= opacity
+        self._blend(clipped, src, mode)
+
+    def flatten(self, background=(0, 0, 0)):
+        """背景色の上に合成した RGB 画像を返す"""
+        buffer = np.asarray(self.image, dtype=np.float32)
+        bg = np.array(parse_color(background)[:3], dtype=np.float32)
+        rgb = buffer[..., :3] + bg * (1.0 - buffer[..., 3:4] / 255.0)
+        return Image.fromarray(np.clip(rgb + 0.5, 0, 255).astype(np.uint8))
+
+    def save(self, path, *args, **kwargs):
+        """RGB に変換して保存"""
+        self.flatten().save(path, *args, **kwargs)
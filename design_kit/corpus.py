@@ -0,0 +1,238 @@
+"""
+会話コーパス
+
+スクリーンショットに載せるサンプル会話を JSONL（1行1会話）で管理する。
+
+    {"id": "cooking_oyakodon", "tags": {"scenario": "cooking", "locale": "ja"},
+     "messages": [{"sender": "user", "text": "..."}, {"sender": "assistant", "text": "..."}]}
+
+各行のバイトオフセットとタグの転置リストを索引としてキャッシュディレクトリに保存するため、
+ID を指定した取得やタグでの抽出ではファイル全体をパースせず、該当する行だけをシークして読む。
+索引はコーパスのサイズか更新時刻が変わると作り直す（索引を作った時刻の直前・直後に更新されたコーパスは、
+同じサイズのまま更新時刻の刻みの中で書き換えられたかもしれないため、次の読み込みでも作り直す）。
+読んだ行が索引の ID の会話でなければ、索引が古いとみなして作り直してから読み直す。
+tags に length がない会話には、文字数から short / medium / long を付ける。
+"""
+
+import json
+import os
+import random
+import time
+from collections import Counter, namedtuple
+
+from .paths import PROJECT_ROOT, cache_path
+
+CORPUS_PATH = os.path.join(PROJECT_ROOT, "screenshots", "conversations.jsonl")
+
+INDEX_VERSION = 2
+
+# 索引を作った時刻からこの時間以内に更新されたコーパスの索引は使わない
+RACY_WINDOW_NS = 2 * 10**9
+
+# length タグの境目（全メッセージの文字数）
+LENGTHS = ((120, 'short'), (400, 'medium'))
+
+Message = namedtuple('Message', 'sender text')
+Conversation = namedtuple('Conversation', 'id tags messages')
+
+
+class CorpusError(ValueError):
+    """コーパスの行を解釈できない"""
+
+
+class ConversationNotFoundError(LookupError):
+    """指定した ID の会話がコーパスにない"""
+
+
+def length_tag(messages):
+    """メッセージの文字数から length タグの値を決める"""
+    total = sum(len(message.text) for message in messages)
+    for limit, name in LENGTHS:
+        if total < limit:
+            return name
+    return 'long'
+
+
+def parse_conversation(line, where=''):
+    """JSONL の1行を Conversation にする"""
+    try:
+        data = json.loads(line)
+        messages = tuple(Message(m['sender'], m['text']) for m in data['messages'])
+        tags = dict(data.get('tags', {}))
+        conversation_id = data['id']
+    except (ValueError, KeyError, TypeError) as exc:
+        raise CorpusError(f"会話を読み込めません: {where} ({exc})") from exc
+    tags.setdefault('length', length_tag(messages))
+    return Conversation(conversation_id, tags, messages)
+
+
+class Corpus:
+    """オフセット索引付きの会話コーパス"""
+
+    def __init__(self, path=CORPUS_PATH, index_path=None):
+        self.path = path
+        self.index_path = index_path or cache_path("corpus", os.path.basename(path) + ".index.json")
+        self.ids = []
+        self.offsets = []
+        self.postings = {}
+        self.positions = {}
+        self.rebuilt = False
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, conversation_id):
+        return conversation_id in self.positions
+
+    # --- 索引 ---
+
+    def _signature(self):
+        stat = os.stat(self.path)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def load(self):
+        """保存済みの索引を読み込む。使えない・古い場合は False"""
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != INDEX_VERSION:
+            return False
+        path, size, mtime, indexed = data['source']
+        if [path, size, mtime] != [self.path, *self._signature()] or mtime + RACY_WINDOW_NS >= indexed:
+            return False
+        self._set(data['ids'], data['offsets'], data['tags'])
+        return True
+
+    def build(self):
+        """コーパスを1回だけ読み、各行のオフセットとタグの転置リストを作って保存する"""
+        ids, offsets, postings = [], [], {}
+        indexed = time.time_ns()
+        signature = self._signature()
+        with open(self.path, 'rb') as f:
+            offset = 0
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    conversation = parse_conversation(line, f"{self.path}:{number}")
+                    for key, value in conversation.tags.items():
+                        postings.setdefault(key, {}).setdefault(str(value), []).append(len(ids))
+                    ids.append(conversation.id)
+                    offsets.append(offset)
+                offset += len(line)
+        duplicates = sorted(i for i, count in Counter(ids).items() if count > 1)
+        if duplicates:
+            raise CorpusError(f"会話の ID が重複しています: {', '.join(duplicates)}")
+
+        data = {
+            'version': INDEX_VERSION,
+            'source': [self.path, *signature, indexed],
+            'ids': ids,
+            'offsets': offsets,
+            'tags': postings,
+        }
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.index_path)
+        self._set(ids, offsets, postings)
+        self.rebuilt = True
+
+    def _set(self, ids, offsets, postings):
+        self.ids, self.offsets, self.postings = ids, offsets, postings
+        self.positions = {conversation_id: i for i, conversation_id in enumerate(ids)}
+
+    def load_or_build(self):
+        if not self.load():
+            self.build()
+        return self
+
+    # --- 検索 ---
+
+    def get(self, conversation_id):
+        """ID の会話を、その行だけを読んで返す（保存済みの索引で読めなければ索引を作り直して読み直す）"""
+        if conversation_id not in self.positions and not self.rebuilt:
+            self.build()
+        position = self.positions.get(conversation_id)
+        if position is None:
+            raise ConversationNotFoundError(f"会話が見つかりません: {conversation_id} ({self.path})")
+        conversation = self._read(position)
+        if conversation is None and not self.rebuilt:
+            self.build()
+            return self.get(conversation_id)
+        if conversation is None:
+            raise CorpusError(f"会話の行が索引と一致しません: {conversation_id} ({self.path})")
+        return conversation
+
+    def _read(self, position):
+        """索引の位置の行の会話（行の途中や別の会話なら None）"""
+        offset = self.offsets[position]
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            line = f.readline()
+        try:
+            conversation = parse_conversation(line, f"{self.path}@{offset}")
+        except CorpusError:
+            return None
+        return conversation if conversation.id == self.ids[position] else None
+
+    def select(self, **tags):
+        """すべてのタグが一致する会話の ID をコーパスの順に返す（値はリストで複数指定できる）"""
+        positions = None
+        for key, values in tags.items():
+            values = values if isinstance(values, (list, tuple, set)) else [values]
+            matched = set()
+            for value in values:
+                matched.update(self.postings.get(key, {}).get(str(value), []))
+            positions = matched if positions is None else positions & matched
+        if positions is None:
+            return list(self.ids)
+        return [self.ids[p] for p in sorted(positions)]
+
+    def sample(self, count=None, seed=None, **tags):
+        """タグが一致する会話の ID から count 件を（seed を指定すると再現可能に）無作為に選ぶ"""
+        ids = self.select(**tags)
+        if count is not None and count < len(ids):
+            ids = random.Random(seed).sample(ids, count)
+        return ids
+
+    def tags(self):
+        """タグごとの値と件数 {タグ: {値: 件数}}"""
+        return {key: {value: len(positions) for value, positions in values.items()}
+                for key, values in self.postings.items()}
+
+
+_corpus = None
+
+
+def get_corpus():
+    """プロセス共有のコーパス（初回呼び出し時に索引を読み込み・必要なら構築）"""
+    global _corpus
+    if _corpus is None:
+        _corpus = Corpus().load_or_build()
+    return _corpus
+
+
+def clear():
+    """共有のコーパスを捨てる（次の get_corpus() で索引を読み直す）"""
+    global _corpus
+    _corpus = None
+
+
+def parse_tags(text):
+    """'scenario=cooking,locale=ja|en' をタグの辞書にする（| で複数の値）"""
+    tags = {}
+    for pair in filter(None, (text or '').split(',')):
+        key, _, value = pair.partition('=')
+        if not value:
+            raise ValueError(f"タグは key=value で指定してください: {pair}")
+        tags[key.strip()] = value.strip().split('|')
+    return tags
+
+
+if __name__ == "__main__":
+    corpus = Corpus()
+    corpus.build()
+    print(f"💬 会話コーパスの索引を更新しました: {len(corpus)} conversations → {corpus.index_path}")
+    for key, values in sorted(corpus.tags().items()):
+        print(f"   {key}: " + ", ".join(f"{value} ({count})" for value, count in sorted(values.items())))
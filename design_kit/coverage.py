@@ -0,0 +1,138 @@
+"""
+フェイスごとのコードポイント被覆ビットセット
+
+フォント索引に記録した cmap の範囲から、フェイスごとに「1コードポイント = 1ビット」の
+ビットセットを作り、索引の隣 (font_coverage.npz) に保存する。
+ビットセットはそのフェイスが持つ最大のコードポイントまでで打ち切るため、
+ラテン文字だけのフェイスなら数 KB に収まる。
+文字列をコードポイント配列にすれば、どのフェイスがどの文字を持つかを numpy でまとめて引ける。
+"""
+
+import os
+import zipfile
+
+import numpy as np
+
+from .font_index import get_index
+from .paths import cache_path
+
+COVERAGE_VERSION = 1
+
+
+def codepoints(text):
+    """文字列をコードポイントの int64 配列に変換"""
+    return np.frombuffer(text.encode('utf-32-le'), dtype='<u4').astype(np.int64)
+
+
+def _bitset(ranges):
+    """cmap の範囲リストからビットセット (uint8 配列) を作る"""
+    if not ranges:
+        return np.zeros(0, dtype=np.uint8)
+    bits = np.zeros(ranges[-1][1] + 1, dtype=bool)
+    for start, end in ranges:
+        bits[start:end + 1] = True
+    return np.packbits(bits, bitorder='little')
+
+
+class CoverageStore:
+    """索引内の全フェイスの被覆ビットセット（フェイスのファイルが変わったものだけ作り直す）"""
+
+    def __init__(self, index, path=None):
+        self.index = index
+        self.path = path or cache_path("font_coverage.npz")
+        self.rebuilt = 0
+        self._bits = {}
+
+    def _stamp(self, path):
+        entry = self.index.files[path]
+        return f"{entry['mtime']}:{entry['size']}"
+
+    def load(self):
+        """保存済みのビットセットを読み込む（ファイルが更新されたフェイスは読まない）"""
+        try:
+            with np.load(self.path) as data:
+                if int(data['version']) != COVERAGE_VERSION:
+                    return
+                for i, (key, stamp) in enumerate(zip(data['keys'], data['stamps'])):
+                    path, _, index = str(key).rpartition('#')
+                    if path in self.index.files and self._stamp(path) == stamp:
+                        self._bits[(path, int(index))] = data[f'face{i}']
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            self._bits = {}
+
+    def save(self):
+        keys = list(self._bits)
+        arrays = {f'face{i}': self._bits[key] for i, key in enumerate(keys)}
+        tmp_path = self.path + '.tmp.npz'
+        np.savez_compressed(
+            tmp_path,
+            version=COVERAGE_VERSION,
+            keys=np.array([f'{path}#{index}' for path, index in keys]),
+            stamps=np.array([self._stamp(path) for path, _ in keys]),
+            **arrays,
+        )
+        os.replace(tmp_path, self.path)
+
+    def load_or_build(self):
+        """保存済みのビットセットを読み込み、足りないフェイスの分だけ作って保存する"""
+        self.load()
+        faces = {}
+        for record, face in self.index.faces():
+            key = (record.path, record.index)
+            bits = self._bits.get(key)
+            if bits is None:
+                bits = _bitset(face['coverage'])
+                self.rebuilt += 1
+            faces[key] = bits
+        stale = len(faces) != len(self._bits)
+        self._bits = faces
+        if self.rebuilt or stale:
+            self.save()
+        return self
+
+    def bits(self, face):
+        """(パス, フェイス番号) のビットセット。索引にないフェイスは None"""
+        return self._bits.get(tuple(face))
+
+    def covers(self, face, codes):
+        """codes (コードポイント配列) の各要素をフェイスが持つかの bool 配列"""
+        bits = self._bits.get(tuple(face))
+        if bits is None:
+            return np.zeros(len(codes), dtype=bool)
+        byte = codes >> 3
+        inside = byte < len(bits)
+        values = bits[np.where(inside, byte, 0)] if len(bits) else np.zeros(len(codes), dtype=np.uint8)
+        return inside & ((values >> (codes & 7)) & 1).astype(bool)
+
+    def has(self, face, code):
+        """フェイスがコードポイント code を持つか"""
+        bits = self._bits.get(tuple(face))
+        return bits is not None and (code >> 3) < len(bits) and bool((bits[code >> 3] >> (code & 7)) & 1)
+
+
+_store = None
+
+
+def get_coverage():
+    """プロセス共有のビットセット（初回呼び出し時に読み込み・必要なら作成）"""
+    global _store
+    if _store is None:
+        _store = CoverageStore(get_index()).load_or_build()
+    return _store
+
+
+_covering_faces = {}
+
+
+def covering_face(code, prefer=None, weight=400, italic=False):
+    """code を持つフェイスの FaceRecord（prefer のフェイス、次に weight・italic が近いものを優先）
+
+    どのフェイスにもなければ None。
+    """
+    key = (code, prefer, weight, italic)
+    if key not in _covering_faces:
+        store = get_coverage()
+        candidates = [record for record, _ in store.index.faces() if store.has((record.path, record.index), code)]
+        candidates.sort(key=lambda r: ((r.path, r.index) != prefer, r.italic != italic, abs(r.weight - weight)))
+        _covering_faces[key] = candidates[0] if candidates else None
+    return _covering_faces[key]
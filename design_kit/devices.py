@@ -0,0 +1,113 @@
+"""
+端末プロファイル
+
+画面はポイント単位で記述し、端末ごとの倍率で実際のピクセル密度に描く（ラスタを拡大しない）。
+プロファイルは論理サイズ・倍率・安全領域・画面の角の半径を持ち、
+iPad のように横に広い端末では本文を読みやすい幅 (content_width) の列に収める。
+
+PointDraw はポイント単位の座標とフォントを倍率でピクセルに変換して、
+DisplayList など ImageDraw 互換の描画先に渡す。paste() と call() はピクセル単位のまま渡す。
+"""
+
+from collections import namedtuple
+
+from .fonts import scaled_font
+
+
+class DeviceError(ValueError):
+    """未知の端末プロファイル"""
+
+
+class Device(namedtuple('Device', 'name label size scale safe_top safe_bottom corner_radius content_width')):
+    """端末プロファイル（size はポイント単位の論理サイズ、content_width は本文の列幅で None なら全幅）"""
+
+    __slots__ = ()
+
+    @property
+    def pixels(self):
+        """ピクセル単位の画面サイズ"""
+        return (self.size[0] * self.scale, self.size[1] * self.scale)
+
+
+DEVICES = {device.name: device for device in [
+    Device('iphone_14_pro', 'iPhone 14 Pro (6.1")', (393, 852), 3, 59, 34, 55, None),
+    Device('iphone_6_9', 'iPhone 16 Pro Max (6.9")', (440, 956), 3, 62, 34, 62, None),
+    Device('iphone_6_7', 'iPhone 15 Pro Max (6.7")', (430, 932), 3, 59, 34, 55, None),
+    Device('iphone_6_5', 'iPhone 11 Pro Max (6.5")', (414, 896), 3, 44, 34, 39, None),
+    Device('iphone_5_5', 'iPhone 8 Plus (5.5")', (414, 736), 3, 20, 0, 0, None),
+    Device('ipad_13', 'iPad Pro 13" (M4)', (1032, 1376), 2, 24, 20, 18, 700),
+    Device('ipad_12_9', 'iPad Pro 12.9" (第6世代)', (1024, 1366), 2, 24, 20, 18, 700),
+]}
+
+# デモ画面の既定の端末
+DEFAULT_DEVICE = 'iphone_14_pro'
+
+# App Store Connect に提出するスクリーンショットのサイズ
+APP_STORE_DEVICES = ('iphone_6_9', 'iphone_6_7', 'iphone_6_5', 'iphone_5_5', 'ipad_13', 'ipad_12_9')
+
+
+def get_device(name):
+    """名前から端末プロファイルを返す（Device を渡した場合はそのまま）"""
+    if isinstance(name, Device):
+        return name
+    try:
+        return DEVICES[name]
+    except KeyError:
+        raise DeviceError(f"未知の端末です: {name} (候補: {', '.join(DEVICES)})") from None
+
+
+def device_names(names):
+    """'all' / 'app_store' / カンマ区切りの名前を端末名のリストにする"""
+    result = []
+    for name in names.split(','):
+        if name == 'all':
+            result.extend(DEVICES)
+        elif name == 'app_store':
+            result.extend(APP_STORE_DEVICES)
+        else:
+            result.append(get_device(name).name)
+    return list(dict.fromkeys(result))
+
+
+class PointDraw:
+    """ポイント単位の描画を scale 倍して draw に記録する（origin はポイント単位の平行移動）"""
+
+    def __init__(self, draw, scale=1, origin=(0, 0)):
+        self.target = draw
+        self.scale = scale
+        self.origin = origin
+
+    def __getattr__(self, name):
+        # paste / call / optimize / replay などはそのまま描画先に渡す
+        return getattr(self.target, name)
+
+    def px(self, value):
+        """長さをピクセルに変換"""
+        return value * self.scale
+
+    def point(self, x, y):
+        """座標をピクセルに変換"""
+        return ((x + self.origin[0]) * self.scale, (y + self.origin[1]) * self.scale)
+
+    def _xy(self, xy):
+        if isinstance(xy[0], (tuple, list)):
+            return [self.point(*p) for p in xy]
+        if len(xy) == 4:
+            return self.point(*xy[:2]) + self.point(*xy[2:])
+        return self.point(*xy)
+
+    def _width(self, width):
+        return max(1, round(width * self.scale)) if width else width
+
+    def text(self, xy, text, fill=None, font=None, anchor=None):
+        self.target.text(self._xy(xy), text, fill=fill, font=scaled_font(font, self.scale), anchor=anchor)
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self.target.rectangle(self._xy(xy), fill=fill, outline=outline, width=self._width(width))
+
+    def rounded_rectangle(self, xy, radius=0, fill=None, outline=None, width=1):
+        self.target.rounded_rectangle(self._xy(xy), radius * self.scale, fill=fill, outline=outline,
+                                      width=self._width(width))
+
+    def circle(self, xy, radius, fill=None, outline=None, width=1):
+        self.target.circle(self._xy(xy), radius * self.scale, fill=fill, outline=outline, width=self._width(width))
@@ -0,0 +1,319 @@
+"""
+描画命令のディスプレイリスト
+
+生成スクリプトは Pillow に直接描かず、ImageDraw と同じ呼び出しで DisplayList に命令を記録する。
+optimize() はラスタライズの前に次の変換を行い、replay() で最適化後の命令だけを画像に描く。
+
+- 画面外の命令と範囲が空の命令を捨てる（塗りも枠線もない図形も ImageDraw は既定の色で枠線を描くため残す）
+- 辺が接する同じ不透明色の矩形を1つにまとめる
+- 後から描く不透明な矩形・角丸矩形・画像に完全に隠れる命令を捨てる
+- 重ならない連続したテキストをフォントと色ごとに並べ替え、状態の切り替えを減らす
+
+結合と隠れの判定では、命令を画面の粗いタイル (TILE_SIZE) ごとに分けて持ち、
+同じタイルにある命令とだけ比べる（すべての命令どうしを比べると命令数の2乗の時間がかかる）。
+合成や影の命令（call）は画素ごとに下の色と混ぜるだけなので、後から不透明に塗られる画素の描画は省いてよい。
+"""
+
+import math
+from collections import Counter, namedtuple
+
+from .gradients import parse_color
+from .metrics import baseline, text_width
+from .textcache import TextDraw
+
+# kind: 命令の種類、bounds: 影響する範囲 (右下を含まない、不明なら None)、
+# opaque: 下の画素によらず塗りつぶす矩形のタプル、key: テキストの描画状態、args: 再生時の引数
+Op = namedtuple('Op', 'kind bounds opaque key args')
+
+# 結合・隠れの判定で命令を分けるタイルの大きさ（ピクセル）
+TILE_SIZE = 64
+
+# プロセス全体の集計（report() で表示）
+totals = Counter()
+
+
+def _box(xy):
+    """ImageDraw の矩形指定（右下を含む）を右下を含まない整数の矩形に変換"""
+    if isinstance(xy[0], (tuple, list)):
+        (x1, y1), (x2, y2) = xy
+    else:
+        x1, y1, x2, y2 = xy
+    return int(x1), int(y1), int(-(-x2 // 1)) + 1, int(-(-y2 // 1)) + 1
+
+
+def _opaque_color(color):
+    if color is None:
+        return False
+    try:
+        rgba = parse_color(color)
+    except (ValueError, TypeError):
+        return False
+    return len(rgba) == 3 or rgba[3] == 255
+
+
+def _inner_box(xy):
+    """ImageDraw の矩形指定（右下を含む）で確実に塗られる整数の矩形（右下を含まない）"""
+    if isinstance(xy[0], (tuple, list)):
+        (x1, y1), (x2, y2) = xy
+    else:
+        x1, y1, x2, y2 = xy
+    return math.ceil(x1), math.ceil(y1), math.floor(x2) + 1, math.floor(y2) + 1
+
+
+def _integral(xy):
+    values = [v for point in xy for v in point] if isinstance(xy[0], (tuple, list)) else list(xy)
+    return all(float(v).is_integer() for v in values)
+
+
+def _inside(inner, outer):
+    return outer[0] <= inner[0] and outer[1] <= inner[1] and inner[2] <= outer[2] and inner[3] <= outer[3]
+
+
+def _clip(box, canvas):
+    return max(box[0], canvas[0]), max(box[1], canvas[1]), min(box[2], canvas[2]), min(box[3], canvas[3])
+
+
+def _tiles(box):
+    """box（画面内に切り詰めたもの）が掛かるタイル"""
+    return [(tx, ty)
+            for ty in range(box[1] // TILE_SIZE, (box[3] - 1) // TILE_SIZE + 1)
+            for tx in range(box[0] // TILE_SIZE, (box[2] - 1) // TILE_SIZE + 1)]
+
+
+def _union(a, b):
+    """辺が接する2つの矩形を合わせた矩形（1つの矩形にならなければ None）"""
+    if (a[1], a[3]) == (b[1], b[3]) and (a[2] == b[0] or b[2] == a[0]):
+        return min(a[0], b[0]), a[1], max(a[2], b[2]), a[3]
+    if (a[0], a[2]) == (b[0], b[2]) and (a[3] == b[1] or b[3] == a[1]):
+        return a[0], min(a[1], b[1]), a[2], max(a[3], b[3])
+    return None
+
+
+def _overlaps(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def _empty(box):
+    return box[2] <= box[0] or box[3] <= box[1]
+
+
+def _text_bounds(xy, text, font, anchor):
+    """1行のテキストが描かれうる範囲（フォールバック・絵文字の分だけ余白を取る）"""
+    if not hasattr(font, 'getmetrics') or not isinstance(text, str) or '\n' in text:
+        return None
+    anchor = anchor or 'la'
+    x, y = xy
+    width = text_width(font, text)
+    if anchor[0] == 'm':
+        x -= width / 2
+    elif anchor[0] == 'r':
+        x -= width
+    base = baseline(font, y, anchor)
+    ascent, descent = font.getmetrics()
+    pad = font.size // 4 + 2
+    return (int(x) - pad, int(base - ascent) - pad, int(x + width) + pad + 1, int(base + descent) + pad + 1)
+
+
+class DisplayList:
+    """ImageDraw と同じ呼び出しで描画命令を記録し、最適化してから再生する"""
+
+    def __init__(self, size):
+        self.size = size
+        self.ops = []
+        self.stats = Counter()
+
+    def __len__(self):
+        return len(self.ops)
+
+    def _record(self, kind, bounds, args, opaque=(), key=None):
+        self.ops.append(Op(kind, bounds, tuple(box for box in opaque if not _empty(box)), key, args))
+
+    # --- 記録（ImageDraw 互換） ---
+
+    def text(self, xy, text, fill=None, font=None, anchor=None):
+        self._record('text', _text_bounds(xy, text, font, anchor), (xy, text, fill, font, anchor),
+                     key=(id(font), str(fill)))
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        opaque = [_inner_box(xy)] if _opaque_color(fill) else []
+        self._record('rectangle', _box(xy), (xy, fill, outline, width), opaque)
+
+    def rounded_rectangle(self, xy, radius=0, fill=None, outline=None, width=1):
+        opaque = []
+        if _opaque_color(fill):
+            # 角の丸みを除いた十字形の部分だけが確実に塗りつぶされる
+            x1, y1, x2, y2 = _inner_box(xy)
+            r = math.ceil(radius) + 1
+            opaque = [(x1 + r, y1, x2 - r, y2), (x1, y1 + r, x2, y2 - r)]
+        self._record('rounded_rectangle', _box(xy), (xy, radius, fill, outline, width), opaque)
+
+    def circle(self, xy, radius, fill=None, outline=None, width=1):
+        x, y = xy
+        box = (int(x - radius), int(y - radius), int(x + radius) + 2, int(y + radius) + 2)
+        self._record('circle', box, (xy, radius, fill, outline, width))
+
+    def paste(self, image, position, mask=None):
+        x, y = position
+        box = (x, y, x + image.width, y + image.height)
+        opaque = [box] if mask is None and image.mode in ('RGB', 'L') else []
+        self._record('paste', box, (image, position, mask), opaque)
+
+    def call(self, bounds, function, *args, **kwargs):
+        """その他の描画（影・グロー・半透明の合成など）を記録する
+
+        bounds は影響する範囲（右下を含まない、不明なら None）で、画面外なら捨てる。
+        下の画素を読む処理もあるため、前後の命令と順序を入れ替えない。
+        """
+        self._record('call', bounds, (function, args, kwargs))
+
+    # --- 最適化 ---
+
+    def optimize(self):
+        """命令列を最適化し、集計を self.stats に残す"""
+        stats = self.stats
+        stats['before'] += len(self.ops)
+        stats['state_changes_before'] += self._state_changes()
+        ops = self._cull(self.ops)
+        ops = self._merge_fills(ops)
+        ops = self._drop_occluded(ops)
+        ops = self._sort_text(ops)
+        self.ops = ops
+        stats['after'] += len(ops)
+        stats['state_changes_after'] += self._state_changes()
+        totals.update(stats)
+        return self
+
+    def _cull(self, ops):
+        canvas = (0, 0) + tuple(self.size)
+        kept = []
+        for op in ops:
+            if op.bounds is not None and (_empty(op.bounds) or not _overlaps(op.bounds, canvas)):
+                self.stats['culled'] += 1
+                continue
+            kept.append(op)
+        return kept
+
+    def _merge_fills(self, ops):
+        """辺が接する同じ不透明色の矩形（座標が整数で、枠線のないもの）を1つにまとめる
+
+        後の矩形を前の矩形の位置に移してまとめるため、間にある命令がどれも後の矩形と重ならない場合に限る。
+        """
+        canvas = (0, 0) + tuple(self.size)
+        merged = []
+        fills = []  # merged の各命令の塗りの色（まとめられる矩形でなければ None）
+        tiles = {}
+        barrier = -1  # 範囲が不明な命令の位置（これより前には移さない）
+        for op in ops:
+            fill = self._fill(op)
+            target = None
+            if fill is not None:
+                x1, y1, x2, y2 = op.bounds
+                near = _clip((x1 - 1, y1 - 1, x2 + 1, y2 + 1), canvas)
+                candidates = {i for tile in _tiles(near) for i in tiles.get(tile, ()) if i > barrier}
+                for i in sorted(candidates, reverse=True):
+                    box = _union(merged[i].bounds, op.bounds) if fills[i] == fill else None
+                    if box is not None:
+                        target = i
+                        break
+                    if _overlaps(merged[i].bounds, op.bounds):
+                        break
+            if target is None:
+                merged.append(op)
+                fills.append(fill)
+                if op.bounds is None:
+                    barrier = len(merged) - 1
+                else:
+                    for tile in _tiles(_clip(op.bounds, canvas)):
+                        tiles.setdefault(tile, []).append(len(merged) - 1)
+                continue
+            xy = (box[0], box[1], box[2] - 1, box[3] - 1)
+            merged[target] = Op('rectangle', box, (box,), None, (xy, op.args[1], None, 1))
+            for tile in _tiles(_clip(box, canvas)):
+                if target not in tiles.setdefault(tile, []):
+                    tiles[tile].append(target)
+            self.stats['merged'] += 1
+        return merged
+
+    @staticmethod
+    def _fill(op):
+        """まとめられる矩形ならその塗りの色、そうでなければ None"""
+        if op.kind == 'rectangle' and op.args[2] is None and _opaque_color(op.args[1]) and _integral(op.args[0]):
+            return parse_color(op.args[1])
+        return None
+
+    def _drop_occluded(self, ops):
+        """後から描く不透明な図形のどれか1つに画面内の範囲が収まる命令を捨てる
+
+        後の命令の不透明な矩形をタイルごとに持ち、命令の左上があるタイルの矩形とだけ比べる
+        （命令を覆う矩形は、命令が掛かるすべてのタイルに登録されている）。
+        """
+        canvas = (0, 0) + tuple(self.size)
+        covers = {}
+        kept = []
+        for op in reversed(ops):
+            if op.bounds is not None:
+                box = _clip(op.bounds, canvas)
+                tile = (box[0] // TILE_SIZE, box[1] // TILE_SIZE)
+                if any(_inside(box, cover) for cover in covers.get(tile, ())):
+                    self.stats['occluded'] += 1
+                    continue
+            kept.append(op)
+            for cover in op.opaque:
+                cover = _clip(cover, canvas)
+                if not _empty(cover):
+                    for tile in _tiles(cover):
+                        covers.setdefault(tile, []).append(cover)
+        kept.reverse()
+        return kept
+
+    def _sort_text(self, ops):
+        """互いに重ならない連続したテキストを描画状態（フォント・色）ごとに並べ替える"""
+        result = []
+        run = []
+
+        def flush():
+            movable = all(op.bounds is not None for op in run) and not any(
+                _overlaps(a.bounds, b.bounds) for i, a in enumerate(run) for b in run[i + 1:])
+            if movable:
+                order = {}
+                for op in run:
+                    order.setdefault(op.key, len(order))
+                run.sort(key=lambda op: order[op.key])
+            result.extend(run)
+            run.clear()
+
+        for op in ops:
+            if op.kind == 'text':
+                run.append(op)
+                continue
+            flush()
+            result.append(op)
+        flush()
+        return result
+
+    def _state_changes(self):
+        keys = [op.key for op in self.ops if op.kind == 'text']
+        return sum(1 for a, b in zip(keys, keys[1:]) if a != b)
+
+    # --- 再生 ---
+
+    def replay(self, image, draw=None):
+        """命令を記録順に image へ描く"""
+        draw = draw or TextDraw(image)
+        for op in self.ops:
+            if op.kind == 'paste':
+                image.paste(*op.args)
+            elif op.kind == 'call':
+                function, args, kwargs = op.args
+                function(*args, **kwargs)
+            else:
+                getattr(draw, op.kind)(*op.args)
+        return image
+
+
+def report(stats=None):
+    """最適化前後の命令数の1行サマリー（省略時はプロセス全体）"""
+    stats = totals if stats is None else stats
+    return (f"🧾 ディスプレイリスト: {stats['before']} → {stats['after']} primitives "
+            f"(画面外 {stats['culled']}, 隠れ {stats['occluded']}, 結合 {stats['merged']}), "
+            f"状態切り替え {stats['state_changes_before']} → {stats['state_changes_after']}")
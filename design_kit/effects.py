@@ -0,0 +1,100 @@
+"""
+ドロップシャドウとグロー
+
+ぼかしは元の図形マスクをパディングしたバウンディングボックスの中だけで行い、
+画像全体にはかけない。ぼかしたマスクは (マスクのハッシュ, 半径, 広がり) ごとにキャッシュするため、
+同じカードを何枚も描く画面では2枚目以降の影はマスクを合成するだけになる。
+"""
+
+import hashlib
+import math
+from collections import OrderedDict
+
+from PIL import Image, ImageFilter
+
+# これより大きい半径は縮小してからぼかす（ぼかした結果は滑らかなので縮小しても見た目は変わらない）
+DOWNSAMPLE_RADIUS = 8
+
+SHADOW_COLOR = (0, 0, 0, 110)
+
+
+def blur_mask(mask, radius, spread=0):
+    """マスクを広げてからぼかし、(ぼかしたマスク, 四辺のパディング) を返す"""
+    pad = spread + int(math.ceil(radius * 3))
+    padded = Image.new('L', (mask.width + pad * 2, mask.height + pad * 2), 0)
+    padded.paste(mask, (pad, pad))
+    if spread:
+        padded = padded.filter(ImageFilter.MaxFilter(spread * 2 + 1))
+    if radius <= 0:
+        return padded, pad
+
+    if radius <= DOWNSAMPLE_RADIUS:
+        return padded.filter(ImageFilter.GaussianBlur(radius)), pad
+
+    factor = radius / DOWNSAMPLE_RADIUS
+    small_size = (max(1, round(padded.width / factor)), max(1, round(padded.height / factor)))
+    small = padded.resize(small_size, Image.Resampling.BOX)
+    small = small.filter(ImageFilter.GaussianBlur(DOWNSAMPLE_RADIUS))
+    return small.resize(padded.size, Image.Resampling.BILINEAR), pad
+
+
+class ShadowCache:
+    """(マスクのハッシュ, サイズ, 半径, 広がり) をキーにしたぼかし済みマスクの LRU キャッシュ"""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._masks = OrderedDict()
+
+    def get(self, mask, radius, spread=0):
+        digest = hashlib.blake2b(mask.tobytes(), digest_size=16).digest()
+        key = (digest, mask.size, radius, spread)
+        entry = self._masks.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._masks.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        entry = self._masks[key] = blur_mask(mask, radius, spread)
+        if len(self._masks) > self.maxsize:
+            self._masks.popitem(last=False)
+        return entry
+
+    def clear(self):
+        self._masks.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size': len(self._masks),
+            'maxsize': self.maxsize,
+        }
+
+
+_cache = ShadowCache()
+
+
+def drop_shadow(canvas, mask, position, color=SHADOW_COLOR, radius=12, offset=(0, 6), spread=0):
+    """position に置かれた図形 mask の影を Compositor canvas に描く（図形より先に呼ぶ）"""
+    blurred, pad = _cache.get(mask, radius, spread)
+    x, y = position
+    canvas.paint(blurred, (x + offset[0] - pad, y + offset[1] - pad), color)
+
+
+def glow(canvas, mask, position, color, radius=10, spread=0, mode='screen'):
+    """図形 mask の周囲を color で光らせる"""
+    blurred, pad = _cache.get(mask, radius, spread)
+    x, y = position
+    canvas.paint(blurred, (x - pad, y - pad), color, mode)
+
+
+def cache_stats():
+    """影・グローのキャッシュのヒット・ミス数"""
+    return _cache.stats()
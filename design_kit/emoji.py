@@ -0,0 +1,286 @@
+"""
+絵文字・記号のスプライトアトラス
+
+テキストを通常の文字列と絵文字クラスタ（異体字セレクタ・ZWJ 連結・肌色修飾子・国旗を含む）に分け、
+絵文字はカラー絵文字フォントから (クラスタ, サイズ) ごとに1回だけラスタライズして
+シェルフ詰めのスプライトシートに保存し、描画時はシートから合成する。
+カラー絵文字フォントが索引にない環境では、そのコードポイントを含む別のフェイスで
+単色のグリフを作る。ZWJ 連結や国旗は構成要素（修飾子を除く）を1つずつ並べて描き、
+どのフェイスにもない要素は空白として扱い、豆腐は描かない。
+"""
+
+from PIL import Image, ImageDraw
+
+from .coverage import covering_face, get_coverage
+from .font_index import FontNotFoundError
+from .fonts import font_face, load_font, resolve_face
+from .metrics import baseline, text_width
+
+# カラー絵文字フォントのビットマップが用意されているサイズ（CBDT / sbix）
+COLOR_STRIKE_SIZES = (109, 160, 96, 64, 48, 40, 32, 20)
+
+# スプライトシートの大きさ
+SHEET_SIZE = 1024
+
+# 絵文字として扱う範囲
+EMOJI_RANGES = (
+    (0x2300, 0x23FF),    # その他の技術用記号（⏳ ⏱ など）
+    (0x2600, 0x27BF),    # その他の記号・装飾記号（⚙ ⚕ ➤ など）
+    (0x2B00, 0x2BFF),    # 矢印など（⬅ ⭐ など）
+    (0x1F000, 0x1FAFF),  # 絵文字
+)
+
+VS15 = '\ufe0e'
+VS16 = '\ufe0f'
+ZWJ = '\u200d'
+KEYCAP = '\u20e3'
+
+
+def is_emoji(ch):
+    code = ord(ch)
+    return any(start <= code <= end for start, end in EMOJI_RANGES)
+
+
+def _is_regional_indicator(ch):
+    return 0x1F1E6 <= ord(ch) <= 0x1F1FF
+
+
+def _is_modifier(ch):
+    code = ord(ch)
+    return ch in (VS16, KEYCAP) or 0x1F3FB <= code <= 0x1F3FF or 0xE0020 <= code <= 0xE007F
+
+
+def split_runs(text):
+    """テキストを (is_emoji, 文字列) の並びに分ける（絵文字は1クラスタずつ）"""
+    runs = []
+    buffer = []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if not is_emoji(ch) or text[i + 1:i + 2] == VS15:
+            buffer.append(ch)
+            i += 1
+            continue
+
+        if buffer:
+            runs.append((False, ''.join(buffer)))
+            buffer = []
+        end = i + 1
+        if _is_regional_indicator(ch) and end < len(text) and _is_regional_indicator(text[end]):
+            end += 1
+        while end < len(text):
+            if _is_modifier(text[end]):
+                end += 1
+            elif text[end] == ZWJ and end + 1 < len(text):
+                end += 2
+            else:
+                break
+        runs.append((True, text[i:end]))
+        i = end
+    if buffer:
+        runs.append((False, ''.join(buffer)))
+    return runs
+
+
+def has_emoji(text):
+    return any(is_emoji(ch) for ch in text)
+
+
+# --- フォントの選択 ---
+
+_emoji_font = []
+
+
+def _color_font():
+    """カラー絵文字フォント（ビットマップのあるサイズで読み込んだもの）。なければ None"""
+    if not _emoji_font:
+        font = None
+        try:
+            face = resolve_face('emoji')
+        except FontNotFoundError:
+            face = None
+        if face is not None:
+            for size in COLOR_STRIKE_SIZES:
+                try:
+                    font = load_font(face.path, size, face.index)
+                    break
+                except OSError:
+                    continue
+        _emoji_font.append((face, font))
+    return _emoji_font[0]
+
+
+# --- アトラス ---
+
+class SpriteAtlas:
+    """シェルフ詰めのスプライトシート
+
+    スプライトは (クラスタ, サイズ, 単色グリフの元フェイス) ごとに1回だけ作り、
+    (シート番号, 矩形, 左端, ベースラインからの上端, 送り幅, カラーかどうか) を記録する。
+    """
+
+    def __init__(self, sheet_size=SHEET_SIZE):
+        self.sheet_size = sheet_size
+        self.sheets = []
+        self.sprites = {}
+        self.missing = set()
+        self.hits = 0
+        self.misses = 0
+        self._cursor = (0, 0, 0)
+
+    def _pack(self, image):
+        width, height = image.size
+        x, y, shelf = self._cursor
+        if not self.sheets or x + width > self.sheet_size:
+            x, y, shelf = 0, y + shelf, 0
+        if not self.sheets or y + height > self.sheet_size:
+            self.sheets.append(Image.new('RGBA', (self.sheet_size, self.sheet_size), (0, 0, 0, 0)))
+            x, y, shelf = 0, 0, 0
+        self.sheets[-1].paste(image, (x, y))
+        self._cursor = (x + width + 1, y, max(shelf, height + 1))
+        return len(self.sheets) - 1, (x, y, x + width, y + height)
+
+    def get(self, cluster, size, prefer=None):
+        key = (cluster, size, prefer)
+        sprite = self.sprites.get(key)
+        if sprite is not None or key in self.sprites:
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        rendered = _render_color(cluster, size) or _render_mono(cluster, size, prefer)
+        if rendered is None:
+            self.missing.add(cluster)
+            sprite = None
+        else:
+            image, left, top, advance, color = rendered
+            sheet, box = self._pack(image)
+            sprite = (sheet, box, left, top, advance, color)
+        self.sprites[key] = sprite
+        return sprite
+
+    def image(self, sprite):
+        sheet, box = sprite[0], sprite[1]
+        return self.sheets[sheet].crop(box)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'sprites': sum(1 for sprite in self.sprites.values() if sprite is not None),
+            'sheets': len(self.sheets),
+            'missing': sorted(self.missing),
+        }
+
+
+def _render_color(cluster, size):
+    face, font = _color_font()
+    if font is None or not get_coverage().has((face.path, face.index), ord(cluster[0])):
+        return None
+    left, top, right, bottom = font.getbbox(cluster, anchor='ls', embedded_color=True)
+    if right <= left or bottom <= top:
+        return None
+    image = Image.new('RGBA', (right - left, bottom - top), (0, 0, 0, 0))
+    ImageDraw.Draw(image).text((-left, -top), cluster, font=font, anchor='ls', embedded_color=True)
+
+    # 1em の正方形に収まるよう縮小し、上端をベースラインから 0.8em 上にそろえる
+    scale = size / max(image.width, image.height)
+    image = image.resize((max(1, round(image.width * scale)), max(1, round(image.height * scale))),
+                         Image.Resampling.LANCZOS)
+    return image, (size - image.width) // 2, -round(size * 0.8), size, True
+
+
+def _components(cluster):
+    """クラスタを単色で並べて描く文字（ZWJ で区切った要素と国旗の各文字、修飾子は除く）"""
+    return [ch for part in cluster.split(ZWJ) for ch in part if not _is_modifier(ch) and ch != VS15]
+
+
+def _render_mono(cluster, size, prefer=None):
+    # 要素ごとに (ペン位置, フォント, 文字, 範囲) を求め、まとめて1枚のマスクに描く
+    glyphs = []
+    pen = 0
+    for glyph in _components(cluster):
+        record = covering_face(ord(glyph), prefer)
+        if record is None:
+            continue
+        font = load_font(record.path, size, record.index)
+        left, top, right, bottom = font.getbbox(glyph, anchor='ls')
+        if right <= left or bottom <= top:
+            continue
+        x = round(pen)
+        glyphs.append((x, font, glyph, (x + left, top, x + right, bottom)))
+        pen += max(font.getlength(glyph), right)
+    if not glyphs:
+        return None
+    left = min(box[0] for *_, box in glyphs)
+    top = min(box[1] for *_, box in glyphs)
+    right = max(box[2] for *_, box in glyphs)
+    bottom = max(box[3] for *_, box in glyphs)
+    mask = Image.new('L', (right - left, bottom - top), 0)
+    draw = ImageDraw.Draw(mask)
+    for x, font, glyph, _ in glyphs:
+        draw.text((x - left, -top), glyph, fill=255, font=font, anchor='ls')
+    image = Image.new('RGBA', mask.size, (255, 255, 255, 0))
+    image.putalpha(mask)
+    return image, left, top, pen, False
+
+
+atlas = SpriteAtlas()
+
+
+# --- 描画 ---
+
+def run_width(runs, font):
+    """split_runs() の結果の幅"""
+    prefer = font_face(font)
+    width = 0
+    for emoji, text in runs:
+        if emoji:
+            sprite = atlas.get(text, font.size, prefer)
+            width += sprite[4] if sprite else 0
+        else:
+            width += text_width(font, text)
+    return width
+
+
+def _opaque(sprite, mode):
+    """スプライトの色を不透明にして mode に変換（アルファはマスクとして別に渡す）"""
+    rgb = sprite.convert('RGB')
+    if mode == 'RGB':
+        return rgb
+    rgb = rgb.convert('RGBA')
+    return rgb if mode == 'RGBA' else rgb.convert(mode)
+
+
+def draw_text(draw, image, xy, text, fill, font, anchor=None):
+    """絵文字を含む1行のテキストを描く（絵文字はアトラスから合成）"""
+    runs = split_runs(text)
+    anchor = anchor or 'la'
+    x, y = xy
+    horizontal = anchor[0]
+    if horizontal in 'mr':
+        width = run_width(runs, font)
+        x -= width / 2 if horizontal == 'm' else width
+    y = baseline(font, y, anchor)
+    prefer = font_face(font)
+
+    for emoji, segment in runs:
+        if not emoji:
+            draw.text((x, y), segment, fill=fill, font=font, anchor='ls')
+            x += text_width(font, segment)
+            continue
+
+        sprite = atlas.get(segment, font.size, prefer)
+        if sprite is None:
+            continue
+        _, _, left, top, advance, color = sprite
+        position = (int(round(x + left)), int(round(y + top)))
+        sprite_image = atlas.image(sprite)
+        if color:
+            image.paste(_opaque(sprite_image, image.mode), position, sprite_image.getchannel('A'))
+        else:
+            ink, fill_ink = draw._getink(fill)
+            draw.draw.draw_bitmap(position, sprite_image.getchannel('A').im, fill_ink if ink is None else ink)
+        x += advance
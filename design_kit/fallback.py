@@ -0,0 +1,109 @@
+"""
+フォントフォールバック
+
+1つのフェイスでは日本語・ピンイン（声調記号）・ハングル・矢印・記号が混ざった文字列を描ききれないため、
+文字列を「チェーンの中でその文字を最初に持つフェイス」ごとのランに分けて描く。
+どのフェイスが文字を持つかは coverage のビットセットをコードポイント配列で引くだけで決め、
+グリフを試しにラスタライズすることはしない。
+"""
+
+import weakref
+from functools import lru_cache
+
+import numpy as np
+
+from .coverage import codepoints, covering_face, get_coverage
+from .font_index import FontNotFoundError, get_index
+from .fonts import FALLBACK_FAMILIES, font_face, load_font
+
+# 直前の文字のフェイスが持っていればそちらに寄せる文字（結合文字・ゼロ幅文字・異体字セレクタ）
+# いずれも幅を持たないため、文字単位で計測した幅とランごとに描いた幅は一致する
+NEUTRAL_RANGES = (
+    (0x0300, 0x036F),
+    (0x200B, 0x200D),
+    (0xFE00, 0xFE0F),
+)
+
+
+def _neutral(codes):
+    neutral = np.zeros(len(codes), dtype=bool)
+    for start, end in NEUTRAL_RANGES:
+        neutral |= (codes >= start) & (codes <= end)
+    return neutral
+
+
+class FallbackChain:
+    """主フォントと、同じサイズ・近いウェイトのフォールバックフォントの並び"""
+
+    def __init__(self, font):
+        self.font = font
+        primary = font_face(font)
+        info = get_index().face_info(*primary)
+        self.weight = info['weight'] if info else 400
+        self.italic = info['italic'] if info else False
+        self.faces = [primary]
+        self.fonts = [font]
+        for family in FALLBACK_FAMILIES:
+            try:
+                record = get_index().find(family, self.weight, self.italic)
+            except FontNotFoundError:
+                continue
+            self._add((record.path, record.index))
+
+    def _add(self, face):
+        """face をチェーンに加えて位置を返す（読み込めないフェイスなら None）"""
+        if face in self.faces:
+            return self.faces.index(face)
+        try:
+            font = load_font(face[0], self.font.size, face[1])
+        except OSError:
+            return None
+        self.faces.append(face)
+        self.fonts.append(font)
+        return len(self.faces) - 1
+
+    def choose(self, codes):
+        """各コードポイントを描くフォントのチェーン内の位置（どのフェイスにもなければ 0）"""
+        store = get_coverage()
+        covered = np.array([store.covers(face, codes) for face in self.faces])
+        found = covered.any(axis=0)
+        choice = np.where(found, covered.argmax(axis=0), 0)
+
+        # チェーンのどのフェイスにもない文字は索引全体から探し、見つかればチェーンに加える
+        for i in np.nonzero(~found)[0]:
+            record = covering_face(int(codes[i]), weight=self.weight, italic=self.italic)
+            position = self._add((record.path, record.index)) if record else None
+            if position is not None:
+                choice[i] = position
+
+        for i in np.nonzero(_neutral(codes))[0]:
+            if i and choice[i] != choice[i - 1] and store.has(self.faces[choice[i - 1]], int(codes[i])):
+                choice[i] = choice[i - 1]
+        return choice
+
+
+_chains = weakref.WeakKeyDictionary()
+
+
+def get_chain(font):
+    """フォントに対応する FallbackChain（フォントごとに1つだけ作る）"""
+    chain = _chains.get(font)
+    if chain is None:
+        chain = _chains[font] = FallbackChain(font)
+    return chain
+
+
+@lru_cache(maxsize=4096)
+def split_runs(text, font):
+    """text を (フォント, 文字列) のランに分ける（索引にないフォントは分けない）"""
+    if not text or font_face(font) is None:
+        return ((font, text),)
+    chain = get_chain(font)
+    choice = chain.choose(codepoints(text))
+    bounds = [0, *(np.nonzero(np.diff(choice))[0] + 1).tolist(), len(text)]
+    return tuple((chain.fonts[choice[start]], text[start:end]) for start, end in zip(bounds, bounds[1:]))
+
+
+def font_for(font, ch):
+    """文字 ch を描くフォント"""
+    return split_runs(ch, font)[0][0]
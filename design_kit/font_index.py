@@ -0,0 +1,214 @@
+"""
+フォント探索インデックス
+
+システムとプロジェクトのフォントディレクトリを1回だけスキャンし、
+ファミリー・ウェイト・スタイル・フェイス番号・対応 Unicode 範囲をディスクに保存する。
+以降の実行では保存済みの索引から検索し、ファイルを開いて試すことはしない。
+ディレクトリの更新時刻（ファイルの追加・削除）と各フォントファイルのサイズ・更新時刻が
+索引と異なれば、変わったファイルだけ解析し直す。
+"""
+
+import json
+import os
+import platform
+from collections import namedtuple
+
+from .paths import PROJECT_FONT_DIR, cache_path
+from .sfnt import FONT_EXTENSIONS, SfntError, read_faces
+
+INDEX_VERSION = 2
+
+FaceRecord = namedtuple('FaceRecord', 'path index family style weight italic')
+
+
+class FontNotFoundError(LookupError):
+    """要求されたフォントが索引に存在しない"""
+
+
+def font_directories():
+    """スキャン対象のフォントディレクトリ一覧"""
+    home = os.path.expanduser("~")
+    system = platform.system()
+    if system == "Darwin":
+        dirs = ["/System/Library/Fonts", "/Library/Fonts", os.path.join(home, "Library", "Fonts")]
+    elif system == "Windows":
+        dirs = [os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts")]
+    else:
+        dirs = ["/usr/share/fonts", "/usr/local/share/fonts",
+                os.path.join(home, ".local", "share", "fonts"), os.path.join(home, ".fonts")]
+    dirs.append(PROJECT_FONT_DIR)
+    extra = os.environ.get("MINDBRIDGE_FONT_DIRS")
+    if extra:
+        dirs.extend(d for d in extra.split(os.pathsep) if d)
+    return dirs
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class FontIndex:
+    """永続化されたフォント索引"""
+
+    def __init__(self, path=None, directories=None):
+        self.path = path or cache_path("font_index.json")
+        self.directories = list(directories) if directories is not None else font_directories()
+        self.files = {}
+        self.scanned_dirs = {}
+        self.rebuilt = False
+
+    # --- 永続化 ---
+
+    def load(self):
+        """保存済みの索引を読み込む。使えない場合は False"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != INDEX_VERSION or data.get('roots') != self.directories:
+            return False
+        self.files = data['files']
+        self.scanned_dirs = data['directories']
+        return True
+
+    def save(self):
+        data = {
+            'version': INDEX_VERSION,
+            'roots': self.directories,
+            'directories': self.scanned_dirs,
+            'files': self.files,
+        }
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def is_stale(self):
+        """スキャン済みディレクトリに追加・削除があったか、索引にあるファイルが置き換えられたか"""
+        for directory, mtime in self.scanned_dirs.items():
+            if _mtime(directory) != mtime:
+                return True
+        if any(directory not in self.scanned_dirs and os.path.isdir(directory) for directory in self.directories):
+            return True
+        # 同じ名前での上書きはディレクトリの更新時刻を変えないため、ファイルごとに確かめる
+        return any(_signature(path) != [entry['size'], entry['mtime']] for path, entry in self.files.items())
+
+    def load_or_build(self):
+        """索引を読み込み、古ければ差分だけ再スキャンする"""
+        if not self.load() or self.is_stale():
+            self.refresh()
+        return self
+
+    # --- スキャン ---
+
+    def refresh(self):
+        """フォントディレクトリを走査し、変更されたファイルだけ解析し直す"""
+        previous = self.files
+        self.files = {}
+        self.scanned_dirs = {}
+
+        for root in self.directories:
+            if not os.path.isdir(root):
+                continue
+            for dirpath, _, filenames in os.walk(root):
+                self.scanned_dirs[dirpath] = _mtime(dirpath)
+                for filename in filenames:
+                    if not filename.lower().endswith(FONT_EXTENSIONS):
+                        continue
+                    path = os.path.join(dirpath, filename)
+                    self.files[path] = self._scan_file(path, previous.get(path))
+
+        self.rebuilt = True
+        self.save()
+
+    def _scan_file(self, path, cached):
+        stat = os.stat(path)
+        if cached and cached['mtime'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+            return cached
+        entry = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'faces': []}
+        try:
+            entry['faces'] = read_faces(path)
+        except (OSError, SfntError, KeyError, IndexError, ValueError) as exc:
+            # 解析できないファイルも記録し、次回以降は開かない
+            entry['error'] = str(exc)
+        return entry
+
+    # --- 検索 ---
+
+    def faces(self):
+        """索引内の全フェイスを (FaceRecord, 詳細) で列挙"""
+        for path, entry in self.files.items():
+            for face in entry['faces']:
+                record = FaceRecord(path, face['index'], face['family'], face['style'],
+                                    face['weight'], face['italic'])
+                yield record, face
+
+    def families(self):
+        """索引内のファミリー名一覧"""
+        return sorted({face['family'] for _, face in self.faces()})
+
+    def find(self, families, weight=400, italic=False):
+        """候補ファミリーを先頭から順に探し、最も近いウェイトのフェイスを返す
+
+        どの候補も索引にない場合は FontNotFoundError を送出する。
+        """
+        if isinstance(families, str):
+            families = [families]
+        by_family = {}
+        for record, _ in self.faces():
+            by_family.setdefault(record.family.casefold(), []).append(record)
+
+        for family in families:
+            candidates = by_family.get(family.casefold())
+            if candidates:
+                return min(candidates, key=lambda r: (r.italic != italic, abs(r.weight - weight), -r.weight))
+
+        raise FontNotFoundError(
+            f"フォントが見つかりません: {', '.join(families)} (weight={weight}, italic={italic}) "
+            f"— 索引 {self.path} の {len(by_family)} ファミリーに該当なし"
+        )
+
+    def face_info(self, path, index=0):
+        """指定フェイスの詳細（対応範囲・カーニング有無など）を返す"""
+        entry = self.files.get(path)
+        if entry:
+            for face in entry['faces']:
+                if face['index'] == index:
+                    return face
+        return None
+
+
+_index = None
+
+
+def get_index():
+    """プロセス共有の索引（初回呼び出し時に読み込み・必要なら構築）"""
+    global _index
+    if _index is None:
+        _index = FontIndex().load_or_build()
+    return _index
+
+
+def find_face(families, weight=400, italic=False):
+    """共有索引からフェイスを検索"""
+    return get_index().find(families, weight, italic)
+
+
+if __name__ == "__main__":
+    index = FontIndex()
+    index.refresh()
+    print(f"🔤 フォント索引を更新しました: {index.path}")
+    for family in index.families():
+        print(f"   {family}")
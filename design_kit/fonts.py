@@ -0,0 +1,196 @@
+"""
+プロセス共有のフォントサービス
+
+すべての生成スクリプトは get_font() 経由でフォントを取得する。
+フォントの場所はフォント索引 (font_index) から解決し、
+読み込んだフォントは (パス, フェイス番号, サイズ, バリエーション) をキーに LRU キャッシュされ、
+同じフェイスをディスクから何度もパースしないようにする。
+"""
+
+import io
+import warnings
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+
+from PIL import ImageFont
+
+from .font_index import FontNotFoundError, find_face
+
+# 論理ファミリーごとの候補ファミリー名。先頭から順に索引を検索する
+FONT_FAMILIES = {
+    'hiragino': ['Hiragino Sans', 'Hiragino Kaku Gothic ProN', 'Noto Sans CJK JP', 'Noto Sans JP',
+                 'Source Han Sans JP', 'DejaVu Sans'],
+    'sf_pro': ['SF Pro Display', 'SF Pro', 'Hiragino Sans', 'Hiragino Kaku Gothic ProN',
+               'Noto Sans CJK JP', 'Noto Sans JP', 'DejaVu Sans'],
+    'arial': ['Arial', 'Liberation Sans', 'Helvetica', 'Arimo', 'DejaVu Sans'],
+    'mono': ['SF Mono', 'Menlo', 'Monaco', 'Consolas', 'Liberation Mono', 'Noto Sans Mono', 'DejaVu Sans Mono'],
+    'emoji': ['Apple Color Emoji', 'Noto Color Emoji', 'Segoe UI Emoji', 'Twemoji Mozilla'],
+}
+
+# 主フォントにない文字を探すフォールバック候補。先頭から順に、その文字を持つ最初のフェイスを使う
+FALLBACK_FAMILIES = [
+    'Hiragino Sans', 'Noto Sans CJK JP', 'Source Han Sans JP',      # 日本語
+    'PingFang SC', 'Noto Sans CJK SC',                              # 簡体字
+    'Apple SD Gothic Neo', 'Noto Sans CJK KR', 'Malgun Gothic',     # ハングル
+    'Helvetica Neue', 'Noto Sans', 'Segoe UI', 'DejaVu Sans',       # ラテン拡張（声調記号など）
+    'Apple Symbols', 'Noto Sans Symbols', 'Noto Sans Symbols 2', 'Segoe UI Symbol',  # 矢印・記号
+]
+
+# get_font(bold=...) に対応するウェイト
+REGULAR_WEIGHT = 400
+BOLD_WEIGHT = 700
+
+DEFAULT_FAMILY = 'hiragino'
+
+# preload() で読み込んでおくサイズ
+PRELOAD_SIZES = (12, 13, 14, 16, 18)
+
+
+class FontCache:
+    """(パス, フェイス番号, サイズ, バリエーション) をキーにした LRU フォントキャッシュ"""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._fonts = OrderedDict()
+
+    def get(self, path, size, index=0, variation=None):
+        key = (path, index, size, variation)
+        font = self._fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            self._fonts.move_to_end(key)
+            return font
+
+        self.misses += 1
+        font = ImageFont.truetype(io.BytesIO(_font_data(path)), size, index=index)
+        if variation is not None:
+            _apply_variation(font, variation)
+
+        self._fonts[key] = font
+        _font_faces[font] = (path, index)
+        if len(self._fonts) > self.maxsize:
+            self._fonts.popitem(last=False)
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size': len(self._fonts),
+            'maxsize': self.maxsize,
+        }
+
+
+@lru_cache(maxsize=16)
+def _font_data(path):
+    """フォントファイルの中身を1回だけ読み込む"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _apply_variation(font, variation):
+    if isinstance(variation, str):
+        font.set_variation_by_name(variation)
+    else:
+        font.set_variation_by_axes(list(variation))
+
+
+_cache = FontCache()
+_resolved_faces = {}
+_missing_fonts = {}
+_default_fonts = {}
+_font_faces = weakref.WeakKeyDictionary()
+
+
+def load_font(path, size, index=0, variation=None):
+    """フォントファイルを指定サイズで読み込む（キャッシュ経由）"""
+    return _cache.get(path, size, index, variation)
+
+
+def _default_font(size):
+    font = _default_fonts.get(size)
+    if font is None:
+        try:
+            font = ImageFont.load_default(size)
+        except TypeError:
+            font = ImageFont.load_default()
+        _default_fonts[size] = font
+    return font
+
+
+def resolve_face(family=DEFAULT_FAMILY, bold=False):
+    """論理ファミリーと太さから索引上のフェイスを解決（結果はプロセス内で記憶）"""
+    key = (family, bold)
+    if key not in _resolved_faces:
+        _resolved_faces[key] = find_face(FONT_FAMILIES.get(family, [family]),
+                                         weight=BOLD_WEIGHT if bold else REGULAR_WEIGHT)
+    return _resolved_faces[key]
+
+
+def get_font(size=16, bold=False, family=DEFAULT_FAMILY):
+    """ファミリー・太さ・サイズからフォントを取得
+
+    索引に候補が1つもない場合は警告を出し、Pillow の既定フォントを返す。
+    """
+    key = (family, bold)
+    if key not in _missing_fonts:
+        try:
+            face = resolve_face(family, bold)
+            return load_font(face.path, size, face.index)
+        except FontNotFoundError as exc:
+            _missing_fonts[key] = str(exc)
+            warnings.warn(f"{exc}。既定フォントで描画します", RuntimeWarning, stacklevel=2)
+    return _default_font(size)
+
+
+def scaled_font(font, scale):
+    """font を scale 倍のサイズで読み込み直したフォント（キャッシュ経由、scale が 1 ならそのまま）"""
+    if scale == 1 or font is None:
+        return font
+    size = max(1, round(font.size * scale))
+    face = font_face(font)
+    if face is None:
+        return _default_font(size)
+    return load_font(face[0], size, face[1])
+
+
+def font_face(font):
+    """get_font / load_font で読み込んだフォントの (パス, フェイス番号)。不明な場合は None"""
+    return _font_faces.get(font)
+
+
+def missing_fonts():
+    """解決できなかった (ファミリー, 太字) とその理由"""
+    return dict(_missing_fonts)
+
+
+def preload(families=None, sizes=PRELOAD_SIZES):
+    """設定済みフェイスをよく使うサイズで事前に読み込む"""
+    for family in families or FONT_FAMILIES:
+        for size in sizes:
+            get_font(size, bold=False, family=family)
+            get_font(size, bold=True, family=family)
+
+
+def cache_stats():
+    """フォントキャッシュのヒット・ミス数を返す"""
+    return _cache.stats()
+
+
+def clear_cache():
+    """フォントキャッシュを空にする"""
+    _cache.clear()
+    _resolved_faces.clear()
+    _missing_fonts.clear()
+    _default_fonts.clear()
+    _font_data.cache_clear()
@@ -0,0 +1,264 @@
+"""
+共有グラデーションエンジン
+
+グラデーション全体を NumPy 配列として一括生成する。
+縦・横のグラデーションは1列分の色 (長さ, カラーストップ) だけをメモ化し、画像はブロードキャストで作る。
+角度付き・円形・円錐のグラデーションは画像ごと、合計サイズに上限のある LRU キャッシュに保存する
+（画面全体の大きさの画像は1枚 10 MB を超えるため、件数ではなくバイト数で制限する）。
+"""
+
+import math
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image
+
+# 画像ごとにキャッシュするグラデーションの合計サイズの上限（バイト）
+DEFAULT_BUDGET = 32 * 1024 * 1024
+
+
+@lru_cache(maxsize=256)
+def _parse_hex(color):
+    value = color.lstrip('#')
+    if len(value) == 3:
+        value = ''.join(c * 2 for c in value)
+    return tuple(int(value[i:i + 2], 16) for i in range(0, len(value), 2))
+
+
+def parse_color(color):
+    """'#RRGGBB' / '#RRGGBBAA' / タプルを整数タプルに変換"""
+    if isinstance(color, str):
+        return _parse_hex(color)
+    return tuple(int(c) for c in color)
+
+
+def normalize_stops(stops):
+    """カラーストップを ((位置, 色), ...) のタプルに正規化
+
+    色だけの列を渡した場合は均等配置とみなす。
+    """
+    stops = list(stops)
+    if len(stops) < 2:
+        raise ValueError("グラデーションには2つ以上のカラーストップが必要です")
+
+    if all(isinstance(s, (tuple, list)) and len(s) == 2 and isinstance(s[0], (int, float))
+           and isinstance(s[1], (tuple, list, str)) for s in stops):
+        pairs = [(float(pos), parse_color(color)) for pos, color in stops]
+    else:
+        last = len(stops) - 1
+        pairs = [(i / last, parse_color(color)) for i, color in enumerate(stops)]
+
+    channels = max(len(color) for _, color in pairs)
+    normalized = []
+    for pos, color in sorted(pairs, key=lambda p: p[0]):
+        if len(color) < channels:
+            color = color + (255,)
+        normalized.append((pos, color))
+    return tuple(normalized)
+
+
+def _normalize_direction(direction):
+    if direction in ('vertical', 'horizontal'):
+        return direction
+    angle = float(direction) % 360.0
+    if angle == 90.0:
+        return 'vertical'
+    if angle == 0.0:
+        return 'horizontal'
+    return angle
+
+
+def _interpolate(t, stops):
+    """位置配列 t (0..1) に対する各チャンネル値を計算"""
+    positions = np.array([pos for pos, _ in stops], dtype=np.float64)
+    colors = np.array([color for _, color in stops], dtype=np.float64)
+
+    t = np.clip(t, positions[0], positions[-1])
+    if len(stops) == 2 and positions[0] == 0.0 and positions[1] == 1.0:
+        # 2色グラデーションはセグメント探索を省略
+        values = colors[0] + (colors[1] - colors[0]) * t[..., None]
+        return values.astype(np.uint8)
+
+    segment = np.clip(np.searchsorted(positions, t, side='right') - 1, 0, len(stops) - 2)
+
+    start_pos = positions[segment]
+    span = positions[segment + 1] - start_pos
+    span[span == 0] = 1.0
+    local = (t - start_pos) / span
+
+    start = colors[segment]
+    end = colors[segment + 1]
+    # 旧実装の int(start + (end - start) * progress) と同じ切り捨て
+    values = start + (end - start) * local[..., None]
+    return values.astype(np.uint8)
+
+
+class GradientCache:
+    """合計サイズに上限のあるグラデーション画像の LRU キャッシュ"""
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        self.budget = budget
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._images = OrderedDict()
+
+    @staticmethod
+    def _size(image):
+        # Pillow は RGB も1画素4バイトで持つ
+        return image.width * image.height * 4
+
+    def get(self, key, build):
+        """key の画像を返す（なければ build() で作って保存）。呼び出し側は書き換えずにコピーして使う"""
+        image = self._images.get(key)
+        if image is not None:
+            self.hits += 1
+            self._images.move_to_end(key)
+            return image
+
+        self.misses += 1
+        image = build()
+        size = self._size(image)
+        if size <= self.budget:
+            self._images[key] = image
+            self.nbytes += size
+            while self.nbytes > self.budget:
+                _, evicted = self._images.popitem(last=False)
+                self.nbytes -= self._size(evicted)
+                self.evictions += 1
+        return image
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'entries': len(self._images),
+            'bytes': self.nbytes,
+            'evictions': self.evictions,
+        }
+
+    def clear(self):
+        self._images.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+images = GradientCache()
+
+
+@lru_cache(maxsize=256)
+def _ramp(length, stops):
+    """縦・横のグラデーションの1列分の色 (length, チャンネル数)"""
+    ramp = _interpolate(np.arange(length, dtype=np.float64) / length, stops)
+    ramp.flags.writeable = False
+    return ramp
+
+
+def _angled_image(width, height, stops, angle):
+    theta = math.radians(angle)
+    dx, dy = math.cos(theta), math.sin(theta)
+    corners = [0.0, width * dx, height * dy, width * dx + height * dy]
+    low, high = min(corners), max(corners)
+    ys, xs = np.mgrid[0:height, 0:width].astype(np.float64)
+    t = (xs * dx + ys * dy - low) / (high - low)
+    pixels = _interpolate(t, stops)
+    return Image.fromarray(pixels, 'RGBA' if pixels.shape[-1] == 4 else 'RGB')
+
+
+def _gradient_image(width, height, stops, direction):
+    """書き換えてよい新しいグラデーション画像"""
+    if direction == 'vertical':
+        ramp = _ramp(height, stops)
+        pixels = np.broadcast_to(ramp[:, None, :], (height, width, ramp.shape[-1]))
+    elif direction == 'horizontal':
+        ramp = _ramp(width, stops)
+        pixels = np.broadcast_to(ramp[None, :, :], (height, width, ramp.shape[-1]))
+    else:
+        key = ('linear', width, height, stops, direction)
+        return images.get(key, lambda: _angled_image(width, height, stops, direction)).copy()
+    return Image.fromarray(np.ascontiguousarray(pixels), 'RGBA' if pixels.shape[-1] == 4 else 'RGB')
+
+
+def linear_gradient(width, height, stops, direction='vertical'):
+    """線形グラデーション画像を作成
+
+    direction には 'vertical' / 'horizontal' または角度（度、0 = 左→右、90 = 上→下）を指定。
+    呼び出し側には書き換え可能な新しい画像を返す。
+    """
+    return _gradient_image(int(width), int(height), normalize_stops(stops), _normalize_direction(direction))
+
+
+def create_gradient(width, height, start_color, end_color, direction='vertical'):
+    """2色の線形グラデーション画像を作成"""
+    return linear_gradient(width, height, (start_color, end_color), direction)
+
+
+def _center_offsets(width, height, center):
+    if center is None:
+        center = (width // 2, height // 2)
+    cx, cy = center
+    ys, xs = np.ogrid[0:height, 0:width]
+    return xs - cx, ys - cy, center
+
+
+def _radial_image(width, height, stops, center, radius):
+    dx, dy, (cx, cy) = _center_offsets(width, height, center)
+    if radius is None:
+        radius = np.sqrt(float(cx ** 2 + cy ** 2))
+    distance = np.sqrt((dx ** 2 + dy ** 2).astype(np.float64))
+    # 半径 0（1px の画像の既定値など）は中心だけ最初の色、ほかは最後の色にする
+    t = np.minimum(distance / max(radius, 1e-6), 1.0)
+    pixels = _interpolate(t, stops)
+    return Image.fromarray(pixels, 'RGBA' if pixels.shape[-1] == 4 else 'RGB')
+
+
+def _conic_image(width, height, stops, center, start_angle):
+    dx, dy, _ = _center_offsets(width, height, center)
+    angle = np.arctan2(dy, dx) - math.radians(start_angle)
+    t = np.mod(angle, 2 * math.pi) / (2 * math.pi)
+    pixels = _interpolate(t, stops)
+    return Image.fromarray(pixels, 'RGBA' if pixels.shape[-1] == 4 else 'RGB')
+
+
+def radial_gradient(width, height, stops, center=None, radius=None):
+    """円形（放射状）グラデーション画像を作成
+
+    中心からの距離場を一括計算する。center 省略時は画像中央、
+    radius 省略時は中心から角までの距離を使う。半径 0 でも警告なく描ける。
+    """
+    key = ('radial', int(width), int(height), normalize_stops(stops), tuple(center) if center is not None else None,
+           radius)
+    return images.get(key, lambda: _radial_image(*key[1:])).copy()
+
+
+def conic_gradient(width, height, stops, center=None, start_angle=0):
+    """円錐（角度）グラデーション画像を作成
+
+    start_angle（度、0 = 右、時計回り）から一周する角度に沿って色を補間する。
+    """
+    key = ('conic', int(width), int(height), normalize_stops(stops), tuple(center) if center is not None else None,
+           float(start_angle))
+    return images.get(key, lambda: _conic_image(*key[1:])).copy()
+
+
+def paste_gradient(img, box, stops, direction='vertical'):
+    """既存の画像の指定領域にグラデーションを貼り付け"""
+    x1, y1, x2, y2 = box
+    gradient = linear_gradient(x2 - x1, y2 - y1, stops, direction)
+    if img.mode != gradient.mode:
+        gradient = gradient.convert(img.mode)
+    img.paste(gradient, (x1, y1))
+
+
+def cache_info():
+    """グラデーションキャッシュの統計を返す"""
+    return {
+        'ramps': _ramp.cache_info(),
+        'images': images.stats(),
+    }
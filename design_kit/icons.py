@@ -0,0 +1,133 @@
+"""
+アプリアイコン生成パイプライン
+
+スーパーサンプリングしたマスター画像を1回だけ描画し、
+リニア色空間での高品質な縮小チェーンで全サイズを派生させる。
+"""
+
+import numpy as np
+from PIL import Image, ImageFilter
+
+# App Store / iPhone 用アイコンサイズ（大きい順）
+APP_ICON_SIZES = [
+    1024,  # App Store
+    180,   # iPhone 6 Plus @3x
+    120,   # iPhone @2x
+    87,    # iPhone @3x Settings
+    80,    # iPhone @2x Spotlight
+    60,    # iPhone @1x
+    58,    # iPhone @2x Settings
+    40,    # iPhone @2x Spotlight
+    29,    # iPhone @1x Settings
+    20,    # iPhone @1x Notification
+]
+
+# 小さいサイズ用のヒンティング対象
+SMALL_ICON_SIZES = (40, 29, 20)
+
+# マスター画像の倍率（1024 の何倍で描画するか）
+SUPERSAMPLE = 2
+
+
+def srgb_to_linear(pixels):
+    """sRGB (uint8) をリニア (float32, 0..1) に変換"""
+    c = pixels.astype(np.float32) / 255.0
+    return np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4).astype(np.float32)
+
+
+def linear_to_srgb(linear):
+    """リニア (float32, 0..1) を sRGB (uint8) に変換"""
+    c = np.clip(linear, 0.0, 1.0)
+    c = np.where(c <= 0.0031308, c * 12.92, 1.055 * np.power(c, 1 / 2.4) - 0.055)
+    return np.round(c * 255.0).astype(np.uint8)
+
+
+def _to_linear_planes(img):
+    """画像をリニア色空間のチャンネル配列に変換（アルファは乗算済み）"""
+    pixels = np.asarray(img)
+    if img.mode == 'RGBA':
+        alpha = pixels[..., 3:].astype(np.float32) / 255.0
+        color = srgb_to_linear(pixels[..., :3]) * alpha
+        return np.concatenate([color, alpha], axis=-1)
+    return srgb_to_linear(pixels)
+
+
+def _from_linear_planes(planes, mode):
+    """リニア色空間のチャンネル配列から画像を復元"""
+    if mode == 'RGBA':
+        alpha = np.clip(planes[..., 3:], 0.0, 1.0)
+        color = np.divide(planes[..., :3], alpha, out=np.zeros_like(planes[..., :3]), where=alpha > 0)
+        pixels = np.concatenate([linear_to_srgb(color), np.round(alpha * 255.0).astype(np.uint8)], axis=-1)
+        return Image.fromarray(pixels, 'RGBA')
+    return Image.fromarray(linear_to_srgb(planes), 'RGB')
+
+
+def _resize_planes(planes, size, resample):
+    """各チャンネルを 32bit float のまま縮小"""
+    channels = [
+        np.asarray(Image.fromarray(np.ascontiguousarray(planes[..., i]), 'F').resize(size, resample))
+        for i in range(planes.shape[-1])
+    ]
+    return np.stack(channels, axis=-1)
+
+
+def sharpen_hint(img, size):
+    """小さいアイコン向けに輪郭を軽く強調する標準ヒンティング"""
+    return img.filter(ImageFilter.UnsharpMask(radius=0.6, percent=80, threshold=0))
+
+
+DEFAULT_HINTS = {size: sharpen_hint for size in SMALL_ICON_SIZES}
+
+
+def render_master(draw_icon, size=1024, supersample=SUPERSAMPLE, mode='RGB'):
+    """マスター画像を描画
+
+    draw_icon(img, width, height) は渡された画像に直接描画する。
+    """
+    master_size = size * supersample
+    img = Image.new(mode, (master_size, master_size))
+    draw_icon(img, master_size, master_size)
+    return img
+
+
+def build_mipmap_chain(master, sizes=APP_ICON_SIZES, hints=None, resample=Image.Resampling.LANCZOS):
+    """マスター画像から各サイズを派生させる
+
+    縮小はリニア色空間で行い、各レベルは直前のレベルから作る。
+    hints には {サイズ: func(img, size) -> img} でサイズ別の上書き処理を指定する
+    （None の場合は DEFAULT_HINTS を使用）。ヒンティングは出力にのみ適用され、
+    次のレベルの入力には影響しない。
+    """
+    if hints is None:
+        hints = DEFAULT_HINTS
+
+    mode = master.mode
+    planes = _to_linear_planes(master)
+    images = {}
+
+    for size in sorted(set(sizes), reverse=True):
+        if planes.shape[1] != size or planes.shape[0] != size:
+            planes = _resize_planes(planes, (size, size), resample)
+        img = _from_linear_planes(planes, mode)
+        hint = hints.get(size)
+        if hint is not None:
+            img = hint(img, size)
+        images[size] = img
+
+    return images
+
+
+def render_icon_set(draw_icon, sizes=APP_ICON_SIZES, hints=None, supersample=SUPERSAMPLE, mode='RGB'):
+    """マスターを1回描画し、全サイズのアイコンを返す"""
+    master = render_master(draw_icon, max(sizes), supersample, mode)
+    return build_mipmap_chain(master, sizes, hints)
+
+
+def save_icon_set(images, pattern="AppIcon-{size}x{size}.png"):
+    """アイコン一式を保存し、保存したファイル名のリストを返す"""
+    filenames = []
+    for size in sorted(images, reverse=True):
+        filename = pattern.format(size=size)
+        images[size].save(filename, 'PNG')
+        filenames.append(filename)
+    return filenames
@@ -0,0 +1,91 @@
+"""
+縦方向のフローレイアウト
+
+会話画面のブロック（吹き出し・カード・箇条書き）を、折り返したテキストの実測値から高さを決めて
+上から間隔をあけて積み、安全領域に収まらない分は次のページに送る。
+折り返しとブロックの高さは (内容, 幅, テーマ) ごとにメモ化するため、
+別のサイズや言語で描き直しても、同じ内容の計測はやり直さない（どちらも件数に上限のある LRU）。
+"""
+
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+
+from .fonts import get_font
+from .linebreak import break_lines
+
+# ページ内のブロックの配置（blocks の何番目か、上端の y 座標）
+Placement = namedtuple('Placement', 'index y')
+
+
+@lru_cache(maxsize=4096)
+def wrap_text(text, size, bold, family, width):
+    """text を width に収まる行のタプルに折り返す（改行文字は強制改行）"""
+    return tuple(break_lines(text, get_font(size, bold, family), width))
+
+
+def flow(heights, gaps, top, bottom, fixed=None):
+    """高さ heights のブロックを top から積み、bottom を超えるものは次のページの top から続ける
+
+    gaps は各ブロックの後の間隔、fixed は位置を指定されたブロックの y 座標（なければ None）。
+    1ブロックでページに収まらない場合もそのページに置く。ページごとの Placement のリストを返す。
+    """
+    fixed = fixed or [None] * len(heights)
+    pages = [[]]
+    y = top
+    for index, (height, gap, position) in enumerate(zip(heights, gaps, fixed)):
+        if position is not None:
+            y = position
+        elif y + height > bottom and pages[-1]:
+            pages.append([])
+            y = top
+        pages[-1].append(Placement(index, y))
+        y += height + gap
+    return pages
+
+
+class LayoutCache:
+    """(内容, 幅, テーマ) をキーにしたブロックの高さの LRU キャッシュ"""
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._heights = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, measure):
+        """key の高さを返す（なければ measure() で計測して保存）"""
+        height = self._heights.get(key)
+        if height is not None:
+            self.hits += 1
+            self._heights.move_to_end(key)
+            return height
+        self.misses += 1
+        height = self._heights[key] = measure()
+        if len(self._heights) > self.maxsize:
+            self._heights.popitem(last=False)
+        return height
+
+    def stats(self):
+        wraps = wrap_text.cache_info()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'blocks': len(self._heights),
+            'wrap_hits': wraps.hits,
+            'wrap_misses': wraps.misses,
+        }
+
+    def report(self):
+        """ヒット数の1行サマリー"""
+        stats = self.stats()
+        return (f"📐 レイアウト: {stats['hits']} hits / {stats['misses']} misses ({stats['blocks']} blocks), "
+                f"折り返し {stats['wrap_hits']} hits / {stats['wrap_misses']} misses")
+
+    def clear(self):
+        self._heights.clear()
+        wrap_text.cache_clear()
+        self.hits = 0
+        self.misses = 0
+
+
+layout_cache = LayoutCache()
@@ -0,0 +1,219 @@
+"""
+CJK 対応の行分割
+
+UAX #14 に準じた改行可能位置（空白の後、CJK 文字の前後、ハイフンの後）と
+日本語の禁則処理（行頭禁則・行末禁則）を考慮し、
+各行の分割位置を段落の累積送り幅に対する二分探索で求める（部分文字列の幅は累積幅の差で、計測し直さない）。
+シェーピングするフォントや計測関数を渡した場合は、累積幅で選んだ位置を実際の計測で確かめる。URL の途中（ハイフンの後など）では改行しない。
+1行に収まらない語は文字単位で分割し、そのときもできるだけ禁則を守る。
+"""
+
+import re
+import unicodedata
+
+from .metrics import get_metrics
+
+# 改行クラス
+BK = 'BK'   # 強制改行
+SP = 'SP'   # 空白
+ID = 'ID'   # 表意文字（前後で改行可能）
+OP = 'OP'   # 開き括弧類（直後で改行しない＝行末禁則）
+CL = 'CL'   # 閉じ括弧・句読点・小書き仮名など（直前で改行しない＝行頭禁則）
+HY = 'HY'   # ハイフン（直後で改行可能）
+CM = 'CM'   # 結合文字・ZWJ・異体字セレクタ（前の文字と分割しない）
+AL = 'AL'   # その他（英数字など、連続する間では改行しない）
+
+# 行頭禁則文字
+NO_START = set(
+    "、。，．,.:;!?)]}%"
+    "）」』】〕〉》〙〗〟’”｝］｠｣"
+    "・：；？！ー‐゠–〜～"
+    "ぁぃぅぇぉっゃゅょゎゕゖァィゥェォッャュョヮヵヶ"
+    "ㇰㇱㇲㇳㇴㇵㇶㇷㇸㇹㇺㇻㇼㇽㇾㇿ々〻ヽヾゝゞ"
+)
+
+# 行末禁則文字
+NO_END = set("([{（「『【〔〈《〘〖〝‘“｛［｟｢")
+
+# 表意文字として扱う範囲（CJK・仮名・ハングル・全角形・絵文字）
+_IDEOGRAPHIC_RANGES = (
+    (0x1100, 0x11FF),
+    (0x2600, 0x27BF),
+    (0x2E80, 0x2FFF),
+    (0x3001, 0x33FF),
+    (0x3400, 0x4DBF),
+    (0x4E00, 0x9FFF),
+    (0xA960, 0xA97F),
+    (0xAC00, 0xD7AF),
+    (0xF900, 0xFAFF),
+    (0xFE30, 0xFE4F),
+    (0xFF00, 0xFFEF),
+    (0x1F000, 0x1FAFF),
+    (0x20000, 0x3FFFF),
+)
+
+ZWJ = '\u200d'
+
+# 途中で改行しない URL（ASCII の印字可能文字が続く範囲）
+_URL = re.compile(r'[A-Za-z][A-Za-z0-9+.-]*://[!-~]+')
+
+
+def char_class(ch):
+    """文字の改行クラスを返す"""
+    if ch == '\n':
+        return BK
+    if ch in ' \t　':
+        return SP
+    if ch in NO_START:
+        return CL
+    if ch in NO_END:
+        return OP
+    if ch == ZWJ or unicodedata.category(ch).startswith('M') or '\ufe00' <= ch <= '\ufe0f':
+        return CM
+    code = ord(ch)
+    if 0x1F3FB <= code <= 0x1F3FF:
+        # 肌色修飾子は直前の絵文字と分割しない
+        return CM
+    if ch == '-':
+        return HY
+    for start, end in _IDEOGRAPHIC_RANGES:
+        if start <= code <= end:
+            return ID
+    return AL
+
+
+def _can_break_before(prev, cur, prev_char):
+    """prev と cur の間で改行できるか"""
+    if cur in (SP, CM, CL) or prev_char == ZWJ:
+        return False
+    if prev == SP:
+        return True
+    if prev == OP:
+        return False
+    if prev == HY:
+        return cur in (AL, ID)
+    return prev == ID or cur == ID
+
+
+def break_opportunities(text):
+    """改行可能位置（その位置の直前で行を終えられるインデックス）を列挙"""
+    classes = [char_class(ch) for ch in text]
+    inside_url = set()
+    for match in _URL.finditer(text):
+        inside_url.update(range(match.start() + 1, match.end()))
+    positions = []
+    for i in range(1, len(text)):
+        if i not in inside_url and _can_break_before(classes[i - 1], classes[i], text[i - 1]):
+            positions.append(i)
+    positions.append(len(text))
+    return positions
+
+
+class _Widths:
+    """段落の累積幅から部分文字列の幅（末尾の空白を除く）を求める
+
+    metrics（GlyphMetrics）を渡すとその累積幅を使い、シェーピングするフォントでなければ正確な幅になる。
+    それ以外は measure で1文字ずつ測った幅の合計を使い、正確な幅は confirm() で measure に確かめる。
+    """
+
+    def __init__(self, text, measure, metrics=None):
+        self.text = text
+        self.measure = measure
+        if metrics is not None:
+            self.prefix, self.kerns = metrics.prefix(text)
+            self.exact = not metrics.shaped
+        else:
+            self.prefix = [0.0]
+            for ch in text:
+                self.prefix.append(self.prefix[-1] + measure(ch))
+            self.kerns = [0.0] * (len(text) + 1)
+            self.exact = False
+
+    def _trim(self, start, end):
+        while end > start and self.text[end - 1] in ' \t　':
+            end -= 1
+        return end
+
+    def __call__(self, start, end):
+        end = self._trim(start, end)
+        if end <= start:
+            return 0
+        return self.prefix[end] - self.prefix[start] - self.kerns[start]
+
+    def confirm(self, start, end):
+        """text[start:end] の実際の幅（累積幅が正確ならそれを使い、計測し直さない）"""
+        if self.exact:
+            return self(start, end)
+        return self.measure(self.text[start:self._trim(start, end)])
+
+
+def _last_fitting(candidates, low, start, max_width, widths):
+    """candidates[low:] のうち start から始まる行に収まる最後の位置（なければ None）
+
+    累積幅で二分探索し、選んだ位置が実際の計測ではみ出す間は1つ前の候補に戻す。
+    """
+    first, high = low, len(candidates) - 1
+    best = None
+    while low <= high:
+        mid = (low + high) // 2
+        if widths(start, candidates[mid]) <= max_width:
+            best = mid
+            low = mid + 1
+        else:
+            high = mid - 1
+    while best is not None and widths.confirm(start, candidates[best]) > max_width:
+        best = best - 1 if best > first else None
+    return None if best is None else candidates[best]
+
+
+def _skip_spaces(text, index):
+    while index < len(text) and text[index] in ' \t　':
+        index += 1
+    return index
+
+
+def break_paragraph(text, max_width, measure, metrics=None):
+    """改行を含まない段落を行に分割（metrics を渡すとその累積幅で探す）"""
+    if not text:
+        return ['']
+
+    widths = _Widths(text, measure, metrics)
+    opportunities = break_opportunities(text)
+    lines = []
+    start = 0
+    cursor = 0
+
+    while start < len(text):
+        while opportunities[cursor] <= start:
+            cursor += 1
+        end = _last_fitting(opportunities, cursor, start, max_width, widths)
+
+        if end is None:
+            # 単語が1行に収まらない場合は文字単位で強制分割（収まるなら禁則の位置は避ける）
+            limit = opportunities[cursor]
+            chars = [i for i in range(start + 1, limit + 1)
+                     if i == limit or char_class(text[i]) != CM]
+            allowed = [i for i in chars if i == limit or (char_class(text[i]) != CL and char_class(text[i - 1]) != OP)]
+            end = (_last_fitting(allowed, 0, start, max_width, widths)
+                   or _last_fitting(chars, 0, start, max_width, widths) or chars[0])
+
+        lines.append(text[start:end].rstrip(' \t　'))
+        start = _skip_spaces(text, end)
+
+    return lines
+
+
+def break_lines(text, font, max_width, measure=None):
+    """テキストを指定幅で折り返した行のリストを返す
+
+    measure には文字列幅を返す関数を渡せる（省略時はグリフ送り幅キャッシュで計測）。
+    改行文字は強制改行として扱う。
+    """
+    metrics = None
+    if measure is None:
+        metrics = get_metrics(font)
+        measure = metrics.width
+    lines = []
+    for paragraph in text.split('\n'):
+        lines.extend(break_paragraph(paragraph, max_width, measure, metrics))
+    return lines
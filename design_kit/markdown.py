@@ -0,0 +1,300 @@
+"""
+チャット吹き出し用の軽量 Markdown レンダラー
+
+AI の返答に含まれるコードブロック（```）、箇条書き、太字（**）、インラインコード（`）を解釈し、
+吹き出しの幅に合わせて折り返した配置を DisplayList（または ImageDraw）に描く。
+改行文字はそのまま強制改行として扱う。
+
+構文木はメッセージのハッシュをキーに保存するため、同じ会話を端末サイズや言語ごとに描き直しても
+パースは1回だけになる。折り返しの結果も (メッセージ, 幅, サイズ, ファミリー) ごとにメモ化する。
+"""
+
+import hashlib
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from .fonts import get_font
+from .linebreak import CM, break_opportunities, char_class
+from .metrics import DEFAULT_SPACING, get_metrics, text_width
+
+# kind: 'paragraph' / 'bullet' / 'heading' / 'code' / 'blank'
+# content: 段落なら Span のタプル、コードブロックなら行のタプル、lang: コードブロックの言語
+Block = namedtuple('Block', 'kind content lang')
+# style: None（通常）/ 'bold' / 'code'
+Span = namedtuple('Span', 'text style')
+
+# 配置済みのテキスト断片と背景の矩形（吹き出し内のテキスト原点からの相対座標）
+Run = namedtuple('Run', 'x y text style')
+Box = namedtuple('Box', 'x1 y1 x2 y2 kind')
+MessageLayout = namedtuple('MessageLayout', 'width height runs boxes')
+
+FENCE = '```'
+BULLETS = ('• ', '・', '- ', '* ')
+INLINE = re.compile(r'\*\*(.+?)\*\*|`([^`]+)`')
+
+CODE_PADDING = 8
+CODE_GAP = 6
+INLINE_PADDING = 3
+
+
+def parse_inline(text):
+    """行内の太字とインラインコードを Span のタプルに分ける"""
+    spans = []
+    position = 0
+    for match in INLINE.finditer(text):
+        if match.start() > position:
+            spans.append(Span(text[position:match.start()], None))
+        if match.group(1) is not None:
+            spans.append(Span(match.group(1), 'bold'))
+        else:
+            spans.append(Span(match.group(2), 'code'))
+        position = match.end()
+    if position < len(text):
+        spans.append(Span(text[position:], None))
+    return tuple(spans)
+
+
+def _parse(text):
+    blocks = []
+    lines = text.split('\n')
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        if stripped.startswith(FENCE):
+            # 閉じられていないコードブロックは末尾まで
+            lang = stripped[len(FENCE):].strip() or None
+            code = []
+            i += 1
+            while i < len(lines) and lines[i].strip() != FENCE:
+                code.append(lines[i].rstrip())
+                i += 1
+            blocks.append(Block('code', tuple(code), lang))
+        elif not stripped:
+            blocks.append(Block('blank', (), None))
+        elif stripped.startswith('#'):
+            blocks.append(Block('heading', parse_inline(stripped.lstrip('#').strip()), None))
+        elif stripped.startswith(BULLETS) and not stripped.startswith('**'):
+            marker = next(b for b in BULLETS if stripped.startswith(b))
+            blocks.append(Block('bullet', parse_inline(stripped[len(marker):].strip()), None))
+        else:
+            blocks.append(Block('paragraph', parse_inline(line), None))
+        i += 1
+    return tuple(blocks)
+
+
+class ParseCache:
+    """メッセージのハッシュをキーにした構文木"""
+
+    def __init__(self):
+        self._trees = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text):
+        """text の構文木（Block のタプル）を返す（なければパースして保存）"""
+        key = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        tree = self._trees.get(key)
+        if tree is not None:
+            self.hits += 1
+            return tree
+        self.misses += 1
+        tree = self._trees[key] = _parse(text)
+        return tree
+
+    def stats(self):
+        layouts = layout_message.cache_info()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'trees': len(self._trees),
+            'layout_hits': layouts.hits,
+            'layout_misses': layouts.misses,
+        }
+
+    def report(self):
+        """ヒット数の1行サマリー"""
+        stats = self.stats()
+        return (f"📝 Markdown: パース {stats['hits']} hits / {stats['misses']} misses ({stats['trees']} trees), "
+                f"折り返し {stats['layout_hits']} hits / {stats['layout_misses']} misses")
+
+    def clear(self):
+        self._trees.clear()
+        layout_message.cache_clear()
+        self.hits = 0
+        self.misses = 0
+
+
+parse_cache = ParseCache()
+
+
+def parse(text):
+    """Markdown のメッセージを Block のタプルにする（キャッシュ経由）"""
+    return parse_cache.get(text)
+
+
+def fonts_for(size, family):
+    """スタイルごとのフォント"""
+    return {
+        None: get_font(size, family=family),
+        'bold': get_font(size, bold=True, family=family),
+        'code': get_font(size - 1, family='mono'),
+    }
+
+
+def _pieces(spans):
+    """Span の列を改行可能位置とスタイルの境目で切った (文字列, スタイル, 単語の先頭か) の列にする"""
+    text = ''.join(span.text for span in spans)
+    cuts = set(break_opportunities(text)) if text else set()
+    pieces = []
+    position = 0
+    for span in spans:
+        start = position
+        for end in sorted(c for c in cuts if start < c < position + len(span.text)) + [position + len(span.text)]:
+            if end > start:
+                pieces.append((text[start:end], span.style, start in cuts or start == 0))
+            start = end
+        position += len(span.text)
+    return pieces
+
+
+def _split_word(word, style, font, width):
+    """1行に収まらない単語を文字単位で分ける"""
+    parts = []
+    current = ''
+    for ch in word:
+        if current and char_class(ch) != CM and text_width(font, current + ch) > width:
+            parts.append(current)
+            current = ''
+        current += ch
+    if current:
+        parts.append(current)
+    return [(part, style) for part in parts]
+
+
+def _word_width(word, fonts, trim=False):
+    """単語の幅（trim なら末尾の空白を除く）"""
+    width = sum(text_width(fonts[style], piece) for piece, style in word[:-1])
+    piece, style = word[-1]
+    return width + text_width(fonts[style], piece.rstrip(' \t　') if trim else piece)
+
+
+def _wrap_spans(spans, fonts, width):
+    """Span の列を width に収まる行に折り返し、行ごとの (文字列, スタイル) のリストを返す"""
+    words = []
+    for piece, style, starts in _pieces(spans):
+        if starts or not words:
+            words.append([])
+        words[-1].append((piece, style))
+
+    lines = [[]]
+    line_width = 0
+    for word in words:
+        if lines[-1] and line_width + _word_width(word, fonts, trim=True) > width:
+            lines.append([])
+            line_width = 0
+            word = [(piece.lstrip(' \t　'), style) for piece, style in word]
+        if not lines[-1] and len(word) == 1 and _word_width(word, fonts) > width:
+            piece, style = word[0]
+            parts = _split_word(piece, style, fonts[style], width)
+            for part in parts[:-1]:
+                lines[-1].append(part)
+                lines.append([])
+            word = parts[-1:]
+        lines[-1].extend(word)
+        line_width += _word_width(word, fonts)
+    return [_coalesce(line) for line in lines]
+
+
+def _coalesce(line):
+    """同じスタイルが続く断片を1つにまとめる（描画命令を減らす）"""
+    merged = []
+    for piece, style in line:
+        if merged and merged[-1][1] == style and style != 'code':
+            merged[-1] = (merged[-1][0] + piece, style)
+        elif piece:
+            merged.append((piece, style))
+    return merged
+
+
+@lru_cache(maxsize=1024)
+def layout_message(text, width, size=16, family='arial'):
+    """メッセージを width の吹き出しに折り返した MessageLayout を返す"""
+    fonts = fonts_for(size, family)
+    metrics = get_metrics(fonts[None])
+    pitch = metrics.line_height + DEFAULT_SPACING
+    code_metrics = get_metrics(fonts['code'])
+    code_pitch = code_metrics.line_height + DEFAULT_SPACING
+    bullet_indent = text_width(fonts[None], '•  ')
+
+    runs = []
+    boxes = []
+    y = 0
+    right = 0
+
+    def emit(line, x, y):
+        nonlocal right
+        for piece, style in line:
+            piece_width = text_width(fonts[style], piece)
+            if not piece.strip():
+                x += piece_width
+                continue
+            if style == 'code':
+                boxes.append(Box(x, y - 1, x + piece_width + 2 * INLINE_PADDING,
+                                 y + metrics.line_height + 1, 'inline'))
+                x += INLINE_PADDING
+            runs.append(Run(x, y, piece, style))
+            x += piece_width + (INLINE_PADDING if style == 'code' else 0)
+        right = max(right, x)
+
+    for block in parse(text):
+        if block.kind == 'blank':
+            y += pitch // 2
+        elif block.kind == 'code':
+            top = y + CODE_GAP
+            y = top + CODE_PADDING
+            for line in block.content:
+                for part, style in _split_word(line, 'code', fonts['code'], width - 2 * CODE_PADDING) or [('', 'code')]:
+                    runs.append(Run(CODE_PADDING, y, part, 'code'))
+                    y += code_pitch
+            y += CODE_PADDING - DEFAULT_SPACING
+            boxes.append(Box(0, top, width, y, 'code'))
+            right = width
+            y += CODE_GAP
+        else:
+            indent = bullet_indent if block.kind == 'bullet' else 0
+            spans = block.content
+            if block.kind == 'heading':
+                spans = tuple(Span(span.text, span.style or 'bold') for span in spans)
+            if block.kind == 'bullet':
+                runs.append(Run(0, y, '•', None))
+            for line in _wrap_spans(spans, fonts, width - indent):
+                emit(line, indent, y)
+                y += pitch
+
+    # 最後の行の後の行間は含めない
+    height = max(y - DEFAULT_SPACING, 0)
+    return MessageLayout(min(right, width), height, tuple(runs), tuple(boxes))
+
+
+def _mix(color, target, amount):
+    return tuple(round(c + (t - c) * amount) for c, t in zip(color[:3], target))
+
+
+def draw_message(draw, xy, layout, fill, background, size=16, family='arial'):
+    """layout_message() の結果を xy を原点に描く
+
+    fill は文字色、background は吹き出しの色（コードの背景はここから暗く・明るくした色にする）。
+    """
+    fonts = fonts_for(size, family)
+    x0, y0 = xy
+    backgrounds = {
+        'code': _mix(background, (0, 0, 0), 0.45),
+        'inline': _mix(background, (255, 255, 255), 0.15),
+    }
+    for box in layout.boxes:
+        draw.rounded_rectangle([(x0 + box.x1, y0 + box.y1), (x0 + box.x2, y0 + box.y2)],
+                               8 if box.kind == 'code' else 4, fill=backgrounds[box.kind])
+    for run in layout.runs:
+        draw.text((x0 + run.x, y0 + run.y), run.text, fill=fill, font=fonts[run.style])
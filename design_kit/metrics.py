@@ -0,0 +1,161 @@
+"""
+テキスト計測
+
+フォントごとにグリフの送り幅をキャッシュし、文字列幅を送り幅の合計として求める。
+カーニング情報を持つフェイスだけ、隣接する文字ペアの補正量（こちらもキャッシュ）を加える。
+フェイスにない文字はフォールバックフォントの送り幅を使う。
+複数の文字列をまとめて計測する measure() で、吹き出し1画面分のレイアウトを1回の呼び出しで計算できる。
+"""
+
+import weakref
+from collections import namedtuple
+
+from PIL import ImageFont
+
+from .fallback import font_for, split_runs
+from .font_index import get_index
+from .fonts import font_face
+
+# 計測結果: 幅・高さ（行間込み）・行数
+TextSize = namedtuple('TextSize', 'width height lines')
+
+# 複数行テキストの既定の行間 (Pillow の multiline_text と同じ)
+DEFAULT_SPACING = 4
+
+
+def _needs_kerning(font):
+    """フェイスがカーニング情報を持つか（索引にないフォントは持つものとして扱う）"""
+    face = font_face(font)
+    if face is None:
+        return True
+    info = get_index().face_info(*face)
+    return info is None or info.get('kerning', True)
+
+
+class GlyphMetrics:
+    """1つのフォント（フェイス・サイズ）のグリフ送り幅キャッシュ"""
+
+    def __init__(self, font):
+        self.font = font
+        self.ascent, self.descent = font.getmetrics()
+        self.line_height = self.ascent + self.descent
+        # Raqm レイアウトでは合字などで幅が加算的にならないため文字列ごとに計測する
+        self.shaped = getattr(font, 'layout_engine', None) == ImageFont.Layout.RAQM
+        self.kerning = _needs_kerning(font)
+        self.hits = 0
+        self.misses = 0
+        self._advances = {}
+        self._pairs = {}
+        self._shaped = {}
+        self._fallback = set()
+
+    def _advance(self, ch):
+        advance = self._advances.get(ch)
+        if advance is None:
+            self.misses += 1
+            font = font_for(self.font, ch)
+            if font is not self.font:
+                self._fallback.add(ch)
+            advance = self._advances[ch] = font.getlength(ch)
+        else:
+            self.hits += 1
+        return advance
+
+    def _kern(self, pair):
+        adjust = self._pairs.get(pair)
+        if adjust is None:
+            if pair[0] in self._fallback or pair[1] in self._fallback:
+                adjust = 0
+            else:
+                adjust = self.font.getlength(pair) - self._advance(pair[0]) - self._advance(pair[1])
+            self._pairs[pair] = adjust
+        return adjust
+
+    def width(self, text):
+        """1行の文字列幅"""
+        if self.shaped:
+            width = self._shaped.get(text)
+            if width is None:
+                width = self._shaped[text] = sum(font.getlength(run) for font, run in split_runs(text, self.font))
+            return width
+
+        width = sum(map(self._advance, text))
+        if self.kerning:
+            width += sum(self._kern(text[i:i + 2]) for i in range(len(text) - 1))
+        return width
+
+    def prefix(self, text):
+        """text の累積幅 (len(text) + 1 個) と、各文字とその前の文字の間のカーニング
+
+        text[start:end] の幅は prefix[end] - prefix[start] - kerns[start] で求まる。
+        シェーピングするフォント (Raqm) では送り幅とカーニングの合計による近似になる。
+        """
+        prefix = [0.0]
+        kerns = [0.0]
+        for i, ch in enumerate(text):
+            kern = self._kern(text[i - 1:i + 1]) if i and self.kerning else 0.0
+            if i:
+                kerns.append(kern)
+            prefix.append(prefix[-1] + self._advance(ch) + kern)
+        return prefix, kerns
+
+    def widths(self, texts):
+        """複数の1行文字列の幅"""
+        return [self.width(text) for text in texts]
+
+    def size(self, text, spacing=DEFAULT_SPACING):
+        """改行を含む文字列の TextSize"""
+        lines = text.split('\n')
+        height = len(lines) * self.line_height + (len(lines) - 1) * spacing
+        return TextSize(max(map(self.width, lines)), height, len(lines))
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'glyphs': len(self._advances),
+            'pairs': len(self._pairs),
+            'kerning': self.kerning,
+        }
+
+
+_metrics = weakref.WeakKeyDictionary()
+
+
+def get_metrics(font):
+    """フォントに対応する GlyphMetrics（フォントごとに1つだけ作る）"""
+    metrics = _metrics.get(font)
+    if metrics is None:
+        metrics = _metrics[font] = GlyphMetrics(font)
+    return metrics
+
+
+def text_width(font, text):
+    """1行の文字列幅"""
+    return get_metrics(font).width(text)
+
+
+def line_height(font):
+    """1行の高さ (ascent + descent)"""
+    return get_metrics(font).line_height
+
+
+def baseline(font, y, anchor=None):
+    """anchor の縦位置からベースラインの y 座標を求める"""
+    ascent, descent = font.getmetrics()
+    vertical = (anchor or 'la')[1]
+    if vertical in 'at':
+        return y + ascent
+    if vertical == 'm':
+        return y + (ascent - descent) / 2
+    if vertical in 'bd':
+        return y - descent
+    return y
+
+
+def measure(font, texts, spacing=DEFAULT_SPACING):
+    """複数の文字列をまとめて計測し、TextSize のリストを返す"""
+    metrics = get_metrics(font)
+    return [metrics.size(text, spacing) for text in texts]
@@ -0,0 +1,24 @@
+"""
+プロジェクト・キャッシュのパス設定
+"""
+
+import os
+
+# リポジトリのルート
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# プロジェクト同梱フォントの置き場所
+PROJECT_FONT_DIR = os.path.join(PROJECT_ROOT, "fonts")
+
+# 索引やビルド結果などの永続キャッシュ (MINDBRIDGE_CACHE_DIR で上書き可能)
+CACHE_DIR = os.environ.get(
+    "MINDBRIDGE_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "mindbridge"),
+)
+
+
+def cache_path(*parts):
+    """キャッシュディレクトリ内のパスを返す（親ディレクトリは作成済み）"""
+    path = os.path.join(CACHE_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
@@ -0,0 +1,329 @@
+"""
+PDF 書き出し
+
+VectorCanvas の要素を1ページの PDF にする（外部ライブラリは使わない）。
+
+- 図形はパス、線形・放射状グラデーションは Shading（type 2 / 3）としてパスでクリップして塗る
+- テキストは Type0 (Identity-H) のテキストとして書き、使ったグリフだけを残したサブセットを埋め込む。
+  TrueType は CIDFontType2（CID = グリフ ID）、CFF は CIDFontType0 で、CID-keyed の CFF
+  （ヒラギノなど）では charset の CID を、名前で引く CFF ではグリフ ID を文字コードにする。
+  ToUnicode を付けるため、PDF からテキストを検索・コピーできる
+- 画像は FlateDecode、アルファは SMask にする
+
+PDF の座標系は上向きのため、ページの先頭で y 軸を反転し、VectorCanvas と同じ左上原点の座標で書く。
+グラデーションのカラーストップのアルファは PDF では扱わない（不透明として塗る）。
+"""
+
+import math
+import struct
+import zlib
+
+from .fonts import font_face
+from .gradients import parse_color
+from .sfnt import cff_cids, glyph_map, read_tables, subset_cff, subset_truetype
+from .vector import _n
+
+# 円弧をベジェ曲線で近似するときの係数
+KAPPA = 0.5522847498
+
+
+def _rgb(color):
+    return ' '.join(_n(c / 255) for c in color[:3])
+
+
+class EmbeddedFont:
+    """PDF に埋め込む1つのフェイスと、使ったグリフ"""
+
+    def __init__(self, path, index, name):
+        self.tables = read_tables(path, index)
+        self.name = ''.join(ch for ch in name if ch.isalnum() or ch in '-_') or 'Font'
+        self.cff = 'glyf' not in self.tables
+        self.cmap = glyph_map(self.tables['cmap'])
+        head, hhea = self.tables['head'], self.tables['hhea']
+        self.units = struct.unpack_from('>H', head, 18)[0]
+        self.bbox = struct.unpack_from('>4h', head, 36)
+        self.ascent, self.descent = struct.unpack_from('>hh', hhea, 4)
+        self.metrics_count = struct.unpack_from('>H', hhea, 34)[0]
+        # CID-keyed の CFF では PDF の文字コード (CID) を charset でグリフに対応付ける
+        self.cids = cff_cids(self.tables['CFF ']) if self.cff else None
+        self.used = {}
+
+    def code(self, glyph):
+        """グリフ ID に対応する PDF の文字コード (CID)"""
+        return self.cids[glyph] if self.cids else glyph
+
+    def encode(self, text):
+        """text を文字コードの16進文字列にし、使ったグリフを記録する"""
+        codes = []
+        for ch in text:
+            glyph = self.cmap.get(ord(ch), 0)
+            self.used.setdefault(glyph, ch)
+            codes.append(f'{self.code(glyph):04X}')
+        return ''.join(codes)
+
+    def advance(self, glyph):
+        hmtx = self.tables['hmtx']
+        index = min(glyph, self.metrics_count - 1)
+        return struct.unpack_from('>H', hmtx, 4 * index)[0]
+
+    def scaled(self, value):
+        return round(value * 1000 / self.units)
+
+    def font_file(self):
+        """埋め込むフォントのバイト列（使ったグリフだけを残したサブセット）"""
+        if self.cff:
+            return subset_cff(self.tables, self.used)
+        return subset_truetype(self.tables, self.used)
+
+
+# --- PDF ---
+
+class PdfWriter:
+    """VectorCanvas を1ページの PDF にする"""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.objects = []
+        self.fonts = {}
+        self.states = {}
+        self.shadings = []
+        self.images = []
+        self.content = []
+
+    def _add(self, body):
+        self.objects.append(body)
+        return len(self.objects)
+
+    def _stream(self, data, entries='', compress=True):
+        if compress:
+            data = zlib.compress(data, 9)
+            entries += ' /Filter /FlateDecode'
+        return self._add(f'<< /Length {len(data)}{entries} >>\nstream\n'.encode('latin-1') + data + b'\nendstream')
+
+    def write(self):
+        width, height = self.canvas.size
+        self.content.append(f'1 0 0 -1 0 {_n(height)} cm')
+        for item in self.canvas.items:
+            getattr(self, f'_{type(item).__name__.lower()}')(item)
+
+        content = self._stream('\n'.join(self.content).encode('latin-1'))
+        resources = self._resources()
+        pages = len(self.objects) + 2
+        page = self._add(f'<< /Type /Page /Parent {pages} 0 R /MediaBox [0 0 {_n(width)} {_n(height)}] '
+                         f'/Resources {resources} /Contents {content} 0 R >>'.encode('latin-1'))
+        self._add(f'<< /Type /Pages /Kids [{page} 0 R] /Count 1 >>'.encode('latin-1'))
+        catalog = self._add(f'<< /Type /Catalog /Pages {pages} 0 R >>'.encode('latin-1'))
+
+        out = bytearray(b'%PDF-1.6\n%\xe2\xe3\xcf\xd3\n')
+        offsets = []
+        for number, body in enumerate(self.objects, 1):
+            offsets.append(len(out))
+            out += f'{number} 0 obj\n'.encode('latin-1') + body + b'\nendobj\n'
+        xref = len(out)
+        out += f'xref\n0 {len(self.objects) + 1}\n0000000000 65535 f \n'.encode('latin-1')
+        out += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode('latin-1')
+        out += (f'trailer\n<< /Size {len(self.objects) + 1} /Root {catalog} 0 R >>\n'
+                f'startxref\n{xref}\n%%EOF\n').encode('latin-1')
+        return bytes(out)
+
+    def _resources(self):
+        fonts = ' '.join(f'/F{i} {self._font_object(font)} 0 R' for i, font in enumerate(self.fonts.values()))
+        states = ' '.join(f'/GS{i} {self._add(f"<< /Type /ExtGState /ca {_n(fill)} /CA {_n(stroke)} >>".encode())} 0 R'
+                          for i, (fill, stroke) in enumerate(self.states))
+        shadings = ' '.join(f'/Sh{i} {self._shading_object(*shading)} 0 R' for i, shading in enumerate(self.shadings))
+        images = ' '.join(f'/Im{i} {self._image_object(image)} 0 R' for i, image in enumerate(self.images))
+        return (f'<< /Font << {fonts} >> /ExtGState << {states} >> /Shading << {shadings} >> '
+                f'/XObject << {images} >> >>')
+
+    # --- 塗り・線の状態 ---
+
+    def _alpha(self, fill=1.0, stroke=1.0):
+        key = (round(fill, 3), round(stroke, 3))
+        if key == (1.0, 1.0):
+            return
+        if key not in self.states:
+            self.states[key] = len(self.states)
+        self.content.append(f'/GS{self.states[key]} gs')
+
+    def _fill(self, path, color):
+        self.content.append('q')
+        self._alpha(fill=color[3] / 255)
+        self.content.append(f'{_rgb(color)} rg {path} f Q')
+
+    def _stroke(self, path, color, width, cap=0):
+        self.content.append('q')
+        self._alpha(stroke=color[3] / 255)
+        self.content.append(f'{_rgb(color)} RG {_n(width)} w {cap} J {path} S Q')
+
+    # --- パス ---
+
+    @staticmethod
+    def _rect_path(box, radius=0):
+        x1, y1, x2, y2 = box
+        radius = max(0, min(radius, (x2 - x1) / 2, (y2 - y1) / 2))
+        if not radius:
+            return f'{_n(x1)} {_n(y1)} {_n(x2 - x1)} {_n(y2 - y1)} re'
+        k = radius * (1 - KAPPA)
+        return ' '.join([
+            f'{_n(x1 + radius)} {_n(y1)} m',
+            f'{_n(x2 - radius)} {_n(y1)} l',
+            f'{_n(x2 - k)} {_n(y1)} {_n(x2)} {_n(y1 + k)} {_n(x2)} {_n(y1 + radius)} c',
+            f'{_n(x2)} {_n(y2 - radius)} l',
+            f'{_n(x2)} {_n(y2 - k)} {_n(x2 - k)} {_n(y2)} {_n(x2 - radius)} {_n(y2)} c',
+            f'{_n(x1 + radius)} {_n(y2)} l',
+            f'{_n(x1 + k)} {_n(y2)} {_n(x1)} {_n(y2 - k)} {_n(x1)} {_n(y2 - radius)} c',
+            f'{_n(x1)} {_n(y1 + radius)} l',
+            f'{_n(x1)} {_n(y1 + k)} {_n(x1 + k)} {_n(y1)} {_n(x1 + radius)} {_n(y1)} c h',
+        ])
+
+    @staticmethod
+    def _ellipse_path(box):
+        x1, y1, x2, y2 = box
+        cx, cy, rx, ry = (x1 + x2) / 2, (y1 + y2) / 2, (x2 - x1) / 2, (y2 - y1) / 2
+        kx, ky = rx * KAPPA, ry * KAPPA
+        return ' '.join([
+            f'{_n(cx + rx)} {_n(cy)} m',
+            f'{_n(cx + rx)} {_n(cy + ky)} {_n(cx + kx)} {_n(cy + ry)} {_n(cx)} {_n(cy + ry)} c',
+            f'{_n(cx - kx)} {_n(cy + ry)} {_n(cx - rx)} {_n(cy + ky)} {_n(cx - rx)} {_n(cy)} c',
+            f'{_n(cx - rx)} {_n(cy - ky)} {_n(cx - kx)} {_n(cy - ry)} {_n(cx)} {_n(cy - ry)} c',
+            f'{_n(cx + kx)} {_n(cy - ry)} {_n(cx + rx)} {_n(cy - ky)} {_n(cx + rx)} {_n(cy)} c h',
+        ])
+
+    @staticmethod
+    def _inset(box, amount):
+        x1, y1, x2, y2 = box
+        return (x1 + amount, y1 + amount, x2 - amount, y2 - amount)
+
+    # --- 要素 ---
+
+    def _rect(self, item):
+        if item.fill:
+            self._fill(self._rect_path(item.box, item.radius), item.fill)
+        if item.outline and item.width:
+            half = item.width / 2
+            self._stroke(self._rect_path(self._inset(item.box, half), max(item.radius - half, 0)), item.outline,
+                         item.width)
+
+    def _ellipse(self, item):
+        if item.fill:
+            self._fill(self._ellipse_path(item.box), item.fill)
+        if item.outline and item.width:
+            self._stroke(self._ellipse_path(self._inset(item.box, item.width / 2)), item.outline, item.width)
+
+    def _arc(self, item):
+        x1, y1, x2, y2 = self._inset(item.box, item.width / 2)
+        cx, cy, rx, ry = (x1 + x2) / 2, (y1 + y2) / 2, (x2 - x1) / 2, (y2 - y1) / 2
+        span = (item.end - item.start) % 360 or 360
+        steps = max(2, math.ceil(span / 5))
+        points = []
+        for i in range(steps + 1):
+            angle = math.radians(item.start + span * i / steps)
+            points.append((cx + rx * math.cos(angle), cy + ry * math.sin(angle)))
+        self._stroke(self._polyline_path(points), item.color, item.width)
+
+    @staticmethod
+    def _polyline_path(points):
+        (x, y), rest = points[0], points[1:]
+        return ' '.join([f'{_n(x)} {_n(y)} m', *(f'{_n(px)} {_n(py)} l' for px, py in rest)])
+
+    def _polyline(self, item):
+        self._stroke(self._polyline_path(item.points), item.color, item.width, 1 if item.round_caps else 0)
+
+    def _text(self, item):
+        face = font_face(item.font)
+        if face is None:
+            return
+        key = face
+        if key not in self.fonts:
+            family, style = item.font.getname()
+            self.fonts[key] = EmbeddedFont(face[0], face[1], f'{family}-{style}')
+        font = self.fonts[key]
+        number = list(self.fonts).index(key)
+        self.content.append('q')
+        self._alpha(fill=item.fill[3] / 255)
+        self.content.append(f'{_rgb(item.fill)} rg BT /F{number} {_n(item.font.size)} Tf '
+                            f'1 0 0 -1 {_n(item.x)} {_n(item.y)} Tm <{font.encode(item.text)}> Tj ET Q')
+
+    def _picture(self, item):
+        x1, y1, x2, y2 = item.box
+        self.images.append(item.image)
+        self.content.append(f'q {_n(x2 - x1)} 0 0 {_n(y1 - y2)} {_n(x1)} {_n(y2)} cm /Im{len(self.images) - 1} Do Q')
+
+    def _gradient(self, item):
+        self.shadings.append((item.kind, item.stops, item.geometry))
+        self.content.append(f'q {self._rect_path(item.box, item.radius)} W n /Sh{len(self.shadings) - 1} sh Q')
+
+    # --- オブジェクト ---
+
+    def _function(self, stops):
+        """カラーストップを補間する関数（2色なら type 2、3色以上は type 3 でつなぐ）"""
+        colors = [parse_color(color)[:3] for _, color in stops]
+        segments = [f'<< /FunctionType 2 /Domain [0 1] /C0 [{_rgb(a)}] /C1 [{_rgb(b)}] /N 1 >>'
+                    for a, b in zip(colors, colors[1:])]
+        if len(segments) == 1:
+            return segments[0]
+        positions = [position for position, _ in stops]
+        bounds = ' '.join(_n(position) for position in positions[1:-1])
+        encode = ' '.join('0 1' for _ in segments)
+        return (f'<< /FunctionType 3 /Domain [{_n(positions[0])} {_n(positions[-1])}] '
+                f'/Functions [{" ".join(segments)}] /Bounds [{bounds}] /Encode [{encode}] >>')
+
+    def _shading_object(self, kind, stops, geometry):
+        if kind == 'linear':
+            shading_type, coords = 2, ' '.join(_n(v) for v in geometry)
+        else:
+            cx, cy, radius = geometry
+            shading_type, coords = 3, f'{_n(cx)} {_n(cy)} 0 {_n(cx)} {_n(cy)} {_n(radius)}'
+        return self._add((f'<< /ShadingType {shading_type} /ColorSpace /DeviceRGB /Coords [{coords}] '
+                          f'/Function {self._function(stops)} /Extend [true true] >>').encode('latin-1'))
+
+    def _image_object(self, image):
+        rgba = image.convert('RGBA')
+        entries = f' /Type /XObject /Subtype /Image /Width {rgba.width} /Height {rgba.height} /BitsPerComponent 8'
+        alpha = rgba.getchannel('A')
+        mask = ''
+        if alpha.getextrema()[0] < 255:
+            smask = self._stream(alpha.tobytes(), entries + ' /ColorSpace /DeviceGray')
+            mask = f' /SMask {smask} 0 R'
+        return self._stream(rgba.convert('RGB').tobytes(), entries + ' /ColorSpace /DeviceRGB' + mask)
+
+    def _font_object(self, font):
+        data = font.font_file()
+        subtype = '/Subtype /OpenType' if font.cff else f'/Length1 {len(data)}'
+        font_file = self._stream(data, ' ' + subtype)
+        # サブセットのフォント名には6文字のタグを付ける
+        tag = ''.join(chr(ord('A') + (sum(font.used) + i * 7) % 26) for i in range(6))
+        name = f'{tag}+{font.name}'
+        bbox = ' '.join(str(font.scaled(v)) for v in font.bbox)
+        descriptor = self._add((
+            f'<< /Type /FontDescriptor /FontName /{name} /Flags 4 /FontBBox [{bbox}] /ItalicAngle 0 '
+            f'/Ascent {font.scaled(font.ascent)} /Descent {font.scaled(font.descent)} '
+            f'/CapHeight {font.scaled(font.ascent)} /StemV 80 '
+            f'/{"FontFile3" if font.cff else "FontFile2"} {font_file} 0 R >>').encode('latin-1'))
+        widths = ' '.join(f'{font.code(glyph)} [{font.scaled(font.advance(glyph))}]'
+                          for glyph in sorted(font.used, key=font.code))
+        cid_font = self._add((
+            f'<< /Type /Font /Subtype /{"CIDFontType0" if font.cff else "CIDFontType2"} /BaseFont /{name} '
+            f'/CIDSystemInfo << /Registry (Adobe) /Ordering (Identity) /Supplement 0 >> '
+            f'/FontDescriptor {descriptor} 0 R /W [{widths}]'
+            f'{"" if font.cff else " /CIDToGIDMap /Identity"} >>').encode('latin-1'))
+        to_unicode = self._stream(self._to_unicode(font).encode('latin-1'))
+        return self._add((f'<< /Type /Font /Subtype /Type0 /BaseFont /{name} /Encoding /Identity-H '
+                          f'/DescendantFonts [{cid_font} 0 R] /ToUnicode {to_unicode} 0 R >>').encode('latin-1'))
+
+    @staticmethod
+    def _to_unicode(font):
+        lines = ['/CIDInit /ProcSet findresource begin', '12 dict begin', 'begincmap',
+                 '/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def',
+                 '/CMapName /Adobe-Identity-UCS def', '/CMapType 2 def',
+                 '1 begincodespacerange', '<0000> <FFFF>', 'endcodespacerange']
+        entries = sorted((font.code(glyph), ch) for glyph, ch in font.used.items())
+        for start in range(0, len(entries), 100):
+            chunk = entries[start:start + 100]
+            lines.append(f'{len(chunk)} beginbfchar')
+            for code, ch in chunk:
+                utf16 = ch.encode('utf-16-be').hex().upper()
+                lines.append(f'<{code:04X}> <{utf16}>')
+            lines.append('endbfchar')
+        lines += ['endcmap', 'CMapName currentdict /CMap defineresource pop', 'end', 'end']
+        return '\n'.join(lines)
@@ -0,0 +1,1005 @@
+"""
+宣言的なシーン仕様とインタプリタ
+
+デモ画面をステータスバー・ナビゲーションバー・吹き出し・カード・リストなどのブロックを並べた
+JSON (screenshots/scenes/*.json) で記述し、SceneRenderer が上から順にレイアウトして描画する。
+ブロックの y 座標は直前のブロックの高さと間隔から決まるため、仕様に絶対座標は書かない。
+文字列で書いたテキストは実測した幅で折り返し、画面に収まらないブロックは次のページ (name_2.png …) に送る。
+新しい画面は JSON を追加するだけで作れ、`python -m design_kit.scene` でまとめて描画できる。
+`python -m design_kit.watch` を起動しておくと、仕様や会話を編集するたびに依存するシーンだけを描き直す。
+座標と文字サイズはポイント単位で、`--devices all` を付けると端末プロファイルごとの
+実際のピクセル密度で screenshots/<端末名>/ に描画する（省略時は iPhone 14 Pro を 1 倍で描く）。
+`--vector svg,pdf` を付けると同じ画面を SVG / PDF でも書き出す（テキストはテキスト、グラデーションは
+グラデーションのまま。影とグローはラスタのレイヤー合成でだけ描く）。
+
+会話は "conversation" で会話コーパス (design_kit.corpus) の ID を指定すると、メッセージを
+user / assistant のひな形の吹き出しにして blocks の後ろに並べる。`--corpus scenario=cooking,locale=ja`
+を付けると、--template のシーンにタグが一致する会話を1つずつ流し込んで screenshots/corpus/ にまとめて描く。
+
+    "conversation": {"id": "chat_screen_greeting", "limit": 4,
+                     "user": {"left": 80},
+                     "assistant": {"right": 80, "items": [{"text": "Qwen3", "size": 12}], "message": {"size": 15}}}
+
+アプリと同じ文言は {"localized": "settings_title"} と書くと、"locale"（省略時は ja）の
+Localizable.strings (design_kit.strings) から引いた文字列になる。
+
+    "nav": {"title": {"localized": "settings_title"}, "fill": "card_white"}
+
+仕様の例:
+
+    {
+      "name": "cooking_assistant",
+      "theme": "dark",
+      "status_bar": {"time": "9:41"},
+      "nav": {"title": "料理アシスタント", "size": 16},
+      "blocks": [
+        {"type": "user", "lines": ["簡単な親子丼の", "作り方を教えて 🍳"]},
+        {"type": "assistant", "accent": "accent_orange", "icon": "👨‍🍳", "label": "料理シェフモード",
+         "items": [{"text": "🥘 材料（2人分）：", "size": 13, "bold": true, "color": "accent_green"},
+                   {"list": ["• 鶏もも肉 200g", "• 玉ねぎ 1個"]}]}
+      ]
+    }
+"""
+
+import argparse
+import json
+import os
+from collections import namedtuple
+from contextlib import contextmanager
+
+from PIL import Image
+
+from .chrome import chrome_layers
+from .compositor import Compositor
+from .corpus import ConversationNotFoundError, get_corpus, parse_tags
+from .devices import DEFAULT_DEVICE, PointDraw, device_names, get_device
+from .displaylist import DisplayList, report as display_report
+from .effects import drop_shadow, glow
+from .fonts import get_font
+from .gradients import create_gradient, parse_color
+from .layout import flow, layout_cache, wrap_text
+from .markdown import draw_message, layout_message
+from .metrics import text_width
+from .paths import PROJECT_ROOT
+from .sdf import ShapeBatch
+from .shapes import rounded_rect_mask
+from .strings import DEFAULT_LOCALE, StringNotFoundError, StringsError, get_strings, localized_keys, resolve
+from .textcache import text_runs
+from .vector import VectorCanvas
+
+# シーン仕様の置き場所と出力先（出力先はカレントディレクトリからの相対パス）
+SCENE_DIR = os.path.join(PROJECT_ROOT, "screenshots", "scenes")
+OUTPUT_DIR = "screenshots"
+
+# コーパスの会話をまとめて描くときの既定のシーンと出力先（OUTPUT_DIR からの相対パス）
+CORPUS_TEMPLATE = "chat_screen"
+CORPUS_DIR = "corpus"
+
+# ページ下端（入力欄または安全領域の上端）とブロックの間に最低限あける余白
+PAGE_MARGIN = 10
+
+THEMES = {
+    'dark': {
+        'colors': {
+            'bg_primary': "#0A0A0A",
+            'bg_secondary': "#1C1C1E",
+            'card_dark': "#2C2C2E",
+            'card_light': "#3A3A3C",
+            'accent_blue': "#007AFF",
+            'accent_purple': "#AF52DE",
+            'accent_green': "#30D158",
+            'accent_orange': "#FF9F0A",
+            'accent_red': "#FF453A",
+            'accent_pink': "#FF2D92",
+            'accent_cyan': "#32D74B",
+            'text_primary': "#FFFFFF",
+            'text_secondary': "#8E8E93",
+            'text_tertiary': "#48484A",
+            'user_bubble': "#007AFF",
+            'ai_bubble': "#2C2C2E",
+            'user_text': "#FFFFFF",
+            'success': "#30D158",
+            'warning': "#FF9F0A",
+            'error': "#FF453A",
+        },
+        'style': {
+            'family': 'hiragino',
+            'background': ['bg_primary', 'bg_secondary'],
+            'bubble_radius': 18,
+            'message_size': 14,
+            'time_align': 'left',
+            'time_bold': True,
+            'nav_size': 18,
+            'nav_inset': 25,
+            'accent': 'accent_blue',
+        },
+    },
+    'light': {
+        'colors': {
+            'background': "#F2F2F7",
+            'card_white': "#FFFFFF",
+            'user_bubble': "#007AFF",
+            'ai_bubble': "#E9E9EB",
+            'user_text': "#FFFFFF",
+            'text_primary': "#000000",
+            'text_secondary': "#8E8E93",
+            'accent': "#007AFF",
+            'separator': "#E5E5EA",
+        },
+        'style': {
+            'family': 'hiragino',
+            'background': 'background',
+            'bubble_radius': 16,
+            'message_size': 15,
+            'time_align': 'center',
+            'time_bold': False,
+            'nav_size': 17,
+            'nav_inset': 20,
+            'accent': 'accent',
+        },
+    },
+}
+
+# 本文アイテムの種類（アイテムの辞書に含まれるキーで判定する）
+ITEM_KINDS = ('text', 'markdown', 'list', 'entries', 'rows', 'row', 'code', 'banner', 'bar', 'toggle', 'check', 'dots',
+              'space')
+
+# 本文アイテムを並べる範囲: 左端・右端・既定の字下げ
+Frame = namedtuple('Frame', 'left right indent')
+
+
+class SceneError(ValueError):
+    """シーン仕様を解釈できない"""
+
+
+def scene_path(name):
+    """シーン名から仕様ファイルのパスを返す（パスを渡した場合はそのまま）"""
+    if name.endswith('.json'):
+        return name
+    return os.path.join(SCENE_DIR, name + '.json')
+
+
+def scene_names():
+    """SCENE_DIR にあるシーン名の一覧"""
+    return sorted(f[:-5] for f in os.listdir(SCENE_DIR) if f.endswith('.json'))
+
+
+def load_scene(path):
+    """仕様ファイルを読み込み、name / output を補った辞書を返す"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            spec = json.load(f)
+    except ValueError as exc:
+        raise SceneError(f"シーン仕様を読み込めません: {path} ({exc})") from exc
+    if not isinstance(spec, dict) or not isinstance(spec.get('blocks', []), list):
+        raise SceneError(f"シーン仕様の形式が不正です: {path}")
+    spec.setdefault('name', os.path.splitext(os.path.basename(path))[0])
+    spec.setdefault('output', spec['name'] + '.png')
+    return spec
+
+
+def conversation_blocks(options):
+    """コーパスの会話を options の user / assistant のひな形で吹き出しブロックのリストにする
+
+    assistant のひな形の message はメッセージ本文のアイテムの既定値で、items の後ろに足す。
+    markdown が真なら本文を Markdown のアイテムにする（コードブロック・箇条書き・太字を描く）。
+    """
+    if isinstance(options, str):
+        options = {'id': options}
+    try:
+        conversation = get_corpus().get(options['id'])
+    except ConversationNotFoundError as exc:
+        raise SceneError(str(exc)) from None
+    blocks = []
+    for message in conversation.messages[:options.get('limit')]:
+        if message.sender == 'user':
+            blocks.append(dict({'type': 'user'}, **options.get('user', {}), text=message.text))
+        else:
+            block = dict({'type': 'assistant'}, **options.get('assistant', {}))
+            item = dict(block.pop('message', {}), **{'markdown' if options.get('markdown') else 'text': message.text})
+            block['items'] = block.get('items', []) + [item]
+            blocks.append(block)
+    return blocks
+
+
+def scene_inputs(spec):
+    """仕様がシーンの外から読む入力: ('conversation', ID) と ('strings', ロケール, キー)"""
+    inputs = []
+    if 'conversation' in spec:
+        options = spec['conversation']
+        inputs.append(('conversation', options if isinstance(options, str) else options.get('id')))
+    locale = spec.get('locale', DEFAULT_LOCALE)
+    inputs.extend(('strings', locale, key) for key in dict.fromkeys(localized_keys(spec)))
+    return inputs
+
+
+def input_value(item):
+    """scene_inputs() の入力の現在の内容（会話・キーがない場合は None）"""
+    if item[0] == 'conversation':
+        corpus = get_corpus()
+        return corpus.get(item[1]) if item[1] in corpus else None
+    try:
+        return get_strings(item[1]).get(item[2])
+    except StringsError:
+        return None
+
+
+class SceneRenderer:
+    """シーン仕様を1枚の画像に描画する"""
+
+    def __init__(self, spec, device=None):
+        theme = spec.get('theme', 'dark')
+        if theme not in THEMES:
+            raise SceneError(f"未知のテーマです: {theme}")
+        try:
+            spec = resolve(spec, spec.get('locale', DEFAULT_LOCALE))
+        except (StringsError, StringNotFoundError) as exc:
+            raise SceneError(str(exc)) from None
+        if 'conversation' in spec:
+            spec = dict(spec, blocks=spec.get('blocks', []) + conversation_blocks(spec['conversation']))
+        self.spec = spec
+        self.colors = dict(THEMES[theme]['colors'], **spec.get('colors', {}))
+        self.style = dict(THEMES[theme]['style'], **spec.get('style', {}))
+        self.family = spec.get('font_family', self.style['family'])
+        # 端末を指定しない場合は既定の端末を 1 倍（1 ポイント = 1 ピクセル）で描く
+        self.device = get_device(device or DEFAULT_DEVICE)
+        self.scale = self.device.scale if device else 1
+        self.width, self.height = spec.get('size', self.device.size)
+        self.safe_top, self.safe_bottom = self.device.safe_top, self.device.safe_bottom
+        self.pixels = (round(self.width * self.scale), round(self.height * self.scale))
+        self.theme = [self.family, self.colors, self.style]
+        self.screen = Frame(0, self.width, 25)
+        self.image = None
+        self.canvas = None
+        self.vector = None
+        self.draw = None
+
+    # --- 基本要素 ---
+
+    def color(self, value):
+        """テーマの色名・'#RRGGBB'・[r, g, b, a] を描画用の色に変換"""
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return self.colors.get(value, value)
+        return tuple(value)
+
+    def font(self, size, bold=False):
+        return get_font(size, bold, self.family)
+
+    def text(self, xy, text, size, color='text_primary', bold=False, anchor='lt'):
+        self.draw.text(xy, text, fill=self.color(color), anchor=anchor, font=self.font(size, bold))
+
+    def _is_gradient(self, fill):
+        return isinstance(fill, list) and fill and not isinstance(fill[0], int)
+
+    def _is_translucent(self, fill):
+        color = self.color(fill)
+        return color is not None and len(parse_color(color)) == 4 and parse_color(color)[3] < 255
+
+    def box(self, box, fill=None, outline=None, width=1, radius=0, shadow=False):
+        """矩形（座標は右下を含む）。fill に色のリストを渡すと縦グラデーション"""
+        x1, y1, x2, y2 = (int(round(v)) for v in box)
+        if shadow and self.canvas is not None:
+            px1, py1, px2, py2 = self.pixel_box((x1, y1, x2, y2))
+            mask = rounded_rect_mask(px2 - px1, py2 - py1, round(self.draw.px(radius)))
+            self.draw.call(None, drop_shadow, self.canvas, mask, (px1, py1), radius=round(self.draw.px(12)),
+                           offset=(0, round(self.draw.px(6))))
+        if self._is_gradient(fill):
+            self.gradient((x1, y1, x2, y2), fill, radius)
+            fill = None
+        elif self.canvas is not None and self._is_translucent(fill):
+            pixel_box = self.pixel_box((x1, y1, x2 + 1, y2 + 1))
+            self.draw.call(pixel_box, self.canvas.fill, pixel_box, self.color(fill), radius=round(self.draw.px(radius)))
+            fill = None
+        if fill is None and outline is None:
+            return
+        outline = self.color(outline)
+        if radius:
+            self.draw.rounded_rectangle([(x1, y1), (x2, y2)], radius=radius, fill=self.color(fill),
+                                        outline=outline, width=width if outline else 0)
+        else:
+            self.draw.rectangle([(x1, y1), (x2, y2)], fill=self.color(fill), outline=outline,
+                                width=width if outline else 0)
+
+    def pixel_box(self, box):
+        """ポイント単位の矩形（右下を含まない）をピクセル単位の整数の矩形に変換"""
+        x1, y1 = self.draw.point(*box[:2])
+        x2, y2 = self.draw.point(*box[2:])
+        return round(x1), round(y1), round(x2), round(y2)
+
+    def gradient(self, box, colors, radius=0, direction='vertical'):
+        x1, y1, x2, y2 = self.pixel_box((box[0], box[1], box[2] + 1, box[3] + 1))
+        size = (x2 - x1, y2 - y1)
+        radius = round(self.draw.px(radius))
+        if self.vector is not None:
+            self.vector.linear_gradient((x1, y1, x2, y2), [self.color(colors[0]), self.color(colors[-1])], direction,
+                                        min(radius, size[0] // 2, size[1] // 2))
+            return
+        layer = create_gradient(*size, self.color(colors[0]), self.color(colors[-1]), direction)
+        mask = rounded_rect_mask(*size, min(radius, size[0] // 2, size[1] // 2)) if radius else None
+        if self.canvas is not None:
+            if mask is not None:
+                layer.putalpha(mask)
+            self.draw.call((x1, y1, x2, y2), self.canvas.composite, layer, (x1, y1))
+        else:
+            self.draw.paste(layer, (x1, y1), mask)
+
+    def circle(self, center, radius, fill, outline=None, width=1):
+        self.draw.circle(center, radius, fill=self.color(fill), outline=self.color(outline),
+                         width=width if outline else 0)
+
+    # --- 画面全体 ---
+
+    def render(self):
+        """1ページ目を描画した RGB 画像を返す"""
+        return self.render_pages()[0]
+
+    def render_pages(self):
+        """ページごとに描画した RGB 画像のリストを返す"""
+        return [self.render_page(placements) for placements in self.pages()]
+
+    def render_vector_pages(self):
+        """ページごとに描画した VectorCanvas のリストを返す（座標はポイント単位）"""
+        return [self.render_vector(placements) for placements in self.pages()]
+
+    def pages(self):
+        """ブロックを計測してページに分け、ページごとの (ブロック, y 座標) のリストを返す
+
+        ブロックは上から積み、入力欄の上端から PAGE_MARGIN 以内に収まらないものは次のページに送る。
+        """
+        spec = self.spec
+        blocks = spec.get('blocks', [])
+        bottom = self.height - self.safe_bottom - PAGE_MARGIN
+        if 'input_bar' in spec:
+            bottom -= spec['input_bar'].get('height', 60)
+        with self.column():
+            heights = [self.measure_block(block) for block in blocks]
+        pages = flow(heights, [block.get('gap', 20) for block in blocks],
+                     self.safe_top + spec.get('top', 60), bottom, [block.get('y') for block in blocks])
+        return [[(blocks[p.index], p.y) for p in page] for page in pages]
+
+    def render_page(self, placements):
+        """(ブロック, y 座標) の並びを画面の枠と一緒に描いた RGB 画像を返す"""
+        spec = self.spec
+        background = spec.get('background', self.style['background'])
+        if isinstance(background, list):
+            self.image = create_gradient(*self.pixels, self.color(background[0]), self.color(background[-1]))
+        else:
+            self.image = Image.new('RGB', self.pixels, self.color(background))
+
+        self.canvas = Compositor.from_image(self.image) if spec.get('layers') else None
+        self.vector = None
+        self.draw = PointDraw(DisplayList(self.image.size), self.scale)
+        self.paint(placements)
+
+        self.draw.optimize()
+        if self.canvas is not None:
+            self.draw.replay(self.canvas.image)
+            return self.canvas.flatten()
+        return self.draw.replay(self.image)
+
+    def render_vector(self, placements):
+        """render_page() と同じページを VectorCanvas に描いて返す"""
+        background = self.spec.get('background', self.style['background'])
+        self.image = self.canvas = None
+        self.vector = VectorCanvas((self.width, self.height))
+        self.draw = PointDraw(self.vector)
+        if isinstance(background, list):
+            self.vector.linear_gradient((0, 0, self.width, self.height),
+                                        [self.color(background[0]), self.color(background[-1])])
+        else:
+            self.vector.rectangle((0, 0, self.width - 1, self.height - 1), fill=self.color(background))
+        try:
+            self.paint(placements)
+            return self.vector
+        finally:
+            self.vector = None
+
+    def paint(self, placements):
+        """画面の枠とブロックを self.draw に描く"""
+        spec = self.spec
+        if 'status_bar' in spec:
+            self.chrome('status_bar', spec['status_bar'], self.status_bar)
+        if 'nav' in spec:
+            # タイトルは画面ごとに描くため、レイヤーのキーに含めない
+            self.chrome('nav', {k: v for k, v in spec['nav'].items() if k not in ('title', 'size')}, self.nav)
+            self.nav_title(spec['nav'])
+
+        with self.column():
+            for block, y in placements:
+                self.block(block, y, self.screen)
+
+        if 'input_bar' in spec:
+            self.chrome('bottom', spec['input_bar'], self.input_bar)
+
+    @contextmanager
+    def column(self):
+        """ブロックを端末の本文の列幅に収めて中央に置く（列の左端を x = 0 として描く）"""
+        full = self.width
+        width = min(full, self.device.content_width or full)
+        self.width = width
+        self.screen = Frame(0, width, 25)
+        if self.draw is not None:
+            self.draw.origin = ((full - width) / 2, 0)
+        try:
+            yield
+        finally:
+            self.width = full
+            if self.draw is not None:
+                self.draw.origin = (0, 0)
+
+    def measure_block(self, spec):
+        """ブロックの高さ（描画せずにディスプレイリストへの記録だけで求め、内容・幅・テーマごとにメモ化）"""
+        key = json.dumps([spec, self.width, self.theme], sort_keys=True, ensure_ascii=False)
+
+        def measure():
+            saved = self.draw
+            self.draw = PointDraw(DisplayList(self.pixels))
+            try:
+                return self.block(spec, 0, self.screen)
+            finally:
+                self.draw = saved
+
+        return layout_cache.get(key, measure)
+
+    def chrome(self, part, spec, paint):
+        """paint(spec) で描く画面の枠を、同じ見た目の画面と共有するレイヤーから合成する（ベクターでは直接描く）"""
+        if self.vector is not None:
+            paint(spec)
+            return
+        key = json.dumps([part, spec, self.width, self.height, self.scale, self.device.name, self.theme],
+                         sort_keys=True, ensure_ascii=False)
+
+        def render(draw):
+            saved = self.draw, self.canvas
+            self.draw, self.canvas = PointDraw(draw, self.scale), None
+            try:
+                paint(spec)
+            finally:
+                self.draw, self.canvas = saved
+
+        layer, origin = chrome_layers.get(key, self.pixels, render)
+        if layer is None:
+            return
+        bounds = origin + (origin[0] + layer.width, origin[1] + layer.height)
+        if self.canvas is not None:
+            self.draw.call(bounds, self.canvas.composite, layer, origin)
+        else:
+            self.draw.paste(layer, origin, layer)
+
+    def status_bar(self, spec):
+        if 'fill' in spec:
+            self.box((0, 0, self.width, self.safe_top), spec['fill'])
+        size = spec.get('size', 14)
+        bold = spec.get('bold', self.style['time_bold'])
+        # 安全領域の低い端末（ホームボタンのある iPhone・iPad）では上下中央に寄せる
+        top = min(15, (self.safe_top - size) // 2)
+        if spec.get('align', self.style['time_align']) == 'center':
+            self.text((self.width // 2, top), spec.get('time', "9:41"), size, bold=bold, anchor="mt")
+        else:
+            self.text((20, top), spec.get('time', "9:41"), size, bold=bold)
+        if 'battery' in spec:
+            self.text((self.width - 20, top), spec['battery'], 12, spec.get('battery_color', 'success'), anchor="rt")
+
+    def _label(self, value, size, color, bold=False):
+        """文字列または {"text", "size", "color", "bold"} をそろえる"""
+        if isinstance(value, str):
+            value = {'text': value}
+        return (value['text'], value.get('size', size), value.get('color', color), value.get('bold', bold))
+
+    def nav(self, spec):
+        """ナビゲーションバーの背景と左右のボタン（タイトルは nav_title で画面ごとに描く）"""
+        top, height = self.safe_top, spec.get('height', 44)
+        if 'fill' in spec:
+            self.box((0, top, self.width, top + height), spec['fill'])
+        center = top + height // 2
+        inset = spec.get('inset', self.style['nav_inset'])
+        accent = self.style['accent']
+        if 'back' in spec:
+            text, size, color, bold = self._label(spec['back'], 20, accent)
+            self.text((inset, center), text, size, color, bold, anchor="lm")
+        if 'action' in spec:
+            text, size, color, bold = self._label(spec['action'], 16, accent)
+            self.text((self.width - inset, center), text, size, color, bold, anchor="rm")
+
+    def nav_title(self, spec):
+        center = self.safe_top + spec.get('height', 44) // 2
+        text, size, color, bold = self._label(spec['title'], spec.get('size', self.style['nav_size']),
+                                              'text_primary', True)
+        self.text((self.width // 2, center), text, size, color, bold, anchor="mm")
+
+    def input_bar(self, spec):
+        height = spec.get('height', 60)
+        top = self.height - self.safe_bottom - height
+        self.box((0, top, self.width, self.height - self.safe_bottom), spec.get('fill'))
+
+        field = spec.get('field', {})
+        field_top = top + field.get('top', 10)
+        field_bottom = field_top + field.get('height', 30)
+        field_right = self.width - field.get('right', 60)
+        center = (field_top + field_bottom) // 2
+        self.box((20, field_top, field_right, field_bottom), field.get('fill'), field.get('outline'),
+                 radius=field.get('radius', 20))
+        if 'placeholder' in spec:
+            self.text((20 + field.get('padding', 10), center), spec['placeholder'], 14, 'text_secondary',
+                      anchor="lm")
+
+        send = spec.get('send')
+        if send:
+            right = self.width - send.get('right', 19)
+            if 'width' in send:
+                left = right - send['width']
+                half = send.get('height', 35) // 2
+                self.box((left, center - half, right, center + half), send.get('fill'), send.get('outline'),
+                         send.get('outline_width', 2), send.get('radius', 17))
+                x = (left + right) // 2
+            else:
+                x = right - send.get('radius', 16)
+                self.circle((x, center), send.get('radius', 16), send.get('fill'))
+            text, size, color, bold = self._label(send, 16, 'user_text')
+            self.text((x, center), text, size, color, bold, anchor="mm")
+
+    # --- ブロック ---
+
+    def block(self, spec, y, frame):
+        """ブロックを y から描き、占めた高さを返す"""
+        kind = spec.get('type')
+        if kind is None:
+            return self.item(spec, y, frame)
+        method = getattr(self, f'block_{kind}', None)
+        if method is None:
+            raise SceneError(f"未知のブロックです: {kind}")
+        return method(spec, y)
+
+    def block_user(self, spec, y):
+        """右寄せのユーザーの吹き出し（1行なら上下中央、複数行なら上から top の位置に並べる）
+
+        text を渡すと吹き出しの幅で折り返し、lines を渡すとその行をそのまま使う。
+        """
+        size = spec.get('size', self.style['message_size'])
+        left, right = spec.get('left', 60), self.width - 20
+        lines = self.lines(spec['text'] if 'text' in spec else spec['lines'], size, spec.get('bold', False),
+                           right - left - 20)
+        pitch = spec.get('pitch', 20)
+        height = spec.get('height', pitch * len(lines) + 20)
+        self.box((left, y, right, y + height), spec.get('fill', 'user_bubble'),
+                 radius=spec.get('radius', self.style['bubble_radius']), shadow=spec.get('shadow', False))
+        first = y + (spec.get('top', 15) if len(lines) > 1 else height / 2)
+        for i, line in enumerate(lines):
+            self.text((right - 10, first + i * pitch), line, size, spec.get('color', 'user_text'),
+                      spec.get('bold', False), anchor="rm")
+        return height
+
+    def block_assistant(self, spec, y):
+        """アバターと名前の見出し付きのアシスタントの吹き出し"""
+        spec = dict(spec)
+        header = 'icon' in spec or 'label' in spec
+        accent = spec.get('accent')
+        spec.setdefault('fill', 'ai_bubble')
+        spec.setdefault('outline', accent)
+        spec.setdefault('radius', self.style['bubble_radius'])
+        spec.setdefault('right', 60)
+        spec.setdefault('body_top', 50 if header else 15)
+
+        def draw_header(left, top):
+            center = top + spec.get('header', 20)
+            avatar = spec.get('avatar', 12)
+            if 'icon' in spec:
+                self.circle((left + 15, center), avatar, accent)
+                self.text((left + 15, center), spec['icon'], avatar + 2, anchor="mm")
+            if 'label' in spec:
+                self.text((left + 35, center), spec['label'], spec.get('label_size', 13), accent, True, anchor="lm")
+
+        return self.block_card(spec, y, draw_header)
+
+    def block_card(self, spec, y, decorate=None):
+        """角丸のカード。items を上から順に並べ、高さは指定がなければ中身から決める"""
+        left = spec.get('x', 20)
+        right = self.width - spec.get('right', 20)
+        frame = Frame(left, right, spec.get('indent', 10))
+        items = spec.get('items', [])
+        height = spec.get('height')
+        if height is None:
+            height = spec.get('body_top', 15) + sum(self.item(item, 0, frame, measure=True) for item in items)
+            height += spec.get('padding', 0)
+
+        box = (left, y, right, y + height)
+        self.box(box, spec.get('fill', 'card_dark'), spec.get('outline'), spec.get('width', 1),
+                 spec.get('radius', 15), spec.get('shadow', False))
+        if decorate:
+            decorate(left, y)
+        cursor = y + spec.get('body_top', 15)
+        for item in items:
+            cursor += self.item(item, cursor, frame)
+        return height
+
+    def block_metrics(self, spec, y):
+        """数値付きカードの一覧（% の値には進捗バーを付ける）。カードとバーは1回の SDF パスで描く"""
+        items = spec['items']
+        height, pitch = spec.get('height', 50), spec.get('pitch', 65)
+        left, right = spec.get('x', 20), self.width - spec.get('right', 20)
+        batch = self.canvas is None and self.vector is None
+        shapes = PointDraw(ShapeBatch(), self.scale, self.draw.origin) if batch else self.draw
+        for i, (label, value, color) in enumerate(items):
+            top = y + i * pitch
+            shapes.rounded_rectangle([(left, top), (right, top + height)], radius=12,
+                                     fill=self.color(spec.get('fill', 'card_dark')))
+            if value.endswith('%'):
+                bar = right - left - 60
+                shapes.rounded_rectangle([(left + 10, top + 32), (right - 10, top + 37)], radius=3,
+                                         fill=self.color('text_secondary'))
+                shapes.rounded_rectangle([(left + 10, top + 32), (left + 10 + bar * float(value[:-1]) / 100,
+                                                                  top + 37)], radius=3, fill=self.color(color))
+        if batch:
+            self.draw.call(self.pixel_box((left - 1, y - 1, right + 2, y + pitch * (len(items) - 1) + height + 2)),
+                           shapes.render, self.image)
+
+        for i, (label, value, color) in enumerate(items):
+            top = y + i * pitch
+            self.text((left + 10, top + 15), label, 14)
+            self.text((right - 10, top + 15), value, 14, color, True, anchor="rt")
+        return pitch * (len(items) - 1) + height
+
+    def block_button(self, spec, y):
+        height = spec.get('height', 50)
+        left = spec.get('x', 40)
+        right = self.width - left
+        self.box((left, y, right, y + height), spec.get('fill', self.style['accent']), spec.get('outline'),
+                 spec.get('width', 2), spec.get('radius', height // 2))
+        self.text((self.width // 2, y + height // 2), spec['text'], spec.get('size', 16),
+                  spec.get('color', 'text_primary'), spec.get('bold', True), anchor="mm")
+        return height
+
+    def block_logo(self, spec, y):
+        """グラデーションの角丸アイコンと1文字のロゴ（layers 指定時はグローも付ける）"""
+        size, radius = spec.get('size', 80), spec.get('radius', 20)
+        left = self.width // 2 - size // 2
+        if 'glow' in spec and self.canvas is not None:
+            px = self.draw.px
+            x1, y1, x2, _ = self.pixel_box((left, y, left + size, y + size))
+            self.draw.call(None, glow, self.canvas, rounded_rect_mask(x2 - x1, x2 - x1, round(px(radius))), (x1, y1),
+                           self.color(spec['glow']), radius=round(px(spec.get('glow_radius', 18))),
+                           spread=round(px(spec.get('glow_spread', 2))))
+        self.box((left, y, left + size - 1, y + size - 1), spec.get('fill', ['accent_blue', 'accent_purple']),
+                 radius=radius)
+        if 'outline' in spec:
+            self.box((left, y, left + size, y + size), outline=spec['outline'], width=2, radius=radius)
+        if 'letter' in spec:
+            self.text((self.width // 2, y + size // 2), spec['letter'], spec.get('letter_size', size // 2),
+                      bold=True, anchor="mm")
+        return size
+
+    def block_progress(self, spec, y):
+        height = spec.get('height', 8)
+        left = spec.get('x', 40)
+        right = self.width - left
+        radius = spec.get('radius', height // 2)
+        self.box((left, y, right, y + height), spec.get('track', 'text_tertiary'), radius=radius)
+        fill_right = left + (right - left) * spec['value']
+        fill = spec.get('fill', self.style['accent'])
+        if self._is_gradient(fill):
+            self.gradient((left, y, int(fill_right) - 1, y + height - 1), fill, direction='horizontal')
+        else:
+            self.box((left, y, fill_right, y + height), fill, radius=radius)
+        if 'label' not in spec:
+            return height
+        offset = spec.get('label_offset', 20)
+        self.text((self.width // 2, y + offset), spec['label'], spec.get('label_size', 14), 'text_secondary',
+                  anchor="mt")
+        return offset + 20
+
+    # --- 本文アイテム ---
+
+    def item(self, spec, y, frame, measure=False):
+        """本文アイテムを描き（measure なら描かずに）送り量を返す"""
+        for kind in ITEM_KINDS:
+            if kind in spec:
+                break
+        else:
+            raise SceneError(f"未知のアイテムです: {sorted(spec)}")
+        method = getattr(self, f'item_{kind}')
+        advance = method(spec, y + spec.get('dy', 0), frame, measure)
+        return spec.get('advance', advance)
+
+    def _x(self, spec, frame, offset=0):
+        return frame.left + spec.get('indent', frame.indent + offset)
+
+    def lines(self, value, size, bold, width):
+        """文字列は width に収まるように折り返し、リストは行としてそのまま使う"""
+        if isinstance(value, list):
+            return value
+        return wrap_text(value, size, bold, self.family, int(width))
+
+    def item_text(self, spec, y, frame, measure):
+        """テキスト（文字列なら本文の幅で折り返す）"""
+        size = spec.get('size', 12)
+        indent = spec.get('indent', frame.indent)
+        lines = self.lines(spec['text'], size, spec.get('bold', False), frame.right - frame.left - indent * 2)
+        pitch = spec.get('pitch', 20)
+        if not measure:
+            align = spec.get('align', 'left')
+            if align == 'center':
+                x, anchor = (frame.left + frame.right) // 2, "mt"
+            elif align == 'right':
+                x, anchor = frame.right - spec.get('indent', frame.indent), "rt"
+            else:
+                x, anchor = self._x(spec, frame), "lt"
+            for i, line in enumerate(lines):
+                self.text((x, y + i * pitch), line, size, spec.get('color', 'text_primary'), spec.get('bold', False),
+                          anchor)
+        return pitch * len(lines)
+
+    def item_markdown(self, spec, y, frame, measure):
+        """Markdown のメッセージ（コードの背景は background の色から作る）"""
+        size = spec.get('size', 14)
+        indent = spec.get('indent', frame.indent)
+        layout = layout_message(spec['markdown'], int(frame.right - frame.left - indent * 2), size, self.family)
+        if not measure:
+            background = parse_color(self.color(spec.get('background', 'ai_bubble')))
+            draw_message(self.draw, (frame.left + indent, y), layout, self.color(spec.get('color', 'text_primary')),
+                         background, size, self.family)
+        return layout.height + spec.get('gap', 5)
+
+    def item_list(self, spec, y, frame, measure):
+        """箇条書き（長い項目は折り返し、続きの行は行頭記号の後ろにそろえる）"""
+        pitch = spec.get('pitch', 18)
+        size, bold = spec.get('size', 11), spec.get('bold', False)
+        x = self._x(spec, frame, 10)
+        bullet = spec.get('bullet', '')
+        hanging = text_width(self.font(size, bold), bullet)
+        row = 0
+        for entry in spec['list']:
+            text, color = (entry, spec.get('color', 'text_primary')) if isinstance(entry, str) else entry
+            lines = self.lines(text, size, bold, frame.right - frame.indent - x - hanging)
+            if not measure:
+                for i, line in enumerate(lines):
+                    self.text((x + (hanging if i else 0), y + (row + i) * pitch), bullet + line if i == 0 else line,
+                              size, color, bold)
+            row += len(lines)
+        return pitch * row
+
+    def item_entries(self, spec, y, frame, measure):
+        """太字の見出しと説明文の2行組（右端に値を添えられる）"""
+        pitch = spec.get('pitch', 40)
+        if not measure:
+            x = self._x(spec, frame, 10)
+            for i, entry in enumerate(spec['entries']):
+                title, description, color = entry[:3]
+                top = y + i * pitch
+                self.text((x, top), f"• {title}", 12, color, True)
+                self.text((x + 10, top + 15), description, 10, 'text_secondary')
+                if len(entry) > 3:
+                    self.text((frame.right - 20, top + 15), entry[3], 9, color, anchor="rt")
+        return pitch * len(spec['entries'])
+
+    def item_rows(self, spec, y, frame, measure):
+        """左に項目、右に色付きの値を並べた行"""
+        pitch = spec.get('pitch', 25)
+        if not measure:
+            x = self._x(spec, frame, 10)
+            for i, (label, value, color) in enumerate(spec['rows']):
+                self.text((x, y + i * pitch), f"• {label}", spec.get('size', 12))
+                self.text((frame.right - 20, y + i * pitch), value, spec.get('value_size', 11), color, True,
+                          anchor="rt")
+        return pitch * len(spec['rows'])
+
+    def item_row(self, spec, y, frame, measure):
+        """1行の見出しと右寄せの値（dot を指定すると左に状態ランプを付ける）"""
+        size = spec.get('size', 15)
+        advance = spec.get('pitch', size + 10)
+        if not measure:
+            label, value = spec['row']
+            center = y + size * 0.6
+            x = self._x(spec, frame)
+            if 'dot' in spec:
+                self.circle((x, center), 8, spec['dot'])
+                x += 20
+            self.text((x, center), label, size, spec.get('color', 'text_primary'), spec.get('bold', True),
+                      anchor="lm")
+            if value:
+                self.text((frame.right - spec.get('indent', frame.indent), center), value,
+                          spec.get('value_size', size), spec.get('value_color', self.style['accent']),
+                          spec.get('value_bold', True), anchor="rm")
+        return advance
+
+    def item_code(self, spec, y, frame, measure):
+        """背景付きのコードブロック（行は 文字列 / [文字列, 色] / [文字列, 色, 追加の字下げ]）"""
+        pitch, padding = spec.get('pitch', 15), spec.get('padding', 10)
+        lines = spec['code']
+        height = padding * 2 + pitch * (len(lines) - 1) + spec.get('size', 12)
+        if not measure:
+            inset = spec.get('indent', frame.indent)
+            self.box((frame.left + inset, y, frame.right - inset, y + height), spec.get('fill', 'bg_primary'),
+                     radius=spec.get('radius', 8))
+            for i, line in enumerate(lines):
+                if isinstance(line, str):
+                    line = [line, spec.get('color', 'text_primary')]
+                extra = line[2] if len(line) > 2 else 0
+                self.text((frame.left + inset + 10 + extra, y + padding + i * pitch), line[0], spec.get('size', 12),
+                          line[1], spec.get('bold', False))
+        return height + spec.get('gap', 10)
+
+    def item_banner(self, spec, y, frame, measure):
+        """角丸の帯に入れた注意書き"""
+        height = spec.get('height', 20)
+        if not measure:
+            inset = spec.get('indent', frame.indent)
+            self.box((frame.left + inset, y, frame.right - inset, y + height), spec.get('fill', 'accent_orange'),
+                     radius=8)
+            self.text((frame.left + inset + 5, y + 5), spec['banner'], spec.get('size', 10),
+                      spec.get('color', 'text_primary'), spec.get('bold', False))
+        return height + spec.get('gap', 10)
+
+    def item_bar(self, spec, y, frame, measure):
+        """進捗バー・スライダー（knob でつまみを付ける）"""
+        height = spec.get('height', 5)
+        if not measure:
+            inset = spec.get('indent', frame.indent)
+            left, right = frame.left + inset, frame.right - inset
+            radius = spec.get('radius', 3)
+            value_x = left + (right - left) * spec['bar']
+            color = spec.get('color', self.style['accent'])
+            self.box((left, y, right, y + height), spec.get('track', 'text_tertiary'), radius=radius)
+            if spec.get('fill', True):
+                self.box((left, y, value_x, y + height), color, radius=radius)
+            if spec.get('knob'):
+                self.circle((value_x, y + height / 2), 8, color, spec.get('knob_outline'), 2)
+        return height + spec.get('gap', 15)
+
+    def item_toggle(self, spec, y, frame, measure):
+        if not measure:
+            right = frame.right - spec.get('indent', frame.indent)
+            on = spec['toggle']
+            self.box((right - 35, y, right, y + 15), spec.get('color', 'success') if on else 'text_tertiary',
+                     radius=8)
+            self.circle((right - 10 if on else right - 25, y + 7), 6, 'text_primary')
+        return 0
+
+    def item_check(self, spec, y, frame, measure):
+        """選択中の印（badge: 丸の中のチェック、mark: 大きなチェック）"""
+        if not measure:
+            right = frame.right - spec.get('indent', frame.indent)
+            color = spec.get('color', self.style['accent'])
+            if spec.get('style', 'badge') == 'badge':
+                self.circle((right - 5, y), 8, color)
+                self.text((right - 5, y), spec['check'], 12, 'text_primary', True, anchor="mm")
+            else:
+                self.text((right, y), spec['check'], 24, color, anchor="rm")
+        return 0
+
+    def item_dots(self, spec, y, frame, measure):
+        """右端に並べた入力中インジケーター（● は color、○ は text_secondary）"""
+        if not measure:
+            x = frame.right - spec.get('indent', 20)
+            for i, dot in enumerate(spec['dots']):
+                color = spec.get('color', 'accent_purple') if dot == '●' else 'text_secondary'
+                self.text((x + i * 15, y), dot, 16, color, anchor="mm")
+        return 0
+
+    def item_space(self, spec, y, frame, measure):
+        return spec['space']
+
+
+def render_scene(spec, device=None):
+    """シーン仕様の1ページ目を描画した RGB 画像"""
+    return SceneRenderer(spec, device).render()
+
+
+def page_name(output, page):
+    """2ページ目以降の出力ファイル名（chat.png → chat_2.png）"""
+    if page == 0:
+        return output
+    stem, ext = os.path.splitext(output)
+    return f"{stem}_{page + 1}{ext}"
+
+
+def render_scenes(names, output_dir=OUTPUT_DIR, device=None):
+    """シーンを順に描画して output_dir に保存し、保存したパスのリストを返す（複数ページなら全ページ分）
+
+    device を指定すると、その端末のピクセル密度で描く。
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for name in names:
+        spec = load_scene(scene_path(name))
+        for page, image in enumerate(SceneRenderer(spec, device).render_pages()):
+            output = page_name(spec['output'], page)
+            path = os.path.join(output_dir, output)
+            image.save(path)
+            print(f"✅ Created {os.path.relpath(path, OUTPUT_DIR) if device else output}")
+            paths.append(path)
+    return paths
+
+
+def export_scenes(names, formats, output_dir=OUTPUT_DIR, device=None):
+    """シーンを formats（'svg' / 'pdf'）のベクター形式で output_dir に保存し、保存したパスのリストを返す
+
+    サイズは device（省略時は既定の端末）のポイント単位の論理サイズになる。
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for name in names:
+        spec = load_scene(scene_path(name))
+        for page, vector in enumerate(SceneRenderer(spec, device).render_vector_pages()):
+            stem = os.path.splitext(page_name(spec['output'], page))[0]
+            for extension in formats:
+                path = os.path.join(output_dir, f"{stem}.{extension}")
+                vector.save(path)
+                print(f"✅ Created {os.path.relpath(path, OUTPUT_DIR) if device else os.path.basename(path)}")
+                paths.append(path)
+    return paths
+
+
+def render_corpus(tags, template=CORPUS_TEMPLATE, count=None, seed=None, output_dir=None, device=None):
+    """タグが一致するコーパスの会話を template のシーンに1つずつ流し込み、output_dir に描画する
+
+    output_dir の既定は screenshots/corpus/<シーン名>/（device を指定した場合はその下の端末名のディレクトリ）。
+    会話ごとに <会話 ID>.png（複数ページなら _2 …）を保存し、保存したパスのリストを返す。
+    count を指定すると seed で再現できる無作為抽出にする。
+    """
+    base = load_scene(scene_path(template))
+    options = base.get('conversation', {})
+    if isinstance(options, str):
+        options = {}
+    if output_dir is None:
+        output_dir = os.path.join(OUTPUT_DIR, CORPUS_DIR, base['name'], *([get_device(device).name] if device else []))
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for conversation_id in get_corpus().sample(count, seed, **tags):
+        spec = dict(base, name=conversation_id, output=conversation_id + '.png',
+                    conversation=dict({'markdown': True}, **dict(options, id=conversation_id)))
+        for page, image in enumerate(SceneRenderer(spec, device).render_pages()):
+            path = os.path.join(output_dir, page_name(spec['output'], page))
+            image.save(path)
+            paths.append(path)
+    print(f"✅ Created {len(paths)} images in {output_dir}")
+    return paths
+
+
+def render_matrix(names, devices, output_dir=OUTPUT_DIR):
+    """すべてのシーンを端末ごとに output_dir/<端末名>/ へ描画し、保存したパスのリストを返す"""
+    paths = []
+    for device in devices:
+        paths.extend(render_scenes(names, os.path.join(output_dir, get_device(device).name), device))
+    return paths
+
+
+def report():
+    """ディスプレイリスト・クロームレイヤー・レイアウトの各キャッシュのサマリー"""
+    return "\n".join([display_report(), chrome_layers.report(), layout_cache.report()])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="シーン仕様を描画する")
+    parser.add_argument('names', nargs='*', help="シーン名（省略時はすべて）")
+    parser.add_argument('--devices', help="端末名のカンマ区切り（all: すべて、app_store: App Store の提出サイズ）")
+    parser.add_argument('--vector', help="ベクター形式でも書き出す（svg / pdf のカンマ区切り）")
+    parser.add_argument('--corpus', metavar='TAGS',
+                        help="タグが一致するコーパスの会話ごとに描く（例: scenario=cooking,locale=ja|en、all: すべて）")
+    parser.add_argument('--template', default=CORPUS_TEMPLATE, help="--corpus で会話を流し込むシーン")
+    parser.add_argument('--count', type=int, help="--corpus で無作為に選ぶ会話の数")
+    parser.add_argument('--seed', type=int, help="--count の抽出の乱数シード")
+    args = parser.parse_args()
+    names = args.names or scene_names()
+    formats = args.vector.split(',') if args.vector else []
+    with text_runs.batch("scenes"):
+        if args.corpus:
+            tags = {} if args.corpus == 'all' else parse_tags(args.corpus)
+            paths = []
+            for device in device_names(args.devices) if args.devices else [None]:
+                paths.extend(render_corpus(tags, args.template, args.count, args.seed, device=device))
+            print(f"\n🎬 {len(paths)} corpus screens rendered")
+        elif args.devices:
+            devices = device_names(args.devices)
+            paths = render_matrix(names, devices)
+            for device in devices if formats else []:
+                paths.extend(export_scenes(names, formats, os.path.join(OUTPUT_DIR, device), device))
+            print(f"\n🎬 {len(names)} scenes × {len(devices)} devices rendered ({len(paths)} files)")
+        else:
+            render_scenes(names)
+            if formats:
+                export_scenes(names, formats)
+            print(f"\n🎬 {len(names)} scenes rendered")
+    print(text_runs.report("scenes"))
+    print(report())
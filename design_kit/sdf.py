@@ -0,0 +1,197 @@
+"""
+SDF (符号付き距離場) による図形ラスタライザ
+
+1シーン分の図形（矩形・角丸矩形・円・楕円・カプセル・線分・円弧）を ShapeBatch に集め、
+render() でタイルごとにまとめて評価する。各ピクセルの被覆率は距離場から求めるため、
+解像度に依存せずアンチエイリアスがかかる。
+
+メソッド名と座標の扱いは ImageDraw に合わせてあり、ImageDraw.Draw の代わりに
+ShapeBatch を渡せば既存の描画関数をそのまま使える（テキストは描かない）。
+"""
+
+import math
+
+import numpy as np
+from PIL import Image, ImageColor
+
+# 1回の評価で扱うタイルの大きさ（ピクセル）
+TILE_SIZE = 128
+
+
+def _points(xy):
+    """[(x, y), ...] / [x, y, ...] を [(x, y), ...] にそろえる"""
+    if xy and isinstance(xy[0], (tuple, list)):
+        return [tuple(p) for p in xy]
+    return list(zip(xy[0::2], xy[1::2]))
+
+
+def _box(xy):
+    """ImageDraw の矩形指定（右下を含む）を図形の辺の座標に変換"""
+    (x1, y1), (x2, y2) = _points(xy)
+    return x1, y1, x2 + 1, y2 + 1
+
+
+def _color(color):
+    if isinstance(color, str):
+        color = ImageColor.getrgb(color)
+    color = tuple(color)
+    alpha = color[3] / 255.0 if len(color) == 4 else 1.0
+    return np.array(color[:3], dtype=np.float32) / 255.0, alpha
+
+
+def _rounded_box_distance(x, y, box, radius):
+    x1, y1, x2, y2 = box
+    hw, hh = (x2 - x1) / 2, (y2 - y1) / 2
+    radius = min(radius, hw, hh)
+    qx = np.abs(x - (x1 + hw)) - hw + radius
+    qy = np.abs(y - (y1 + hh)) - hh + radius
+    outside = np.hypot(np.maximum(qx, 0), np.maximum(qy, 0))
+    return outside + np.minimum(np.maximum(qx, qy), 0) - radius
+
+
+def _ellipse_distance(x, y, box):
+    x1, y1, x2, y2 = box
+    rx, ry = (x2 - x1) / 2, (y2 - y1) / 2
+    px, py = x - (x1 + rx), y - (y1 + ry)
+    if rx == ry:
+        return np.hypot(px, py) - rx
+    # 楕円の距離の近似 (k0 - 1) * k0 / k1
+    k0 = np.hypot(px / rx, py / ry)
+    k1 = np.hypot(px / (rx * rx), py / (ry * ry))
+    center = k1 < 1e-6
+    return np.where(center, -min(rx, ry), k0 * (k0 - 1) / np.where(center, 1.0, k1))
+
+
+def _segment_distance(x, y, a, b, width, round_caps):
+    (ax, ay), (bx, by) = a, b
+    dx, dy = bx - ax, by - ay
+    length = math.hypot(dx, dy)
+    if length == 0:
+        return np.hypot(x - ax, y - ay) - width / 2
+    ux, uy = dx / length, dy / length
+    along = (x - ax) * ux + (y - ay) * uy
+    across = np.abs((x - ax) * -uy + (y - ay) * ux)
+    if round_caps:
+        t = np.clip(along, 0, length)
+        return np.hypot(along - t, across) - width / 2
+    return np.maximum(across - width / 2, np.abs(along - length / 2) - length / 2)
+
+
+def _inner_stroke(distance, width):
+    """図形の内側 width 幅の帯"""
+    return np.maximum(distance, -distance - width)
+
+
+class ShapeBatch:
+    """1シーン分の図形を集め、タイル単位でまとめてラスタライズする"""
+
+    def __init__(self):
+        self._shapes = []
+
+    def __len__(self):
+        return len(self._shapes)
+
+    def _add(self, bounds, distance, color):
+        if color is None:
+            return
+        rgb, alpha = _color(color)
+        x1, y1, x2, y2 = bounds
+        # アンチエイリアスの分だけ1ピクセル広げる
+        self._shapes.append(((x1 - 1, y1 - 1, x2 + 1, y2 + 1), distance, rgb, alpha))
+
+    def _add_filled(self, bounds, distance, fill, outline, width):
+        self._add(bounds, distance, fill)
+        if outline is not None and width:
+            self._add(bounds, lambda x, y: _inner_stroke(distance(x, y), width), outline)
+
+    # --- 図形 ---
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self.rounded_rectangle(xy, 0, fill, outline, width)
+
+    def rounded_rectangle(self, xy, radius=0, fill=None, outline=None, width=1):
+        box = _box(xy)
+        self._add_filled(box, lambda x, y: _rounded_box_distance(x, y, box, radius), fill, outline, width)
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        box = _box(xy)
+        self._add_filled(box, lambda x, y: _ellipse_distance(x, y, box), fill, outline, width)
+
+    def circle(self, xy, radius, fill=None, outline=None, width=1):
+        x, y = xy
+        self.ellipse([x - radius, y - radius, x + radius, y + radius], fill, outline, width)
+
+    def arc(self, xy, start, end, fill=None, width=1):
+        """楕円弧（角度は ImageDraw と同じく3時方向から時計回り、線は内側に width 幅）"""
+        box = _box(xy)
+        cx, cy = (box[0] + box[2]) / 2, (box[1] + box[3]) / 2
+        rx, ry = (box[2] - box[0]) / 2, (box[3] - box[1]) / 2
+        start, span = start % 360, (end - start) % 360 or 360
+
+        def distance(x, y):
+            band = _inner_stroke(_ellipse_distance(x, y, box), width)
+            angle = np.degrees(np.arctan2((y - cy) / ry, (x - cx) / rx))
+            inside = (angle - start) % 360 <= span
+            return np.where(inside, band, np.inf)
+
+        self._add(box, distance, fill)
+
+    def line(self, xy, fill=None, width=1):
+        """線分（端は平ら）。ImageDraw.line と同じくピクセル中心を結ぶ"""
+        self._segments(xy, fill, width, round_caps=False)
+
+    def capsule(self, xy, fill=None, width=1):
+        """両端が丸い線分"""
+        self._segments(xy, fill, width, round_caps=True)
+
+    def _segments(self, xy, fill, width, round_caps):
+        points = [(x + 0.5, y + 0.5) for x, y in _points(xy)]
+        half = width / 2
+        for a, b in zip(points, points[1:]):
+            bounds = (min(a[0], b[0]) - half, min(a[1], b[1]) - half,
+                      max(a[0], b[0]) + half, max(a[1], b[1]) + half)
+            self._add(bounds, lambda x, y, a=a, b=b: _segment_distance(x, y, a, b, width, round_caps), fill)
+
+    # --- ラスタライズ ---
+
+    def render(self, image, tile=TILE_SIZE):
+        """集めた図形を登録順に image (RGB / RGBA) へ合成する"""
+        if not self._shapes:
+            return
+        bounds = np.array([shape[0] for shape in self._shapes], dtype=np.float64)
+        width, height = image.size
+        has_alpha = image.mode == 'RGBA'
+
+        for top in range(0, height, tile):
+            bottom = min(top + tile, height)
+            for left in range(0, width, tile):
+                right = min(left + tile, width)
+                hits = np.nonzero((bounds[:, 0] < right) & (bounds[:, 2] > left) &
+                                  (bounds[:, 1] < bottom) & (bounds[:, 3] > top))[0]
+                if len(hits):
+                    self._render_tile(image, (left, top, right, bottom), hits, has_alpha)
+
+    def _render_tile(self, image, box, hits, has_alpha):
+        left, top, right, bottom = box
+        pixels = np.asarray(image.crop(box), dtype=np.float32) / 255.0
+        rgb = pixels[..., :3].copy()
+        alpha = pixels[..., 3].copy() if has_alpha else np.ones(rgb.shape[:2], dtype=np.float32)
+        rgb *= alpha[..., None]
+
+        # ピクセル中心の座標
+        x = np.arange(left, right, dtype=np.float32)[None, :] + 0.5
+        y = np.arange(top, bottom, dtype=np.float32)[:, None] + 0.5
+
+        for index in hits:
+            _, distance, color, color_alpha = self._shapes[index]
+            coverage = (np.clip(0.5 - distance(x, y), 0.0, 1.0) * color_alpha)[..., None]
+            rgb = color * coverage + rgb * (1 - coverage)
+            if has_alpha:
+                alpha = coverage[..., 0] + alpha * (1 - coverage[..., 0])
+
+        if has_alpha:
+            rgb = np.divide(rgb, alpha[..., None], out=np.zeros_like(rgb), where=alpha[..., None] > 0)
+            rgb = np.dstack([rgb, alpha])
+        data = np.clip(rgb * 255.0 + 0.5, 0, 255).astype(np.uint8)
+        image.paste(Image.frombuffer(image.mode, (right - left, bottom - top), data.tobytes(),
+                                     'raw', image.mode, 0, 1), (left, top))
@@ -0,0 +1,645 @@
+"""
+最小限の sfnt (TrueType / OpenType / TTC) パーサー
+
+フォント索引の作成に必要な name / OS/2 / head / cmap テーブルを読むほか、
+PDF への埋め込み用にテーブルの取り出し・TrueType / CFF のサブセット化・sfnt の組み立てを行う。
+サブセットはどちらもグリフ ID を変えず、使わないグリフのアウトラインと呼ばれないサブルーチンを空にする。
+"""
+
+import math
+import struct
+
+import numpy as np
+
+FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc', '.otc')
+
+# name テーブルの ID
+NAME_FAMILY = 1
+NAME_SUBFAMILY = 2
+NAME_FULL = 4
+NAME_POSTSCRIPT = 6
+NAME_TYPO_FAMILY = 16
+NAME_TYPO_SUBFAMILY = 17
+
+# CFF の DICT の演算子（2バイトの演算子は 1200 + 2バイト目）
+CFF_CHARSET = 15
+CFF_ENCODING = 16
+CFF_CHARSTRINGS = 17
+CFF_PRIVATE = 18
+CFF_SUBRS = 19
+CFF_ROS = 1230
+CFF_FDSELECT = 1237
+CFF_FDARRAY = 1236
+
+# CFF のサブセットに残すテーブル
+CFF_SUBSET_TABLES = ('cmap', 'head', 'hhea', 'hmtx', 'maxp', 'OS/2', 'post', 'name')
+
+# Type 2 charstring の演算子
+T2_STEMS = (1, 3, 18, 23)       # hstem / vstem / hstemhm / vstemhm
+T2_MASKS = (19, 20)             # hintmask / cntrmask
+T2_CALLSUBR = 10
+T2_CALLGSUBR = 29
+T2_RETURN = 11
+T2_ENDCHAR = 14
+
+
+class SfntError(ValueError):
+    """フォントファイルを解釈できない"""
+
+
+def _face_offsets(data):
+    tag = data[:4]
+    if tag in (b'ttcf',):
+        count = struct.unpack_from('>I', data, 8)[0]
+        return list(struct.unpack_from(f'>{count}I', data, 12))
+    if tag in (b'\x00\x01\x00\x00', b'OTTO', b'true', b'typ1'):
+        return [0]
+    raise SfntError("sfnt 形式ではありません")
+
+
+def _table_directory(data, offset):
+    num_tables = struct.unpack_from('>H', data, offset + 4)[0]
+    tables = {}
+    for i in range(num_tables):
+        tag, _, table_offset, length = struct.unpack_from('>4sIII', data, offset + 12 + i * 16)
+        tables[tag.decode('latin-1')] = (table_offset, length)
+    return tables
+
+
+def _read_names(data, offset):
+    _, count, string_offset = struct.unpack_from('>HHH', data, offset)
+    storage = offset + string_offset
+    candidates = {}
+    for i in range(count):
+        platform, encoding, language, name_id, length, str_offset = struct.unpack_from(
+            '>HHHHHH', data, offset + 6 + i * 12)
+        raw = data[storage + str_offset:storage + str_offset + length]
+        if platform == 3 or platform == 0:
+            text = raw.decode('utf-16-be', errors='replace')
+        elif platform == 1 and encoding == 0:
+            text = raw.decode('mac_roman', errors='replace')
+        else:
+            continue
+        # 英語 (Windows, en-US) を最優先、次に Mac 英語、最後にその他
+        if platform == 3 and language == 0x409:
+            rank = 0
+        elif platform == 1 and language == 0:
+            rank = 1
+        else:
+            rank = 2
+        current = candidates.get(name_id)
+        if current is None or rank < current[0]:
+            candidates[name_id] = (rank, text)
+    return {name_id: text for name_id, (_, text) in candidates.items()}
+
+
+def _cmap_format4(data, offset):
+    seg_count = struct.unpack_from('>H', data, offset + 6)[0] // 2
+    ends = np.frombuffer(data, '>u2', seg_count, offset + 14).astype(np.int64)
+    starts_at = offset + 16 + seg_count * 2
+    starts = np.frombuffer(data, '>u2', seg_count, starts_at).astype(np.int64)
+    deltas = np.frombuffer(data, '>u2', seg_count, starts_at + seg_count * 2).astype(np.int64)
+    range_offsets_at = starts_at + seg_count * 4
+    range_offsets = np.frombuffer(data, '>u2', seg_count, range_offsets_at).astype(np.int64)
+
+    covered = []
+    for i in range(seg_count):
+        start, end = int(starts[i]), int(ends[i])
+        if start == 0xFFFF or end < start:
+            continue
+        codes = np.arange(start, end + 1, dtype=np.int64)
+        if range_offsets[i] == 0:
+            glyphs = (codes + deltas[i]) & 0xFFFF
+        else:
+            addr = range_offsets_at + i * 2 + int(range_offsets[i]) + 2 * (codes - start)
+            valid = addr + 2 <= len(data)
+            raw = np.zeros(len(codes), dtype=np.int64)
+            raw[valid] = [struct.unpack_from('>H', data, int(a))[0] for a in addr[valid]]
+            glyphs = np.where(raw != 0, (raw + deltas[i]) & 0xFFFF, 0)
+        covered.append(codes[glyphs != 0])
+    if not covered:
+        return np.zeros(0, dtype=np.int64)
+    return np.concatenate(covered)
+
+
+def _cmap_format12(data, offset):
+    groups = struct.unpack_from('>I', data, offset + 12)[0]
+    table = np.frombuffer(data, '>u4', groups * 3, offset + 16).reshape(-1, 3).astype(np.int64)
+    return [(int(start), int(end)) for start, end, glyph in table if end >= start]
+
+
+def _codes_to_ranges(codes):
+    codes = np.unique(codes)
+    if len(codes) == 0:
+        return []
+    breaks = np.nonzero(np.diff(codes) != 1)[0]
+    starts = np.concatenate([[codes[0]], codes[breaks + 1]])
+    ends = np.concatenate([codes[breaks], [codes[-1]]])
+    return [(int(s), int(e)) for s, e in zip(starts, ends)]
+
+
+def _merge_ranges(ranges):
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _read_coverage(data, offset):
+    _, count = struct.unpack_from('>HH', data, offset)
+    subtables = {}
+    for i in range(count):
+        platform, encoding, sub_offset = struct.unpack_from('>HHI', data, offset + 4 + i * 8)
+        fmt = struct.unpack_from('>H', data, offset + sub_offset)[0]
+        subtables.setdefault((platform, encoding, fmt), offset + sub_offset)
+
+    for key in ((3, 10, 12), (0, 6, 12), (0, 4, 12)):
+        if key in subtables:
+            return _merge_ranges(_cmap_format12(data, subtables[key]))
+    for key in ((3, 1, 4), (0, 3, 4), (0, 1, 4), (0, 0, 4), (3, 0, 4)):
+        if key in subtables:
+            return _codes_to_ranges(_cmap_format4(data, subtables[key]))
+    return []
+
+
+def read_faces(path):
+    """フォントファイル内の全フェイスの情報を読み込む
+
+    各フェイスについて family / style / weight / italic / 対応コードポイント範囲 /
+    カーニング情報の有無を辞書で返す。
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    faces = []
+    for index, offset in enumerate(_face_offsets(data)):
+        tables = _table_directory(data, offset)
+        names = _read_names(data, tables['name'][0]) if 'name' in tables else {}
+
+        weight = 400
+        italic = False
+        if 'OS/2' in tables:
+            os2 = tables['OS/2'][0]
+            weight = struct.unpack_from('>H', data, os2 + 4)[0]
+            italic = bool(struct.unpack_from('>H', data, os2 + 62)[0] & 0x01)
+        elif 'head' in tables:
+            mac_style = struct.unpack_from('>H', data, tables['head'][0] + 44)[0]
+            weight = 700 if mac_style & 0x01 else 400
+            italic = bool(mac_style & 0x02)
+
+        faces.append({
+            'index': index,
+            'family': names.get(NAME_TYPO_FAMILY) or names.get(NAME_FAMILY, ''),
+            'style': names.get(NAME_TYPO_SUBFAMILY) or names.get(NAME_SUBFAMILY, ''),
+            'full_name': names.get(NAME_FULL, ''),
+            'postscript_name': names.get(NAME_POSTSCRIPT, ''),
+            'weight': weight,
+            'italic': italic,
+            'coverage': _read_coverage(data, tables['cmap'][0]) if 'cmap' in tables else [],
+            'kerning': 'kern' in tables or 'GPOS' in tables,
+        })
+    return faces
+
+
+def read_tables(path, index=0):
+    """フェイス（TTC の場合は index 番目）のテーブルを {タグ: バイト列} で返す"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    offset = _face_offsets(data)[index]
+    return {tag: data[start:start + length] for tag, (start, length) in _table_directory(data, offset).items()}
+
+
+def glyph_map(cmap):
+    """cmap テーブルから {コードポイント: グリフ ID} を作る（Unicode の format 12 / 4）"""
+    _, count = struct.unpack_from('>HH', cmap, 0)
+    subtables = {}
+    for i in range(count):
+        platform, encoding, sub_offset = struct.unpack_from('>HHI', cmap, 4 + i * 8)
+        fmt = struct.unpack_from('>H', cmap, sub_offset)[0]
+        subtables.setdefault((platform, encoding, fmt), sub_offset)
+
+    for key in ((3, 10, 12), (0, 6, 12), (0, 4, 12)):
+        if key in subtables:
+            offset = subtables[key]
+            groups = struct.unpack_from('>I', cmap, offset + 12)[0]
+            mapping = {}
+            for start, end, glyph in struct.iter_unpack('>III', cmap[offset + 16:offset + 16 + groups * 12]):
+                mapping.update(zip(range(start, end + 1), range(glyph, glyph + end - start + 1)))
+            return mapping
+    for key in ((3, 1, 4), (0, 3, 4), (0, 1, 4), (0, 0, 4), (3, 0, 4)):
+        if key in subtables:
+            offset = subtables[key]
+            seg_count = struct.unpack_from('>H', cmap, offset + 6)[0] // 2
+            ends = struct.unpack_from(f'>{seg_count}H', cmap, offset + 14)
+            starts_at = offset + 16 + seg_count * 2
+            starts = struct.unpack_from(f'>{seg_count}H', cmap, starts_at)
+            deltas = struct.unpack_from(f'>{seg_count}H', cmap, starts_at + seg_count * 2)
+            range_offsets_at = starts_at + seg_count * 4
+            range_offsets = struct.unpack_from(f'>{seg_count}H', cmap, range_offsets_at)
+            mapping = {}
+            for i in range(seg_count):
+                for code in range(starts[i], min(ends[i], 0xFFFE) + 1):
+                    if range_offsets[i] == 0:
+                        glyph = (code + deltas[i]) & 0xFFFF
+                    else:
+                        addr = range_offsets_at + i * 2 + range_offsets[i] + 2 * (code - starts[i])
+                        raw = struct.unpack_from('>H', cmap, addr)[0] if addr + 2 <= len(cmap) else 0
+                        glyph = (raw + deltas[i]) & 0xFFFF if raw else 0
+                    if glyph:
+                        mapping[code] = glyph
+            return mapping
+    return {}
+
+
+def _checksum(data):
+    data += b'\0' * (-len(data) % 4)
+    return sum(struct.unpack(f'>{len(data) // 4}I', data)) & 0xFFFFFFFF
+
+
+def build_sfnt(tables, cff=False):
+    """テーブルの辞書から単体の sfnt ファイルを組み立てる"""
+    tags = sorted(tables)
+    count = len(tags)
+    selector = int(math.log2(count))
+    search_range = 2 ** selector * 16
+    header = struct.pack('>4sHHHH', b'OTTO' if cff else b'\x00\x01\x00\x00', count, search_range, selector,
+                         count * 16 - search_range)
+    directory = []
+    body = []
+    offset = 12 + count * 16
+    for tag in tags:
+        data = tables[tag]
+        directory.append(struct.pack('>4sIII', tag.encode('latin-1'), _checksum(data), offset, len(data)))
+        padded = data + b'\0' * (-len(data) % 4)
+        body.append(padded)
+        offset += len(padded)
+    return header + b''.join(directory) + b''.join(body)
+
+
+def _components(glyph):
+    """複合グリフが参照するグリフ ID"""
+    if len(glyph) < 10 or struct.unpack_from('>h', glyph, 0)[0] >= 0:
+        return []
+    components = []
+    at = 10
+    while True:
+        flags, component = struct.unpack_from('>HH', glyph, at)
+        components.append(component)
+        at += 4 + (4 if flags & 0x0001 else 2)
+        if flags & 0x0008:
+            at += 2
+        elif flags & 0x0040:
+            at += 4
+        elif flags & 0x0080:
+            at += 8
+        if not flags & 0x0020:
+            return components
+
+
+def subset_truetype(tables, glyphs):
+    """glyphs（と複合グリフの部品）以外のアウトラインを空にした TrueType を返す
+
+    グリフ ID は変えないため、PDF の CIDToGIDMap /Identity のまま使える。
+    """
+    long_loca = struct.unpack_from('>h', tables['head'], 50)[0] == 1
+    count = struct.unpack_from('>H', tables['maxp'], 4)[0]
+    loca = struct.unpack_from(f'>{count + 1}{"I" if long_loca else "H"}', tables['loca'])
+    if not long_loca:
+        loca = [offset * 2 for offset in loca]
+    glyf = tables['glyf']
+
+    keep = set()
+    pending = [0, *glyphs]
+    while pending:
+        glyph = pending.pop()
+        if glyph in keep or glyph >= count:
+            continue
+        keep.add(glyph)
+        pending.extend(_components(glyf[loca[glyph]:loca[glyph + 1]]))
+
+    outlines = []
+    offsets = [0]
+    for glyph in range(count):
+        data = glyf[loca[glyph]:loca[glyph + 1]] if glyph in keep else b''
+        data += b'\0' * (-len(data) % 4)
+        outlines.append(data)
+        offsets.append(offsets[-1] + len(data))
+
+    head = bytearray(tables['head'])
+    head[8:12] = bytes(4)   # checkSumAdjustment
+    head[50:52] = struct.pack('>h', 1)   # loca は常に long 形式で書く
+    subset = {tag: tables[tag] for tag in ('cmap', 'hhea', 'hmtx', 'maxp', 'cvt ', 'fpgm', 'prep') if tag in tables}
+    subset.update({
+        'head': bytes(head),
+        'glyf': b''.join(outlines),
+        'loca': struct.pack(f'>{len(offsets)}I', *offsets),
+    })
+    return build_sfnt(subset)
+
+
+# --- CFF ---
+
+def _read_index(data, at):
+    """CFF の INDEX を読み、(要素のバイト列のリスト, INDEX の終端) を返す"""
+    count = struct.unpack_from('>H', data, at)[0]
+    if count == 0:
+        return [], at + 2
+    size = data[at + 2]
+    offsets = [int.from_bytes(data[at + 3 + i * size:at + 3 + (i + 1) * size], 'big') for i in range(count + 1)]
+    base = at + 2 + (count + 1) * size
+    return [data[base + offsets[i]:base + offsets[i + 1]] for i in range(count)], base + offsets[-1]
+
+
+def _write_index(items):
+    if not items:
+        return b'\0\0'
+    offsets = [1]
+    for item in items:
+        offsets.append(offsets[-1] + len(item))
+    size = max(1, (offsets[-1].bit_length() + 7) // 8)
+    return (struct.pack('>HB', len(items), size) + b''.join(offset.to_bytes(size, 'big') for offset in offsets)
+            + b''.join(items))
+
+
+def _read_dict(data):
+    """CFF の DICT を [(演算子, オペランドの値, オペランドのバイト列)] にする（実数の値は読まない）"""
+    entries = []
+    values = []
+    start = i = 0
+    while i < len(data):
+        b0 = data[i]
+        if b0 <= 21:
+            op = 1200 + data[i + 1] if b0 == 12 else b0
+            entries.append((op, values, data[start:i]))
+            i += 2 if b0 == 12 else 1
+            values = []
+            start = i
+        elif b0 == 28:
+            values.append(struct.unpack_from('>h', data, i + 1)[0])
+            i += 3
+        elif b0 == 29:
+            values.append(struct.unpack_from('>i', data, i + 1)[0])
+            i += 5
+        elif b0 == 30:
+            i += 1
+            while data[i] >> 4 != 0xF and data[i] & 0xF != 0xF:
+                i += 1
+            values.append(None)
+            i += 1
+        elif 32 <= b0 <= 246:
+            values.append(b0 - 139)
+            i += 1
+        elif 247 <= b0 <= 250:
+            values.append((b0 - 247) * 256 + data[i + 1] + 108)
+            i += 2
+        elif 251 <= b0 <= 254:
+            values.append(-(b0 - 251) * 256 - data[i + 1] - 108)
+            i += 2
+        else:
+            raise SfntError(f"CFF の DICT を解釈できません (0x{b0:02X})")
+    return entries
+
+
+def _write_dict(entries, replace):
+    """DICT を書き出す（replace の演算子のオペランドは 5 バイトの整数で書き、オフセットを後から決められるようにする）"""
+    out = bytearray()
+    for op, _, raw in entries:
+        if op in replace:
+            out += b''.join(b'\x1d' + struct.pack('>i', value) for value in replace[op])
+        else:
+            out += raw
+        out += bytes([12, op - 1200]) if op >= 1200 else bytes([op])
+    return bytes(out)
+
+
+def _dict_value(entries, op, default=None):
+    for entry_op, values, _ in entries:
+        if entry_op == op:
+            return values
+    return default
+
+
+def _charset(data, at, count):
+    """charset を GID → SID（CID-keyed なら CID）のリストにして、charset の長さと一緒に返す"""
+    codes = [0]
+    fmt = data[at]
+    p = at + 1
+    if fmt == 0:
+        codes += struct.unpack_from(f'>{count - 1}H', data, p)
+        p += 2 * (count - 1)
+    else:
+        while len(codes) < count:
+            first = struct.unpack_from('>H', data, p)[0]
+            left = data[p + 2] if fmt == 1 else struct.unpack_from('>H', data, p + 2)[0]
+            p += 3 if fmt == 1 else 4
+            codes.extend(range(first, first + left + 1))
+    return codes[:count], p - at
+
+
+def _fdselect(data, at, count):
+    """FDSelect を GID → Font DICT の番号のリストにして、長さと一緒に返す"""
+    fmt = data[at]
+    if fmt == 0:
+        return list(data[at + 1:at + 1 + count]), 1 + count
+    ranges = struct.unpack_from('>H', data, at + 1)[0]
+    selection = []
+    for i in range(ranges):
+        first, fd = struct.unpack_from('>HB', data, at + 3 + i * 3)
+        end = struct.unpack_from('>H', data, at + 6 + i * 3)[0]
+        selection.extend([fd] * (end - first))
+    return selection[:count], 5 + 3 * ranges
+
+
+def _encoding_length(data, at):
+    fmt = data[at]
+    length = 2 + (data[at + 1] if fmt & 0x7F == 0 else 2 * data[at + 1])
+    if fmt & 0x80:
+        length += 1 + 3 * data[at + length]
+    return length
+
+
+def _bias(subrs):
+    return 107 if len(subrs) < 1240 else 1131 if len(subrs) < 33900 else 32768
+
+
+def _scan_charstring(code, subrs, used, state, depth=0):
+    """Type 2 charstring が呼ぶサブルーチンを used に集める（endchar に達したら True）
+
+    subrs / used は (グローバル, ローカル) の組。state はオペランドスタックとステム数で、
+    サブルーチンをまたいで共有する（hintmask のバイト数がステム数で決まるため）。
+    """
+    stack = state['stack']
+    i = 0
+    while i < len(code):
+        b0 = code[i]
+        if b0 >= 32 or b0 == 28:
+            if b0 == 28:
+                stack.append(struct.unpack_from('>h', code, i + 1)[0])
+                i += 3
+            elif b0 <= 246:
+                stack.append(b0 - 139)
+                i += 1
+            elif b0 <= 250:
+                stack.append((b0 - 247) * 256 + code[i + 1] + 108)
+                i += 2
+            elif b0 <= 254:
+                stack.append(-(b0 - 251) * 256 - code[i + 1] - 108)
+                i += 2
+            else:
+                stack.append(struct.unpack_from('>i', code, i + 1)[0] >> 16)
+                i += 5
+            continue
+        i += 2 if b0 == 12 else 1
+        if b0 in T2_STEMS:
+            state['stems'] += len(stack) // 2
+        elif b0 in T2_MASKS:
+            state['stems'] += len(stack) // 2
+            i += (state['stems'] + 7) // 8
+        elif b0 in (T2_CALLSUBR, T2_CALLGSUBR):
+            which = 0 if b0 == T2_CALLGSUBR else 1
+            number = stack.pop() + _bias(subrs[which])
+            if depth >= 10 or not 0 <= number < len(subrs[which]):
+                raise SfntError("CFF のサブルーチン呼び出しを解釈できません")
+            used[which].add(number)
+            if _scan_charstring(subrs[which][number], subrs, used, state, depth + 1):
+                return True
+            continue
+        elif b0 == T2_RETURN:
+            return False
+        elif b0 == T2_ENDCHAR:
+            return True
+        stack.clear()
+    return False
+
+
+def _cff_fonts(cff):
+    """CFF の Top DICT と、Font DICT ごとの (Font DICT, Private DICT, ローカルサブルーチン)"""
+    _, at = _read_index(cff, cff[2])
+    top_dicts, _ = _read_index(cff, at)
+    top = _read_dict(top_dicts[0])
+    if _dict_value(top, CFF_ROS) is not None:
+        font_dicts = [_read_dict(data) for data in _read_index(cff, _dict_value(top, CFF_FDARRAY)[0])[0]]
+    else:
+        font_dicts = [top]
+    fonts = []
+    for font in font_dicts:
+        size, offset = _dict_value(font, CFF_PRIVATE, [0, 0])
+        private = _read_dict(cff[offset:offset + size])
+        subrs = _dict_value(private, CFF_SUBRS)
+        local = _read_index(cff, offset + subrs[0])[0] if subrs else []
+        fonts.append((font, private, local))
+    return top, fonts
+
+
+def cff_cids(cff):
+    """CID-keyed の CFF なら GID → CID のリスト（名前で引く CFF では None）"""
+    top, _ = _cff_fonts(cff)
+    if _dict_value(top, CFF_ROS) is None:
+        return None
+    count = len(_read_index(cff, _dict_value(top, CFF_CHARSTRINGS)[0])[0])
+    return _charset(cff, _dict_value(top, CFF_CHARSET)[0], count)[0]
+
+
+def subset_cff(tables, glyphs):
+    """glyphs 以外の charstring と、残したグリフから呼ばれないサブルーチンを空にした OpenType (CFF) を返す
+
+    INDEX を詰め直すためファイルは小さくなるが、グリフ ID と CID は変えない。
+    """
+    cff = tables['CFF ']
+    header = cff[:cff[2]]
+    names, at = _read_index(cff, cff[2])
+    _, at = _read_index(cff, at)
+    strings, at = _read_index(cff, at)
+    global_subrs, _ = _read_index(cff, at)
+    top, fonts = _cff_fonts(cff)
+    charstrings, _ = _read_index(cff, _dict_value(top, CFF_CHARSTRINGS)[0])
+    count = len(charstrings)
+    cid_keyed = _dict_value(top, CFF_ROS) is not None
+
+    charset_at = _dict_value(top, CFF_CHARSET, [0])[0]
+    charset = cff[charset_at:charset_at + _charset(cff, charset_at, count)[1]] if charset_at > 2 else b''
+    encoding_at = _dict_value(top, CFF_ENCODING, [0])[0]
+    encoding = b''
+    if not cid_keyed and encoding_at > 1:
+        encoding = cff[encoding_at:encoding_at + _encoding_length(cff, encoding_at)]
+    selection = [0] * count
+    fdselect = b''
+    if cid_keyed:
+        fdselect_at = _dict_value(top, CFF_FDSELECT)[0]
+        selection, length = _fdselect(cff, fdselect_at, count)
+        fdselect = cff[fdselect_at:fdselect_at + length]
+
+    keep = {0} | {glyph for glyph in glyphs if glyph < count}
+    used_global = set()
+    used_local = [set() for _ in fonts]
+    for glyph in keep:
+        fd = selection[glyph] if selection[glyph] < len(fonts) else 0
+        state = {'stack': [], 'stems': 0}
+        try:
+            _scan_charstring(charstrings[glyph], (global_subrs, fonts[fd][2]), (used_global, used_local[fd]), state)
+        except (SfntError, IndexError, struct.error):
+            # 解釈できない charstring があればサブルーチンはすべて残す
+            used_global = set(range(len(global_subrs)))
+            used_local = [set(range(len(font[2]))) for font in fonts]
+            break
+
+    def trim(items, used, empty):
+        return [item if i in used else empty for i, item in enumerate(items)]
+
+    charstrings_index = _write_index(trim(charstrings, keep, bytes([T2_ENDCHAR])))
+    global_index = _write_index(trim(global_subrs, used_global, bytes([T2_RETURN])))
+
+    # Private DICT の直後にローカルサブルーチンを置く（Subrs は Private DICT からの相対位置）
+    privates = []
+    for (_, private, local), used in zip(fonts, used_local):
+        replace = {CFF_SUBRS: [0]} if local else {}
+        length = len(_write_dict(private, replace))
+        if local:
+            replace = {CFF_SUBRS: [length]}
+        privates.append((_write_dict(private, replace), _write_index(trim(local, used, bytes([T2_RETURN])))))
+
+    def top_replace(offsets):
+        replace = {CFF_CHARSTRINGS: [offsets['charstrings']]}
+        if charset:
+            replace[CFF_CHARSET] = [offsets['charset']]
+        if encoding:
+            replace[CFF_ENCODING] = [offsets['encoding']]
+        if cid_keyed:
+            replace[CFF_FDSELECT] = [offsets['fdselect']]
+            replace[CFF_FDARRAY] = [offsets['fdarray']]
+        else:
+            replace[CFF_PRIVATE] = [len(privates[0][0]), offsets['private'][0]]
+        return replace
+
+    def font_dicts(offsets):
+        return [_write_dict(font, {CFF_PRIVATE: [len(private), offset]})
+                for (font, _, _), (private, _), offset in zip(fonts, privates, offsets['private'])]
+
+    # 5 バイトの整数で書くオフセットは値によらず長さが同じため、仮の値で配置を決めてから書く
+    offsets = {'charset': 0, 'encoding': 0, 'fdselect': 0, 'charstrings': 0, 'fdarray': 0,
+               'private': [0] * len(fonts)}
+    position = len(header) + len(_write_index(names)) + len(_write_index([_write_dict(top, top_replace(offsets))]))
+    position += len(_write_index(strings)) + len(global_index)
+    fdarray_length = len(_write_index(font_dicts(offsets))) if cid_keyed else 0
+    for name, length in (('charset', len(charset)), ('encoding', len(encoding)), ('fdselect', len(fdselect)),
+                         ('charstrings', len(charstrings_index)), ('fdarray', fdarray_length)):
+        offsets[name] = position
+        position += length
+    for i, (private, local) in enumerate(privates):
+        offsets['private'][i] = position
+        position += len(private) + len(local)
+
+    top_index = _write_index([_write_dict(top, top_replace(offsets))])
+    fdarray = _write_index(font_dicts(offsets)) if cid_keyed else b''
+    subset = b''.join([header, _write_index(names), top_index, _write_index(strings), global_index,
+                       charset, encoding, fdselect, charstrings_index, fdarray,
+                       *(private + local for private, local in privates)])
+
+    head = bytearray(tables['head'])
+    head[8:12] = bytes(4)   # checkSumAdjustment
+    result = {tag: tables[tag] for tag in CFF_SUBSET_TABLES if tag in tables}
+    result.update({'CFF ': subset, 'head': bytes(head)})
+    return build_sfnt(result, cff=True)
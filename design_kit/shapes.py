@@ -0,0 +1,66 @@
+"""
+アンチエイリアス付きの図形マスク
+
+角丸四角形の塗り・枠線をスーパーサンプリングで描いたマスクを (幅, 高さ, 半径, 線幅) ごとに
+1回だけ作り、以降はマスクを1回合成するだけで描画する。
+吹き出しのサイズは数種類しかないため、チャット画面のほとんどの描画はキャッシュヒットになる。
+"""
+
+from functools import lru_cache
+
+from PIL import Image, ImageColor, ImageDraw
+
+# マスク作成時のスーパーサンプリング倍率
+SUPERSAMPLE = 4
+
+
+@lru_cache(maxsize=256)
+def rounded_rect_mask(width, height, radius, stroke=0):
+    """角丸四角形のマスク（stroke > 0 なら内側に stroke 幅の枠線、0 なら塗り）"""
+    ss = SUPERSAMPLE
+    big = Image.new('L', (width * ss, height * ss), 0)
+    box = (0, 0, width * ss - 1, height * ss - 1)
+    if stroke:
+        ImageDraw.Draw(big).rounded_rectangle(box, radius * ss, outline=255, width=stroke * ss)
+    else:
+        ImageDraw.Draw(big).rounded_rectangle(box, radius * ss, fill=255)
+    return big.resize((width, height), Image.Resampling.BOX)
+
+
+@lru_cache(maxsize=256)
+def _translucent_mask(width, height, radius, stroke, alpha):
+    """不透明度を掛けたマスク（半透明色は不透明色 × 薄いマスクとして合成する）"""
+    return rounded_rect_mask(width, height, radius, stroke).point(lambda v: (v * alpha + 127) // 255)
+
+
+def _composite(draw, origin, size, radius, stroke, color):
+    if isinstance(color, str):
+        color = ImageColor.getrgb(color)
+    if isinstance(color, tuple) and len(color) == 4 and color[3] < 255:
+        mask = _translucent_mask(*size, radius, stroke, color[3])
+        color = color[:3]
+    else:
+        mask = rounded_rect_mask(*size, radius, stroke)
+    ink, fill_ink = draw._getink(color)
+    if ink is None:
+        ink = fill_ink
+    draw.draw.draw_bitmap(origin, mask.im, ink)
+
+
+def draw_rounded_rect(draw, x1, y1, x2, y2, radius, fill=None, outline=None, width=0):
+    """角丸四角形を描画（座標は右下を含む。枠線は内側に width 幅、半透明色はアルファで合成）"""
+    x1, y1, x2, y2 = (int(round(v)) for v in (x1, y1, x2, y2))
+    w, h = x2 - x1 + 1, y2 - y1 + 1
+    if w <= 0 or h <= 0:
+        return
+    radius = max(0, min(int(round(radius)), w // 2, h // 2))
+
+    if fill is not None:
+        _composite(draw, (x1, y1), (w, h), radius, 0, fill)
+    if outline is not None and width:
+        _composite(draw, (x1, y1), (w, h), radius, int(round(width)), outline)
+
+
+def cache_info():
+    """マスクキャッシュのヒット・ミス数"""
+    return rounded_rect_mask.cache_info()
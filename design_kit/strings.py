@@ -0,0 +1,115 @@
+"""
+アプリのローカライズ文字列
+
+アプリ本体の Sources/MindBridge/Resources/<ロケール>.lproj/Localizable.strings を読み込み、
+シーン仕様に書いた {"localized": "settings_title"} をアプリと同じ文言に置き換える。
+読み込んだ表はロケールごとにプロセス内で記憶する（ファイルを編集したら clear() で捨てる）。
+
+    /* コメント */
+    "settings_title" = "設定";
+"""
+
+import os
+import re
+
+from .paths import PROJECT_ROOT
+
+STRINGS_DIR = os.path.join(PROJECT_ROOT, "Sources", "MindBridge", "Resources")
+STRINGS_FILE = "Localizable.strings"
+
+DEFAULT_LOCALE = 'ja'
+
+# コメント・"キー" = "値"; の組・それ以外の文字（構文エラー）
+_TOKEN = re.compile(r'/\*.*?\*/|//[^\n]*|"((?:[^"\\]|\\.)*)"\s*=\s*"((?:[^"\\]|\\.)*)"\s*;|(\S)', re.S)
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r'}
+
+
+class StringsError(ValueError):
+    """ローカライズ文字列のファイルを読み込めない"""
+
+
+class StringNotFoundError(LookupError):
+    """指定したキーがローカライズ文字列にない"""
+
+
+def strings_path(locale):
+    """ロケールの Localizable.strings のパス"""
+    return os.path.join(STRINGS_DIR, f"{locale}.lproj", STRINGS_FILE)
+
+
+def locales():
+    """Localizable.strings があるロケールの一覧"""
+    if not os.path.isdir(STRINGS_DIR):
+        return []
+    return sorted(name[:-6] for name in os.listdir(STRINGS_DIR)
+                  if name.endswith('.lproj') and os.path.isfile(strings_path(name[:-6])))
+
+
+def _unescape(text):
+    return re.sub(r'\\(.)', lambda m: _ESCAPES.get(m.group(1), m.group(1)), text)
+
+
+def parse_strings(text, where=''):
+    """.strings の中身を {キー: 文言} にする"""
+    strings = {}
+    for match in _TOKEN.finditer(text):
+        if match.group(3):
+            line = text.count('\n', 0, match.start()) + 1
+            raise StringsError(f"ローカライズ文字列を解釈できません: {where}:{line}")
+        if match.group(1) is not None:
+            strings[_unescape(match.group(1))] = _unescape(match.group(2))
+    return strings
+
+
+_tables = {}
+
+
+def get_strings(locale=DEFAULT_LOCALE):
+    """ロケールの {キー: 文言}（初回だけファイルを読む）"""
+    strings = _tables.get(locale)
+    if strings is None:
+        path = strings_path(locale)
+        try:
+            with open(path, encoding='utf-8') as f:
+                text = f.read()
+        except OSError as exc:
+            raise StringsError(f"ローカライズ文字列を読み込めません: {locale} ({exc})") from None
+        strings = _tables[locale] = parse_strings(text, path)
+    return strings
+
+
+def localize(key, locale=DEFAULT_LOCALE):
+    """キーの文言"""
+    try:
+        return get_strings(locale)[key]
+    except KeyError:
+        raise StringNotFoundError(f"ローカライズ文字列が見つかりません: {key} ({strings_path(locale)})") from None
+
+
+def localized_keys(value):
+    """value（シーン仕様の一部）の中の {"localized": キー} のキーを順に返す"""
+    if isinstance(value, dict):
+        if set(value) == {'localized'}:
+            yield value['localized']
+            return
+        for item in value.values():
+            yield from localized_keys(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from localized_keys(item)
+
+
+def resolve(value, locale=DEFAULT_LOCALE):
+    """value の中の {"localized": キー} を文言に置き換えた複製"""
+    if isinstance(value, dict):
+        if set(value) == {'localized'}:
+            return localize(value['localized'], locale)
+        return {key: resolve(item, locale) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve(item, locale) for item in value]
+    return value
+
+
+def clear():
+    """読み込んだ表を捨てる（次の get_strings() でファイルを読み直す）"""
+    _tables.clear()
@@ -0,0 +1,161 @@
+"""
+テキストランのビットマップキャッシュ
+
+"9:41" やナビゲーションバーのタイトル、モデル名など、画面をまたいで何度も描かれる文字列を
+1回だけラスタライズし、以降はアルファマスクを合成するだけで描画する。
+マスクは (フォント, 文字列, アンカー, サブピクセル位置) をキーに保存し、
+色は合成時に指定するため、同じ文字列を別の色で描いてもキャッシュを共有する。
+フォントにない文字を含む文字列はフォールバックフォントのランに分け、ランごとに同じ経路で描く。
+"""
+
+import math
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from PIL import ImageDraw, ImageFont
+
+from . import emoji, fallback
+from .metrics import baseline, text_width
+from .shapes import draw_rounded_rect
+
+# キャッシュするマスクの合計サイズの上限（バイト）
+DEFAULT_BUDGET = 32 * 1024 * 1024
+
+
+class TextRunCache:
+    """メモリ上限付きの LRU マスクキャッシュ（バッチごとのヒット率を記録）"""
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        self.budget = budget
+        self.nbytes = 0
+        self.evictions = 0
+        self._masks = OrderedDict()
+        self._batches = OrderedDict()
+        self._current = None
+
+    def get(self, font, mode, text, anchor, start):
+        """マスクと描画オフセットを返す（なければラスタライズして保存）"""
+        key = (font, mode, text, anchor, start)
+        entry = self._masks.get(key)
+        if entry is not None:
+            self._count(hit=True)
+            self._masks.move_to_end(key)
+            return entry
+
+        self._count(hit=False)
+        mask, offset = font.getmask2(text, mode, anchor=anchor, start=start)
+        entry = (mask, offset)
+        size = mask.size[0] * mask.size[1]
+        if size <= self.budget:
+            self._masks[key] = entry
+            self.nbytes += size
+            self._evict()
+        return entry
+
+    def _evict(self):
+        while self.nbytes > self.budget:
+            _, (mask, _) = self._masks.popitem(last=False)
+            self.nbytes -= mask.size[0] * mask.size[1]
+            self.evictions += 1
+
+    def _count(self, hit):
+        stats = self._batches.get(self._current)
+        if stats is None:
+            stats = self._batches[self._current] = {'hits': 0, 'misses': 0}
+        stats['hits' if hit else 'misses'] += 1
+
+    @contextmanager
+    def batch(self, name):
+        """with ブロック内の描画を name のバッチとして集計する"""
+        previous, self._current = self._current, name
+        try:
+            yield self
+        finally:
+            self._current = previous
+
+    def stats(self, name=None):
+        """バッチ（省略時は全体）のヒット・ミス数とヒット率"""
+        if name is None:
+            hits = sum(s['hits'] for s in self._batches.values())
+            misses = sum(s['misses'] for s in self._batches.values())
+        else:
+            batch = self._batches.get(name, {'hits': 0, 'misses': 0})
+            hits, misses = batch['hits'], batch['misses']
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / total if total else 0.0,
+            'entries': len(self._masks),
+            'bytes': self.nbytes,
+            'evictions': self.evictions,
+        }
+
+    def report(self, name=None):
+        """ヒット率の1行サマリー"""
+        stats = self.stats(name)
+        label = name or "total"
+        return (f"🔠 テキストキャッシュ [{label}]: {stats['hits']} hits / {stats['misses']} misses "
+                f"({stats['hit_rate']:.0%}), {stats['entries']} runs, {stats['bytes'] / 1024:.0f} KiB")
+
+    def clear(self):
+        self._masks.clear()
+        self._batches.clear()
+        self.nbytes = 0
+        self.evictions = 0
+
+
+text_runs = TextRunCache()
+
+
+class TextDraw(ImageDraw.ImageDraw):
+    """単一行テキストと角丸四角形をキャッシュ済みのマスクで描く ImageDraw
+
+    絵文字を含むテキストは絵文字アトラスから合成し、フォントにない文字はフォールバックフォントで描く。
+    複数行・縁取り・カラー絵文字・レイアウトオプション付きのテキストや、
+    一部の角だけを丸める角丸四角形は通常の ImageDraw に任せる。
+    """
+
+    def __init__(self, im, mode=None, cache=None):
+        super().__init__(im, mode)
+        self.image = im
+        self.cache = cache if cache is not None else text_runs
+
+    def text(self, xy, text, fill=None, font=None, anchor=None, *args, **kwargs):
+        if (args or kwargs or not isinstance(text, str) or '\n' in text
+                or not isinstance(font, ImageFont.FreeTypeFont)):
+            return super().text(xy, text, fill, font, anchor, *args, **kwargs)
+        if emoji.has_emoji(text):
+            return emoji.draw_text(self, self.image, xy, text, fill, font, anchor)
+        runs = fallback.split_runs(text, font)
+        if len(runs) > 1 or runs[0][0] is not font:
+            return self._draw_runs(xy, runs, fill, font, anchor)
+
+        ink, fill_ink = self._getink(fill)
+        if ink is None:
+            ink = fill_ink
+        if ink is None:
+            return
+
+        x, y = xy
+        start = (math.modf(x)[0], math.modf(y)[0])
+        mask, offset = self.cache.get(font, self.fontmode, text, anchor, start)
+        self.draw.draw_bitmap((int(x) + offset[0], int(y) + offset[1]), mask, ink)
+
+    def _draw_runs(self, xy, runs, fill, font, anchor):
+        """フォールバックのランを主フォントのベースラインにそろえて順に描く"""
+        anchor = anchor or 'la'
+        x, y = xy
+        if anchor[0] in 'mr':
+            width = sum(text_width(run_font, run) for run_font, run in runs)
+            x -= width / 2 if anchor[0] == 'm' else width
+        y = baseline(font, y, anchor)
+        for run_font, run in runs:
+            self.text((x, y), run, fill, run_font, 'ls')
+            x += text_width(run_font, run)
+
+    def rounded_rectangle(self, xy, radius=0, fill=None, outline=None, width=1, *, corners=None):
+        if corners is not None:
+            return super().rounded_rectangle(xy, radius, fill, outline, width, corners=corners)
+        (x1, y1), (x2, y2) = xy if len(xy) == 2 else (xy[:2], xy[2:])
+        draw_rounded_rect(self, x1, y1, x2, y2, radius, fill, outline, width)
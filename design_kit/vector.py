@@ -0,0 +1,334 @@
+"""
+ベクター出力（SVG / PDF）
+
+VectorCanvas は ImageDraw・ShapeBatch と同じ呼び出しで図形・テキスト・画像を記録し、
+解像度を持たないまま SVG や PDF に書き出す。テキストはテキストのまま（フォールバックのランごとに
+フォントを指定）、グラデーションは SVG / PDF のグラデーションオブジェクトのまま出力するため、
+どのサイズに拡大しても劣化せず、Python なしで再ラスタライズできる。
+カラー絵文字だけはフォントに依存しないよう、高解像度のスプライトを画像として埋め込む。
+
+    canvas = VectorCanvas((800, 300))
+    canvas.linear_gradient((0, 0, 800, 300), [start, end], 'horizontal')
+    canvas.text((400, 150), "MindBridge", fill=(255, 255, 255), font=font, anchor="mm")
+    canvas.save("logo.svg")   # 拡張子が .pdf なら PDF
+"""
+
+import base64
+import io
+import math
+import os
+from collections import namedtuple
+from xml.sax.saxutils import escape
+
+from . import emoji, fallback
+from .fonts import font_face
+from .gradients import normalize_stops, parse_color
+from .metrics import DEFAULT_SPACING, baseline, line_height, text_width
+
+# 記録する要素（色は (r, g, b, a)、矩形は右下を含まない辺の座標）
+Rect = namedtuple('Rect', 'box radius fill outline width')
+Ellipse = namedtuple('Ellipse', 'box fill outline width')
+Arc = namedtuple('Arc', 'box start end color width')
+Polyline = namedtuple('Polyline', 'points color width round_caps')
+Text = namedtuple('Text', 'x y font text fill')   # y はベースライン
+Picture = namedtuple('Picture', 'box image')
+# kind: 'linear'（geometry は始点と終点）/ 'radial'（geometry は中心と半径）
+Gradient = namedtuple('Gradient', 'box radius kind stops geometry')
+
+# 絵文字のスプライトを文字サイズの何倍の解像度で埋め込むか
+EMOJI_RESOLUTION = 4
+
+
+def _rgba(color):
+    if color is None:
+        return None
+    rgba = parse_color(color)
+    return rgba if len(rgba) == 4 else rgba + (255,)
+
+
+def _points(xy):
+    if xy and isinstance(xy[0], (tuple, list)):
+        return [tuple(p) for p in xy]
+    return list(zip(xy[0::2], xy[1::2]))
+
+
+def _box(xy):
+    """ImageDraw の矩形指定（右下を含む）を辺の座標に変換"""
+    (x1, y1), (x2, y2) = _points(xy)
+    return x1, y1, x2 + 1, y2 + 1
+
+
+def _linear_geometry(box, direction):
+    """線形グラデーションの始点と終点（gradients.linear_gradient と同じ方向の解釈）"""
+    x1, y1, x2, y2 = box
+    if direction == 'vertical':
+        return (x1, y1, x1, y2)
+    if direction == 'horizontal':
+        return (x1, y1, x2, y1)
+    theta = math.radians(float(direction))
+    dx, dy = math.cos(theta), math.sin(theta)
+    corners = [0.0, (x2 - x1) * dx, (y2 - y1) * dy, (x2 - x1) * dx + (y2 - y1) * dy]
+    low, high = min(corners), max(corners)
+    return (x1 + low * dx, y1 + low * dy, x1 + high * dx, y1 + high * dy)
+
+
+class VectorCanvas:
+    """描画命令を解像度を持たない要素として記録するキャンバス"""
+
+    def __init__(self, size):
+        self.size = size
+        self.items = []
+
+    def __len__(self):
+        return len(self.items)
+
+    # --- 図形（ImageDraw / ShapeBatch 互換） ---
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self.rounded_rectangle(xy, 0, fill, outline, width)
+
+    def rounded_rectangle(self, xy, radius=0, fill=None, outline=None, width=1):
+        if fill is None and outline is None:
+            return
+        self.items.append(Rect(_box(xy), radius, _rgba(fill), _rgba(outline), width if outline else 0))
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        if fill is None and outline is None:
+            return
+        self.items.append(Ellipse(_box(xy), _rgba(fill), _rgba(outline), width if outline else 0))
+
+    def circle(self, xy, radius, fill=None, outline=None, width=1):
+        x, y = xy
+        self.ellipse([x - radius, y - radius, x + radius, y + radius], fill, outline, width)
+
+    def arc(self, xy, start, end, fill=None, width=1):
+        """楕円弧（角度は3時方向から時計回り、線は内側に width 幅）"""
+        if fill is not None:
+            self.items.append(Arc(_box(xy), start, end, _rgba(fill), width))
+
+    def line(self, xy, fill=None, width=1):
+        if fill is not None:
+            self.items.append(Polyline([(x + 0.5, y + 0.5) for x, y in _points(xy)], _rgba(fill), width, False))
+
+    def capsule(self, xy, fill=None, width=1):
+        if fill is not None:
+            self.items.append(Polyline([(x + 0.5, y + 0.5) for x, y in _points(xy)], _rgba(fill), width, True))
+
+    def paste(self, image, position, mask=None):
+        """画像をそのまま埋め込む（mask はアルファとして使う）"""
+        image = image.convert('RGBA')
+        if mask is not None:
+            image.putalpha(mask.convert('L'))
+        x, y = position
+        self.items.append(Picture((x, y, x + image.width, y + image.height), image))
+
+    # --- グラデーション ---
+
+    def linear_gradient(self, box, stops, direction='vertical', radius=0):
+        """box（辺の座標）を線形グラデーションで塗る（radius で角を丸める）"""
+        self.items.append(Gradient(tuple(box), radius, 'linear', normalize_stops(stops),
+                                   _linear_geometry(box, direction)))
+
+    def radial_gradient(self, box, stops, center=None, radius=None):
+        """box を放射状グラデーションで塗る（center は box 内の座標、省略時は gradients と同じ既定値）"""
+        x1, y1, x2, y2 = box
+        cx, cy = center if center is not None else ((x2 - x1) // 2, (y2 - y1) // 2)
+        if radius is None:
+            radius = math.hypot(cx, cy)
+        self.items.append(Gradient(tuple(box), 0, 'radial', normalize_stops(stops), (x1 + cx, y1 + cy, radius)))
+
+    # --- テキスト ---
+
+    def text(self, xy, text, fill=None, font=None, anchor=None):
+        """1行（改行を含む場合は複数行）のテキストを、フォールバックのランと絵文字の画像に分けて記録"""
+        if fill is None or not text:
+            return
+        if '\n' in text:
+            x, y = xy
+            for line in text.split('\n'):
+                self.text((x, y), line, fill, font, anchor)
+                y += line_height(font) + DEFAULT_SPACING
+            return
+
+        anchor = anchor or 'la'
+        runs = emoji.split_runs(text)
+        x, y = xy
+        if anchor[0] in 'mr':
+            width = emoji.run_width(runs, font)
+            x -= width / 2 if anchor[0] == 'm' else width
+        y = baseline(font, y, anchor)
+        fill = _rgba(fill)
+
+        for is_emoji, segment in runs:
+            if is_emoji:
+                x += self._emoji(x, y, segment, fill, font)
+                continue
+            for run_font, run in fallback.split_runs(segment, font):
+                self.items.append(Text(x, y, run_font, run, fill))
+                x += text_width(run_font, run)
+
+    def _emoji(self, x, y, cluster, fill, font):
+        """絵文字を高解像度のスプライトとして記録し、送り幅を返す"""
+        sprite = emoji.atlas.get(cluster, font.size * EMOJI_RESOLUTION, font_face(font))
+        if sprite is None:
+            return 0
+        _, _, left, top, advance, color = sprite
+        image = emoji.atlas.image(sprite)
+        if not color:
+            # 単色のグリフは文字色で塗る
+            tinted = image.copy()
+            tinted.paste(fill[:3], (0, 0, image.width, image.height))
+            tinted.putalpha(image.getchannel('A').point(lambda a: a * fill[3] // 255))
+            image = tinted
+        scale = 1 / EMOJI_RESOLUTION
+        left, top = x + left * scale, y + top * scale
+        self.items.append(Picture((left, top, left + image.width * scale, top + image.height * scale), image))
+        return advance * scale
+
+    # --- 書き出し ---
+
+    def to_svg(self):
+        return SvgWriter(self).write()
+
+    def to_pdf(self):
+        from .pdf import PdfWriter
+        return PdfWriter(self).write()
+
+    def save(self, path):
+        """拡張子に合わせて SVG (.svg) または PDF (.pdf) で保存"""
+        extension = os.path.splitext(path)[1].lower()
+        if extension == '.svg':
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self.to_svg())
+        elif extension == '.pdf':
+            with open(path, 'wb') as f:
+                f.write(self.to_pdf())
+        else:
+            raise ValueError(f"ベクター形式ではありません: {path}")
+
+
+# --- SVG ---
+
+def _n(value):
+    """座標を短い10進表記にする"""
+    text = f"{value:.3f}".rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+def _svg_color(rgba, prefix, opacity=None):
+    """fill / stroke / stop-color の色と不透明度の属性"""
+    attrs = f'{prefix}="#{rgba[0]:02x}{rgba[1]:02x}{rgba[2]:02x}"'
+    if rgba[3] != 255:
+        attrs += f' {opacity or prefix + "-opacity"}="{_n(rgba[3] / 255)}"'
+    return attrs
+
+
+def font_css(font):
+    """SVG の font-family / font-weight 属性"""
+    family, style = font.getname()
+    generic = 'monospace' if 'Mono' in family else 'sans-serif'
+    attrs = f"font-family=\"'{escape(family)}', {generic}\" font-size=\"{_n(font.size)}\""
+    if 'Bold' in style:
+        attrs += ' font-weight="bold"'
+    if 'Italic' in style or 'Oblique' in style:
+        attrs += ' font-style="italic"'
+    return attrs
+
+
+def png_bytes(image):
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG', optimize=True)
+    return buffer.getvalue()
+
+
+class SvgWriter:
+    """VectorCanvas を SVG 文書にする"""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.defs = []
+        self.body = []
+
+    def write(self):
+        for item in self.canvas.items:
+            getattr(self, f'_{type(item).__name__.lower()}')(item)
+        width, height = self.canvas.size
+        head = (f'<svg xmlns="http://www.w3.org/2000/svg" width="{_n(width)}" height="{_n(height)}" '
+                f'viewBox="0 0 {_n(width)} {_n(height)}">')
+        defs = ['<defs>', *self.defs, '</defs>'] if self.defs else []
+        return '\n'.join([head, *defs, *self.body, '</svg>']) + '\n'
+
+    def _rect(self, item):
+        x1, y1, x2, y2 = item.box
+        if item.fill:
+            self.body.append(f'<rect {self._rect_geometry(item.box, item.radius)} {_svg_color(item.fill, "fill")}/>')
+        if item.outline and item.width:
+            # 枠線は ImageDraw と同じく図形の内側に描く
+            half = item.width / 2
+            inset = (x1 + half, y1 + half, x2 - half, y2 - half)
+            self.body.append(f'<rect {self._rect_geometry(inset, max(item.radius - half, 0))} fill="none" '
+                             f'{_svg_color(item.outline, "stroke")} stroke-width="{_n(item.width)}"/>')
+
+    @staticmethod
+    def _rect_geometry(box, radius):
+        x1, y1, x2, y2 = box
+        radius = min(radius, (x2 - x1) / 2, (y2 - y1) / 2)
+        geometry = f'x="{_n(x1)}" y="{_n(y1)}" width="{_n(x2 - x1)}" height="{_n(y2 - y1)}"'
+        return geometry + (f' rx="{_n(radius)}"' if radius > 0 else '')
+
+    def _ellipse(self, item):
+        x1, y1, x2, y2 = item.box
+        cx, cy, rx, ry = (x1 + x2) / 2, (y1 + y2) / 2, (x2 - x1) / 2, (y2 - y1) / 2
+        if item.fill:
+            self.body.append(f'<ellipse cx="{_n(cx)}" cy="{_n(cy)}" rx="{_n(rx)}" ry="{_n(ry)}" '
+                             f'{_svg_color(item.fill, "fill")}/>')
+        if item.outline and item.width:
+            half = item.width / 2
+            self.body.append(f'<ellipse cx="{_n(cx)}" cy="{_n(cy)}" rx="{_n(rx - half)}" ry="{_n(ry - half)}" '
+                             f'fill="none" {_svg_color(item.outline, "stroke")} stroke-width="{_n(item.width)}"/>')
+
+    def _arc(self, item):
+        x1, y1, x2, y2 = item.box
+        half = item.width / 2
+        cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+        rx, ry = (x2 - x1) / 2 - half, (y2 - y1) / 2 - half
+        span = (item.end - item.start) % 360 or 360
+        if span >= 360:
+            self._ellipse(Ellipse(item.box, None, item.color, item.width))
+            return
+        start, end = math.radians(item.start), math.radians(item.start + span)
+        sx, sy = cx + rx * math.cos(start), cy + ry * math.sin(start)
+        ex, ey = cx + rx * math.cos(end), cy + ry * math.sin(end)
+        large = 1 if span > 180 else 0
+        self.body.append(f'<path d="M{_n(sx)} {_n(sy)} A{_n(rx)} {_n(ry)} 0 {large} 1 {_n(ex)} {_n(ey)}" '
+                         f'fill="none" {_svg_color(item.color, "stroke")} stroke-width="{_n(item.width)}"/>')
+
+    def _polyline(self, item):
+        points = ' '.join(f'{_n(x)},{_n(y)}' for x, y in item.points)
+        cap = 'round' if item.round_caps else 'butt'
+        self.body.append(f'<polyline points="{points}" fill="none" {_svg_color(item.color, "stroke")} '
+                         f'stroke-width="{_n(item.width)}" stroke-linecap="{cap}"/>')
+
+    def _text(self, item):
+        self.body.append(f'<text x="{_n(item.x)}" y="{_n(item.y)}" {font_css(item.font)} '
+                         f'{_svg_color(item.fill, "fill")} xml:space="preserve">{escape(item.text)}</text>')
+
+    def _picture(self, item):
+        x1, y1, x2, y2 = item.box
+        data = base64.b64encode(png_bytes(item.image)).decode('ascii')
+        self.body.append(f'<image x="{_n(x1)}" y="{_n(y1)}" width="{_n(x2 - x1)}" height="{_n(y2 - y1)}" '
+                         f'preserveAspectRatio="none" href="data:image/png;base64,{data}"/>')
+
+    def _gradient(self, item):
+        name = f'g{len(self.defs)}'
+        stops = ''.join(f'<stop offset="{_n(position)}" {_svg_color(_rgba(color), "stop-color", "stop-opacity")}/>'
+                        for position, color in item.stops)
+        if item.kind == 'linear':
+            x1, y1, x2, y2 = item.geometry
+            self.defs.append(f'<linearGradient id="{name}" gradientUnits="userSpaceOnUse" x1="{_n(x1)}" '
+                             f'y1="{_n(y1)}" x2="{_n(x2)}" y2="{_n(y2)}">{stops}</linearGradient>')
+        else:
+            cx, cy, r = item.geometry
+            self.defs.append(f'<radialGradient id="{name}" gradientUnits="userSpaceOnUse" cx="{_n(cx)}" '
+                             f'cy="{_n(cy)}" r="{_n(r)}">{stops}</radialGradient>')
+        self.body.append(f'<rect {self._rect_geometry(item.box, item.radius)} fill="url(#{name})"/>')
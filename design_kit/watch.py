@@ -0,0 +1,198 @@
+"""
+シーンのウォッチモード
+
+1つのプロセスを起動したままにして、シーン仕様・会話コーパス・ローカライズ文字列 (.strings)・
+生成スクリプト (screenshots/*.py) の変更を監視し、変更された入力に依存するシーンだけを描き直す。
+フォント・クロームレイヤー・グラデーション・レイアウトの各キャッシュはプロセス内に残るため、
+編集ごとの再描画は Python・Pillow・NumPy の起動やフォントの読み込みを待たずに終わる。
+
+    screenshots/scenes/<name>.json   → そのシーン
+    screenshots/conversations.jsonl  → "conversation" の会話の内容が変わったシーン
+    <ロケール>.lproj/Localizable.strings → {"localized": ...} で使っている文言が変わったシーン
+    screenshots/*.py                 → スクリプトの SCENES に並んだシーン
+    design_kit/*.py                  → プロセスを起動し直し、すべて描き直す
+
+    python -m design_kit.watch                                # すべてのシーン
+    python -m design_kit.watch chat_screen --device iphone_6_9
+"""
+
+import argparse
+import ast
+import glob
+import os
+import sys
+import time
+import traceback
+
+from . import corpus, strings
+from .corpus import CORPUS_PATH
+from .paths import PROJECT_ROOT
+from .scene import (OUTPUT_DIR, SCENE_DIR, input_value, load_scene, render_scenes, scene_inputs, scene_names,
+                    scene_path)
+from .strings import STRINGS_FILE, locales, strings_path
+from .textcache import text_runs
+
+# ファイルの更新を確かめる間隔（秒）
+POLL_INTERVAL = 0.2
+
+SCRIPT_DIR = os.path.join(PROJECT_ROOT, "screenshots")
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def script_scenes(path):
+    """生成スクリプトの SCENES に並んだシーン名（スクリプトは import せず、構文だけを読む）"""
+    try:
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read(), path)
+    except (OSError, SyntaxError):
+        return []
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(target, 'id', None) == 'SCENES' for target in node.targets):
+            try:
+                return [name for name in ast.literal_eval(node.value) if isinstance(name, str)]
+            except ValueError:
+                return []
+    return []
+
+
+def _signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+class Restart(Exception):
+    """design_kit のソースが変わったため、プロセスを起動し直す"""
+
+
+class Watcher:
+    """入力ファイルの更新を監視し、依存するシーンだけを描き直す"""
+
+    def __init__(self, names=None, output_dir=OUTPUT_DIR, device=None, interval=POLL_INTERVAL):
+        self.names = list(names) if names else None
+        self.output_dir = output_dir
+        self.device = device
+        self.interval = interval
+        self.signatures = {}
+        # シーン名 → 前回描いたときの会話・文言 {入力: 内容}
+        self.inputs = {}
+
+    def scenes(self):
+        """監視するシーン（名前を指定しなければ SCENE_DIR のすべてで、追加されたシーンも含む）"""
+        return self.names if self.names is not None else scene_names()
+
+    def watched(self):
+        """監視するファイルのパス"""
+        paths = [scene_path(name) for name in self.scenes()]
+        paths.append(CORPUS_PATH)
+        paths.extend(strings_path(locale) for locale in locales())
+        paths.extend(sorted(glob.glob(os.path.join(SCRIPT_DIR, '*.py'))))
+        paths.extend(sorted(glob.glob(os.path.join(SOURCE_DIR, '*.py'))))
+        return paths
+
+    def poll(self):
+        """前回の確認から更新・追加されたファイルのパス"""
+        signatures = {path: _signature(path) for path in self.watched()}
+        changed = [path for path, signature in signatures.items()
+                   if signature is not None and self.signatures.get(path) != signature]
+        self.signatures = signatures
+        return changed
+
+    def wait(self):
+        """ファイルが更新されるまで待ち、書き込みが落ち着いてから更新されたパスを返す"""
+        while True:
+            time.sleep(self.interval)
+            changed = self.poll()
+            if changed:
+                break
+        # エディタが数回に分けて保存する場合に備え、更新が止まるまで待つ
+        while True:
+            time.sleep(self.interval)
+            more = self.poll()
+            if not more:
+                return changed
+            changed.extend(path for path in more if path not in changed)
+
+    def dependents(self, paths):
+        """更新されたパスに依存するシーン名（design_kit のソースが変わった場合は Restart を送出）"""
+        scenes = self.scenes()
+        names = set()
+        refresh = False
+        for path in paths:
+            if os.path.dirname(path) == SOURCE_DIR:
+                raise Restart(path)
+            if path == CORPUS_PATH:
+                corpus.clear()
+                refresh = True
+            elif os.path.basename(path) == STRINGS_FILE:
+                strings.clear()
+                refresh = True
+            elif os.path.dirname(path) == SCENE_DIR:
+                names.add(os.path.basename(path)[:-5])
+            else:
+                names.update(script_scenes(path))
+        if refresh:
+            # 会話・文言は、前回描いたときから内容が変わったものを使うシーンだけ描き直す
+            names.update(name for name, inputs in self.inputs.items()
+                         if any(input_value(item) != value for item, value in inputs.items()))
+        return [name for name in scenes if name in names]
+
+    def render(self, names):
+        """シーンを描き直し、描けたシーンの数を返す（仕様の誤りなどで失敗しても監視は続ける）"""
+        rendered = 0
+        for name in names:
+            try:
+                spec = load_scene(scene_path(name))
+                self.inputs[name] = {item: input_value(item) for item in scene_inputs(spec)}
+                render_scenes([name], self.output_dir, self.device)
+                rendered += 1
+            except Exception as exc:
+                self.inputs.pop(name, None)
+                print(f"❌ {name}: {''.join(traceback.format_exception_only(exc)).strip()}")
+        return rendered
+
+    def run(self):
+        """すべてのシーンを1回描き、以降は更新のたびに依存するシーンだけを描き直す（Ctrl+C で終了）"""
+        self.poll()
+        self.round(self.scenes(), "起動")
+        print(f"👀 {len(self.signatures)} files を監視しています（Ctrl+C で終了）")
+        while True:
+            changed = self.wait()
+            names = self.dependents(changed)
+            label = ", ".join(os.path.relpath(path, PROJECT_ROOT) for path in changed)
+            if names:
+                self.round(names, label)
+            else:
+                print(f"💤 {label}: 描き直すシーンはありません")
+
+    def round(self, names, label):
+        start = time.perf_counter()
+        with text_runs.batch("watch"):
+            rendered = self.render(names)
+        print(f"🔄 {label}: {rendered}/{len(names)} scenes in {time.perf_counter() - start:.2f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="入力の変更を監視し、依存するシーンだけを描き直す")
+    parser.add_argument('names', nargs='*', help="シーン名（省略時はすべて）")
+    parser.add_argument('--device', help="端末名（省略時は既定の端末を 1 倍で描く）")
+    parser.add_argument('-o', '--output', default=OUTPUT_DIR, help=f"出力先ディレクトリ（既定: {OUTPUT_DIR}）")
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL, help="更新を確かめる間隔（秒）")
+    args = parser.parse_args(argv)
+
+    output_dir = os.path.join(args.output, args.device) if args.device else args.output
+    watcher = Watcher(args.names, output_dir, args.device, args.interval)
+    try:
+        watcher.run()
+    except Restart as exc:
+        print(f"♻️ {os.path.relpath(str(exc), PROJECT_ROOT)} が変更されたため起動し直します")
+        os.execv(sys.executable, [sys.executable, '-m', __spec__.name, *(sys.argv[1:] if argv is None else argv)])
+    except KeyboardInterrupt:
+        print(f"\n{text_runs.report('watch')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+# 索引などの永続キャッシュはテストごとの一時ディレクトリに作る（design_kit の import 前に設定する）
+os.environ['MINDBRIDGE_CACHE_DIR'] = tempfile.mkdtemp(prefix='mindbridge-test-')
+
+
+@pytest.fixture
+def vector_canvas():
+    """すべての種類の要素（図形・グラデーション・画像・記号や日本語を含むテキスト）を載せた VectorCanvas"""
+    from PIL import Image
+
+    from design_kit.fonts import get_font
+    from design_kit.vector import VectorCanvas
+
+    canvas = VectorCanvas((320, 240))
+    canvas.rectangle((0, 0, 320, 240), fill='#ffffff')
+    canvas.rounded_rectangle((10, 10, 150, 60), 12, fill=(20, 40, 60, 128), outline='#ff0000', width=2)
+    canvas.ellipse((160, 10, 200, 50), fill='#00ff00', outline='#0000ff', width=3)
+    canvas.arc((210, 10, 250, 50), 0, 270, fill='#123456', width=4)
+    canvas.line([(10, 70), (100, 90), (150, 70)], fill='#000000', width=2)
+    canvas.capsule([(160, 80), (300, 80)], fill='#abcdef', width=6)
+    canvas.linear_gradient((10, 100, 150, 140), [(0, '#ff0000'), (1, '#0000ff80')], 'horizontal', 8)
+    canvas.radial_gradient((160, 100, 300, 140), [(0, '#ffffff'), (1, '#000000')])
+    canvas.paste(Image.new('RGBA', (16, 16), (255, 0, 0, 128)), (10, 150))
+    canvas.text((40, 150), 'a < b && "c" > \'d\'', fill='#000000', font=get_font(14))
+    canvas.text((40, 180), '設定\nMindBridge', fill='#333333', font=get_font(14, bold=True))
+    return canvas
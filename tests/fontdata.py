@@ -0,0 +1,135 @@
+"""
+テスト用の最小限のフォントを組み立てるヘルパー
+
+TrueType 以外のフォント（CFF / CID-keyed CFF）はテスト環境に入っていないため、
+cmap・head・hhea・hmtx・maxp と手で組んだ CFF から OpenType を作る。
+"""
+
+import struct
+
+from design_kit.sfnt import build_sfnt
+
+# Type 2 charstring の断片
+ENDCHAR = bytes([14])
+RETURN = bytes([11])
+
+
+def number(value):
+    """-107 … 107 の整数を charstring / DICT の1バイトの数値にする"""
+    assert -107 <= value <= 107
+    return bytes([value + 139])
+
+
+def int5(value):
+    return b'\x1d' + struct.pack('>i', value)
+
+
+def op(code):
+    return bytes([12, code - 1200]) if code >= 1200 else bytes([code])
+
+
+def cff_dict(*entries):
+    """(演算子, 値のリスト) の並びを DICT にする（値はすべて5バイトの整数で書く）"""
+    return b''.join(b''.join(int5(v) for v in values) + op(code) for code, values in entries)
+
+
+def cff_index(items):
+    offsets = [1]
+    for item in items:
+        offsets.append(offsets[-1] + len(item))
+    if not items:
+        return b'\0\0'
+    return struct.pack('>HB', len(items), 4) + b''.join(struct.pack('>I', o) for o in offsets) + b''.join(items)
+
+
+def build_cff(charstrings, global_subrs, local_subrs, cids=None):
+    """CFF を組み立てる。cids を渡すと GID 1 以降をその CID に対応付ける CID-keyed の CFF にする"""
+    header = bytes([1, 0, 4, 4])
+    names = cff_index([b'TestFont'])
+    strings = cff_index([b'Adobe', b'Identity'] if cids else [])
+    gsubrs = cff_index(global_subrs)
+    count = len(charstrings)
+    # CID-keyed でなければ GID 1 以降に仮の SID を振る
+    codes = cids if cids else list(range(391, 391 + count - 1))
+    charset = bytes([0]) + struct.pack(f'>{count - 1}H', *codes)
+    fdselect = bytes([3]) + struct.pack('>HHBH', 1, 0, 0, count) if cids else b''
+    charstrings_index = cff_index(charstrings)
+
+    def private_dict(subrs_offset):
+        return cff_dict((19, [subrs_offset])) if local_subrs else b''
+
+    private_length = len(private_dict(0))
+    private = private_dict(private_length) + (cff_index(local_subrs) if local_subrs else b'')
+
+    def top_dict(offsets):
+        entries = [(15, [offsets['charset']]), (17, [offsets['charstrings']])]
+        if cids:
+            entries = [(1230, [391, 392, 0])] + entries + [(1237, [offsets['fdselect']]),
+                                                          (1236, [offsets['fdarray']])]
+        else:
+            entries.append((18, [private_length, offsets['private']]))
+        return cff_index([cff_dict(*entries)])
+
+    def fdarray(offsets):
+        return cff_index([cff_dict((18, [private_length, offsets['private']]))]) if cids else b''
+
+    offsets = dict.fromkeys(('charset', 'fdselect', 'charstrings', 'fdarray', 'private'), 0)
+    position = len(header) + len(names) + len(top_dict(offsets)) + len(strings) + len(gsubrs)
+    for name, data in (('charset', charset), ('fdselect', fdselect), ('charstrings', charstrings_index),
+                       ('fdarray', fdarray(offsets)), ('private', private)):
+        offsets[name] = position
+        position += len(data)
+    return b''.join([header, names, top_dict(offsets), strings, gsubrs, charset, fdselect, charstrings_index,
+                     fdarray(offsets), private])
+
+
+def cmap_format4(mapping):
+    codes = sorted(code for code in mapping if code < 0xFFFF)
+    segments = [(code, code, (mapping[code] - code) & 0xFFFF) for code in codes] + [(0xFFFF, 0xFFFF, 1)]
+    count = len(segments)
+    body = struct.pack(f'>{count}H', *(end for _, end, _ in segments)) + b'\0\0'
+    body += struct.pack(f'>{count}H', *(start for start, _, _ in segments))
+    body += struct.pack(f'>{count}H', *(delta for _, _, delta in segments))
+    body += bytes(2 * count)
+    return struct.pack('>HHHHHHH', 4, 14 + len(body), 0, count * 2, 0, 0, 0) + body
+
+
+def cmap_format12(mapping):
+    groups = b''.join(struct.pack('>III', code, code, glyph) for code, glyph in sorted(mapping.items()))
+    return struct.pack('>HHIII', 12, 0, 16 + len(groups), 0, len(mapping)) + groups
+
+
+def build_cmap(mapping, format12=True):
+    """{コードポイント: グリフ ID} の cmap（format 4 と、format12 が真なら format 12 も入れる）"""
+    subtables = [((3, 1), cmap_format4(mapping))]
+    if format12:
+        subtables.append(((3, 10), cmap_format12(mapping)))
+    offset = 4 + 8 * len(subtables)
+    records = b''
+    for (platform, encoding), data in subtables:
+        records += struct.pack('>HHI', platform, encoding, offset)
+        offset += len(data)
+    return struct.pack('>HH', 0, len(subtables)) + records + b''.join(data for _, data in subtables)
+
+
+def build_tables(count, mapping, format12=True):
+    """cmap と計量のテーブル（グリフ数 count、送り幅はすべて 500、unitsPerEm は 1000）"""
+    head = struct.pack('>IIIIHHQQhhhhHHhhh', 0x00010000, 0x00010000, 0, 0x5F0F3CF5, 0, 1000, 0, 0,
+                       0, -200, 1000, 800, 0, 3, 2, 0, 0)
+    hhea = struct.pack('>IhhhHhhhhhhhhhhhH', 0x00010000, 800, -200, 0, 500, 0, 0, 500, 1, 0, 0,
+                       0, 0, 0, 0, 0, count)
+    return {
+        'cmap': build_cmap(mapping, format12),
+        'head': head,
+        'hhea': hhea,
+        'hmtx': struct.pack('>HH', 500, 0) * count,
+        'maxp': struct.pack('>IH', 0x00005000, count),
+    }
+
+
+def write_otf(path, cff, count, mapping):
+    tables = build_tables(count, mapping)
+    tables['CFF '] = cff
+    with open(path, 'wb') as f:
+        f.write(build_sfnt(tables, cff=True))
+    return path
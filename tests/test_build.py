@@ -0,0 +1,168 @@
+import json
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from design_kit import build
+from design_kit.build import MANIFEST_NAME, STAGING_PREFIX, Build, Job, Manifest, source_files
+
+# ジョブ a は helper_a を、ジョブ b は helper_b を import し、どちらも common を import する
+MODULES = {
+    'common.py': "SUFFIX = '!'\n",
+    'helper_a.py': "from common import SUFFIX\nVALUE = 'a1' + SUFFIX\n",
+    'helper_b.py': "import common\nVALUE = 'b1' + common.SUFFIX\n",
+    'job_a.py': "from helper_a import VALUE\n\ndef write(name):\n    open(name, 'w').write(VALUE)\n",
+    'job_b.py': textwrap.dedent("""\
+        import os
+        import time
+
+        import helper_b
+
+        def write(name, hang=None):
+            with open(name, 'w') as f:
+                f.write('partial')
+            while hang and os.path.exists(hang):
+                time.sleep(0.05)
+            with open(name, 'w') as f:
+                f.write(helper_b.VALUE)
+        """),
+}
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """ジョブのモジュールを置いた仮のプロジェクト（フォントの指紋は固定）"""
+    root = tmp_path / 'project'
+    root.mkdir()
+    for name, source in MODULES.items():
+        (root / name).write_text(source)
+    monkeypatch.setattr(build, 'PROJECT_ROOT', str(root))
+    monkeypatch.setattr(build, 'font_fingerprint', lambda manifest: 'fonts')
+    monkeypatch.syspath_prepend(str(root))
+    source_files.cache_clear()
+    yield root
+    source_files.cache_clear()
+
+
+def jobs(hang=None):
+    return [Job('a', 'job_a:write', ('a.txt',)), Job('b', 'job_b:write', ('b.txt', hang))]
+
+
+def run(output, job_list=None):
+    # ビルドはプロセスごとに import をたどり直す
+    source_files.cache_clear()
+    result = Build(job_list or jobs(), str(output), workers=1)
+    result.run()
+    assert not result.failures()
+    return result
+
+
+def edit(path, text):
+    """ファイルを書き換え、更新時刻の刻みに関係なく変更が見えるようにする"""
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_source_files_follow_imports(project):
+    assert {os.path.basename(path) for path in source_files('job_a')} == {'job_a.py', 'helper_a.py', 'common.py'}
+    assert {os.path.basename(path) for path in source_files('job_b')} == {'job_b.py', 'helper_b.py', 'common.py'}
+
+
+def test_unchanged_build_is_skipped(project, tmp_path):
+    output = tmp_path / 'out'
+    first = run(output)
+    assert sorted(first.results) == ['a', 'b'] and first.skipped == []
+    second = run(output)
+    assert second.results == {} and second.skipped == ['a', 'b']
+    assert (output / 'a.txt').read_text() == 'a1!' and (output / 'b.txt').read_text() == 'b1!'
+
+
+def test_editing_a_helper_rebuilds_only_dependent_jobs(project, tmp_path):
+    output = tmp_path / 'out'
+    run(output)
+
+    edit(project / 'helper_a.py', "from common import SUFFIX\nVALUE = 'a2' + SUFFIX\n")
+    rebuilt = run(output)
+    assert sorted(rebuilt.results) == ['a'] and rebuilt.skipped == ['b']
+    assert (output / 'a.txt').read_text() == 'a2!'
+
+    # 両方のジョブが import するモジュールの変更は両方を作り直す
+    edit(project / 'common.py', "SUFFIX = '?'\n")
+    rebuilt = run(output)
+    assert sorted(rebuilt.results) == ['a', 'b']
+    assert (output / 'a.txt').read_text() == 'a2?' and (output / 'b.txt').read_text() == 'b1?'
+
+
+def test_deleted_output_is_rebuilt(project, tmp_path):
+    output = tmp_path / 'out'
+    run(output)
+    (output / 'a.txt').unlink()
+    rebuilt = run(output)
+    assert sorted(rebuilt.results) == ['a'] and rebuilt.skipped == ['b']
+    assert (output / 'a.txt').read_text() == 'a1!'
+
+
+def test_killed_build_resumes(project, tmp_path):
+    output = tmp_path / 'out'
+    hang = tmp_path / 'hang'
+    hang.touch()
+    # ジョブ b の途中で止めたビルドをプロセスごと強制終了する
+    script = textwrap.dedent(f"""\
+        import sys
+        sys.path[:0] = [{str(project)!r}, {os.path.dirname(os.path.dirname(build.__file__))!r}]
+        from design_kit import build
+        build.PROJECT_ROOT = {str(project)!r}
+        build.font_fingerprint = lambda manifest: 'fonts'
+        jobs = [build.Job('a', 'job_a:write', ('a.txt',)), build.Job('b', 'job_b:write', ('b.txt', {str(hang)!r}))]
+        build.Build(jobs, {str(output)!r}, workers=1).run()
+        """)
+    process = subprocess.Popen([sys.executable, '-c', script], start_new_session=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 30
+        while not list(output.glob(f'{STAGING_PREFIX}*/b.txt')):
+            assert time.monotonic() < deadline and process.poll() is None
+            time.sleep(0.05)
+    finally:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+
+    # a は終わってマニフェストに記録され、b は書きかけのまま作業ディレクトリに残っている
+    assert json.loads((output / MANIFEST_NAME).read_text())['jobs'].keys() == {'a'}
+    assert not (output / 'b.txt').exists()
+    [staging] = output.glob(f'{STAGING_PREFIX}*')
+    assert (staging / 'b.txt').read_text() == 'partial'
+
+    resumed = run(output, jobs(str(hang) + '.released'))
+    assert sorted(resumed.results) == ['b'] and resumed.skipped == ['a']
+    assert (output / 'b.txt').read_text() == 'b1!'
+    assert not list(output.glob(f'{STAGING_PREFIX}*'))
+
+
+def test_digest_sees_same_size_edit_within_timestamp_granularity(tmp_path):
+    path = tmp_path / 'scene.json'
+    path.write_text('{"title": "A"}')
+    manifest = Manifest(str(tmp_path))
+    before = manifest.digest(str(path))
+    stat = path.stat()
+    # 同じサイズで書き換え、更新時刻も元に戻す（刻みの中で保存された場合と同じ）
+    path.write_text('{"title": "B"}')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert manifest.digest(str(path)) != before
+
+
+def test_digest_reuses_hash_of_settled_file(tmp_path, monkeypatch):
+    path = tmp_path / 'font.ttf'
+    path.write_bytes(b'\0' * 64)
+    old = path.stat().st_mtime_ns - 10 * 10**9
+    os.utime(path, ns=(old, old))
+    manifest = Manifest(str(tmp_path))
+    digest = manifest.digest(str(path))
+    monkeypatch.setattr(build.hashlib, 'sha256', None)
+    assert manifest.digest(str(path)) == digest
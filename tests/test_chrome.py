@@ -0,0 +1,31 @@
+from design_kit.chrome import ChromeLayers
+
+
+def paint_box(width, height):
+    def paint(draw):
+        draw.rectangle((0, 0, width - 1, height - 1), fill='#336699')
+    return paint
+
+
+def test_layers_are_reused_and_cropped():
+    layers = ChromeLayers()
+    layer, origin = layers.get('bar', (100, 100), lambda draw: draw.rectangle((10, 20, 29, 29), fill='#336699'))
+    assert layer.size == (20, 10) and origin == (10, 20)
+    assert layers.get('bar', (100, 100), None) == (layer, origin)
+    assert layers.get('empty', (100, 100), lambda draw: None) == (None, None)
+    stats = layers.stats()
+    assert (stats['hits'], stats['misses'], stats['layers'], stats['bytes']) == (1, 2, 2, 20 * 10 * 4)
+
+
+def test_least_recently_used_layers_are_evicted_over_budget():
+    layers = ChromeLayers(budget=3 * 100 * 100 * 4)
+    for name in 'abc':
+        layers.get(name, (100, 100), paint_box(100, 100))
+    layers.get('a', (100, 100), None)
+    layers.get('d', (100, 100), paint_box(100, 100))
+    assert list(layers._layers) == ['c', 'a', 'd']
+    stats = layers.stats()
+    assert stats['bytes'] <= layers.budget and stats['evictions'] == 1
+
+    layers.get('screen', (400, 400), paint_box(400, 400))
+    assert 'screen' not in layers._layers and layers.stats()['layers'] == 3
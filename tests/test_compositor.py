@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from design_kit.compositor import Compositor
+
+
+def blend_straight(src, dst, mode):
+    """ストレートアルファの RGBA (0..255) 同士の合成（W3C Compositing の式そのまま、比較用）"""
+    cs, sa = np.array(src[:3]) / 255.0, src[3] / 255.0
+    cd, da = np.array(dst[:3]) / 255.0, dst[3] / 255.0
+    mixed = {'over': cs, 'multiply': cs * cd, 'screen': cs + cd - cs * cd}[mode]
+    alpha = sa + da * (1 - sa)
+    premultiplied = sa * (1 - da) * cs + da * (1 - sa) * cd + sa * da * mixed
+    return premultiplied * 255, alpha * 255
+
+
+def premultiplied(compositor):
+    return np.asarray(compositor.image, dtype=np.float64)
+
+
+# 不透明・半透明・透明の下地
+BACKDROP = [(40, 120, 200, 255), (250, 200, 20, 128), (90, 30, 160, 64), (0, 0, 0, 0)]
+
+
+def backdrop():
+    image = Image.new('RGBA', (len(BACKDROP), 1))
+    image.putdata(BACKDROP)
+    return Compositor.from_image(image)
+
+
+def check(compositor, expected):
+    buffer = premultiplied(compositor)
+    for x, (src, dst) in enumerate(expected):
+        if src is None:
+            rgb, alpha = np.array(dst[:3]) * dst[3] / 255.0, dst[3]
+        else:
+            rgb, alpha = blend_straight(src, dst, mode=src[4])
+        assert buffer[0, x, 3] == pytest.approx(alpha, abs=1)
+        assert buffer[0, x, :3] == pytest.approx(rgb, abs=1.5)
+
+
+@pytest.mark.parametrize('mode', ['over', 'multiply', 'screen'])
+def test_fill_matches_straight_alpha_reference(mode):
+    compositor = backdrop()
+    compositor.fill((0, 0, 4, 1), (200, 100, 50, 153), mode, opacity=0.5)
+    src = (200, 100, 50, 153 * 0.5, mode)
+    check(compositor, [(src, dst) for dst in BACKDROP])
+
+
+@pytest.mark.parametrize('mode', ['over', 'multiply', 'screen'])
+def test_layer_with_per_pixel_alpha_matches_reference(mode):
+    layer = Image.new('RGBA', (4, 1))
+    colors = [(255, 0, 0, 255), (0, 255, 128, 100), (30, 60, 90, 200), (220, 220, 220, 40)]
+    layer.putdata(colors)
+    compositor = backdrop()
+    compositor.composite(layer, (0, 0), mode)
+    check(compositor, [(src + (mode,), dst) for src, dst in zip(colors, BACKDROP)])
+
+
+@pytest.mark.parametrize('mode', ['over', 'multiply', 'screen'])
+def test_clipped_layer_only_touches_the_visible_part(mode):
+    # 左に2画素はみ出したレイヤー：見えるのは右の2画素だけで、下地の x=0 に重なる
+    layer = Image.new('RGBA', (4, 1))
+    colors = [(255, 255, 255, 255), (255, 255, 255, 255), (10, 200, 30, 180), (180, 40, 250, 90)]
+    layer.putdata(colors)
+    compositor = backdrop()
+    compositor.composite(layer, (-2, 0), mode)
+    check(compositor, [(colors[2] + (mode,), BACKDROP[0]), (colors[3] + (mode,), BACKDROP[1]),
+                       (None, BACKDROP[2]), (None, BACKDROP[3])])
+
+    # 右下にはみ出した塗りも同じ
+    compositor = backdrop()
+    compositor.fill((3, 0, 10, 5), (10, 200, 30, 180), mode)
+    check(compositor, [(None, dst) for dst in BACKDROP[:3]] + [((10, 200, 30, 180, mode), BACKDROP[3])])
@@ -0,0 +1,106 @@
+import json
+import os
+
+import pytest
+
+from design_kit.corpus import Corpus, ConversationNotFoundError, CorpusError
+
+
+def line(conversation_id, text, **tags):
+    return json.dumps({'id': conversation_id, 'tags': tags,
+                       'messages': [{'sender': 'user', 'text': text}]}, ensure_ascii=False) + '\n'
+
+
+LINES = [
+    line('cooking_ja', '親子丼の作り方は？', scenario='cooking', locale='ja'),
+    line('cooking_en', 'How do I make oyakodon?', scenario='cooking', locale='en'),
+    line('travel_ja', '京都で行くべき場所は？', scenario='travel', locale='ja'),
+    line('coding_en', 'x' * 500, scenario='coding', locale='en'),
+]
+
+
+def settle(path):
+    """更新時刻を十分に過去にして、索引をそのまま使える状態にする"""
+    old = path.stat().st_mtime_ns - 10 * 10**9
+    os.utime(path, ns=(old, old))
+
+
+@pytest.fixture
+def corpus_path(tmp_path):
+    path = tmp_path / 'conversations.jsonl'
+    path.write_text(''.join(LINES[:2]) + '\n' + ''.join(LINES[2:]), encoding='utf-8')
+    settle(path)
+    return path
+
+
+def open_corpus(path):
+    return Corpus(str(path), str(path) + '.index.json').load_or_build()
+
+
+def test_build_then_load(corpus_path):
+    built = open_corpus(corpus_path)
+    assert built.rebuilt and len(built) == 4
+    loaded = open_corpus(corpus_path)
+    assert not loaded.rebuilt
+    assert loaded.ids == built.ids == ['cooking_ja', 'cooking_en', 'travel_ja', 'coding_en']
+    conversation = loaded.get('travel_ja')
+    assert conversation.tags == {'scenario': 'travel', 'locale': 'ja', 'length': 'short'}
+    assert conversation.messages[0].text == '京都で行くべき場所は？'
+    assert not loaded.rebuilt
+
+
+def test_select_and_sample(corpus_path):
+    corpus = open_corpus(corpus_path)
+    assert corpus.select(scenario='cooking') == ['cooking_ja', 'cooking_en']
+    assert corpus.select(locale='en', scenario=['cooking', 'coding']) == ['cooking_en', 'coding_en']
+    assert corpus.select(length='long') == ['coding_en']
+    assert corpus.select(scenario='sports') == []
+    assert corpus.select() == corpus.ids
+    assert corpus.tags()['locale'] == {'ja': 2, 'en': 2}
+
+    sample = corpus.sample(2, seed=7, locale='ja')
+    assert sorted(sample) == ['cooking_ja', 'travel_ja']
+    assert corpus.sample(2, seed=3) == corpus.sample(2, seed=3)
+    assert len(set(corpus.sample(3, seed=3))) == 3
+
+
+def test_missing_conversation(corpus_path):
+    with pytest.raises(ConversationNotFoundError):
+        open_corpus(corpus_path).get('sports_ja')
+
+
+def test_duplicate_ids_are_rejected(corpus_path):
+    corpus_path.write_text(''.join(LINES) + LINES[1], encoding='utf-8')
+    with pytest.raises(CorpusError, match='cooking_en'):
+        open_corpus(corpus_path)
+
+
+@pytest.mark.parametrize('bad', ['{"id": "broken"', '{"id": "no_messages"}', '{"messages": []}'])
+def test_malformed_line_is_reported_with_its_line_number(corpus_path, bad):
+    corpus_path.write_text(''.join(LINES[:2]) + bad + '\n' + ''.join(LINES[2:]), encoding='utf-8')
+    with pytest.raises(CorpusError, match=r'conversations\.jsonl:3 '):
+        open_corpus(corpus_path)
+
+
+def test_same_size_edit_within_timestamp_granularity_rebuilds(tmp_path):
+    path = tmp_path / 'conversations.jsonl'
+    path.write_text(LINES[0] + LINES[2], encoding='utf-8')
+    stat = path.stat()
+    open_corpus(path)
+    # 同じサイズで行を入れ替え、更新時刻も元に戻す（刻みの中で保存された場合と同じ）
+    path.write_text(LINES[2] + LINES[0], encoding='utf-8')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    corpus = open_corpus(path)
+    assert corpus.rebuilt and corpus.ids == ['travel_ja', 'cooking_ja']
+
+
+def test_stale_offsets_are_detected_when_reading(corpus_path):
+    open_corpus(corpus_path)
+    stat = corpus_path.stat()
+    # 索引の検査をすり抜ける書き換え（サイズと更新時刻が同じで、行の位置だけ変わる）
+    corpus_path.write_text(LINES[1] + LINES[0] + '\n' + ''.join(LINES[2:]), encoding='utf-8')
+    os.utime(corpus_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    corpus = open_corpus(corpus_path)
+    assert not corpus.rebuilt
+    assert corpus.get('cooking_ja').messages[0].text == '親子丼の作り方は？'
+    assert corpus.rebuilt and corpus.ids[:2] == ['cooking_en', 'cooking_ja']
@@ -0,0 +1,122 @@
+from PIL import Image
+
+from design_kit.displaylist import DisplayList
+from design_kit.fonts import get_font
+
+SIZE = (200, 200)
+
+
+def record(paint):
+    """paint(draw) を記録したディスプレイリストを、最適化したものとしないもので返す"""
+    plain, optimized = DisplayList(SIZE), DisplayList(SIZE)
+    paint(plain)
+    paint(optimized)
+    return plain, optimized.optimize()
+
+
+def rendered(display_list):
+    return display_list.replay(Image.new('RGB', SIZE, (240, 240, 240))).tobytes()
+
+
+def test_off_canvas_primitives_are_culled():
+    def paint(draw):
+        draw.rectangle((10, 10, 60, 40), fill=(255, 0, 0))
+        draw.rectangle((250, 10, 300, 40), fill=(0, 255, 0))              # 右の画面外
+        draw.rounded_rectangle((10, -80, 60, -20), 8, fill=(0, 0, 255))   # 上の画面外
+        draw.circle((-50, 60), 20, fill=(0, 0, 0))                         # 左の画面外
+        draw.text((40, 300), "画面外", fill=(0, 0, 0), font=get_font(14))  # 下の画面外
+        draw.rectangle((70, 10, 120, 40))                                  # 塗りも枠線もない（既定の色の枠線が描かれる）
+        draw.rounded_rectangle((130, 10, 190, 40), 8, outline=(0, 0, 0), width=2)
+        draw.text((10, 60), "Hello", fill=(0, 0, 0), font=get_font(14))
+
+    plain, optimized = record(paint)
+    assert [op.kind for op in optimized.ops] == ['rectangle', 'rectangle', 'rounded_rectangle', 'text']
+    assert optimized.stats['culled'] == 4
+    assert (optimized.stats['before'], optimized.stats['after']) == (8, 4)
+    assert rendered(optimized) == rendered(plain)
+
+
+def test_text_is_grouped_by_state_without_changing_pixels():
+    regular, bold = get_font(14), get_font(14, bold=True)
+
+    def paint(draw):
+        for i in range(4):
+            draw.text((10, 10 + i * 40), f"Row {i}", fill=(0, 0, 0), font=regular)
+            draw.text((110, 10 + i * 40), "Value", fill=(0, 0, 200), font=bold)
+
+    plain, optimized = record(paint)
+    assert optimized.stats['state_changes_before'] == 7
+    assert optimized.stats['state_changes_after'] == 1
+    assert rendered(optimized) == rendered(plain)
+
+
+def test_overlapping_text_keeps_its_order():
+    font = get_font(20)
+
+    def paint(draw):
+        draw.text((10, 10), "AAAA", fill=(255, 0, 0), font=font)
+        draw.text((20, 12), "BBBB", fill=(0, 0, 255), font=font)
+        draw.text((30, 14), "CCCC", fill=(255, 0, 0), font=font)
+
+    plain, optimized = record(paint)
+    assert [op.args[1] for op in optimized.ops] == ["AAAA", "BBBB", "CCCC"]
+    assert rendered(optimized) == rendered(plain)
+
+
+def block(size, color):
+    return Image.new('RGBA', size, color)
+
+
+def test_bubble_pasted_then_redrawn_is_dropped():
+    # 旧 create_modern_chat_screen と同じく、吹き出しを RGBA の板で貼ってから同じ位置に描き直す
+    user = (0, 122, 255)
+
+    def paint(draw):
+        status = block((200, 20), (28, 28, 30, 200))
+        draw.paste(status, (0, 0), status)
+        bubble = block((120, 30), user + (255,))
+        draw.paste(bubble, (60, 30), bubble)
+        draw.rectangle([(60, 30), (179, 59)], fill=user)                    # 板を完全に覆う
+        draw.paste(bubble, (40, 80), bubble)
+        draw.rounded_rectangle([(40, 80), (159, 109)], 12, fill=user)        # 角から板が見える
+        avatar = block((10, 10), (255, 255, 255, 255))
+        draw.paste(avatar, (70, 90), avatar)
+        draw.rounded_rectangle([(40, 80), (159, 109)], 12, fill=(44, 44, 46))  # 角丸の内側の板は隠れる
+        draw.text((50, 85), "Hello", fill=(255, 255, 255), font=get_font(12))
+
+    plain, optimized = record(paint)
+    assert optimized.stats['occluded'] == 2
+    assert [op.kind for op in optimized.ops] == [
+        'paste', 'rectangle', 'paste', 'rounded_rectangle', 'rounded_rectangle', 'text']
+    assert rendered(optimized) == rendered(plain)
+
+
+def test_cover_spanning_several_tiles_hides_ops_in_any_of_them():
+    def paint(draw):
+        for x in range(0, 200, 30):
+            draw.circle((x + 10, 150), 8, fill=(255, 0, 0))
+        draw.text((130, 140), "tile", fill=(0, 0, 0), font=get_font(12))
+        draw.rectangle((0, 120, 199, 180), fill=(20, 20, 20))
+
+    plain, optimized = record(paint)
+    assert optimized.stats['occluded'] == 8
+    assert len(optimized.ops) == 1
+    assert rendered(optimized) == rendered(plain)
+
+
+def test_adjacent_fills_of_the_same_color_are_merged():
+    def paint(draw):
+        for x in range(10, 190, 20):
+            draw.rectangle((x, 10, x + 19, 30), fill=(0, 200, 0))            # 横に接する9個
+        draw.rectangle((10, 31, 189, 40), fill=(0, 200, 0))                   # その下に接する
+        draw.rectangle((10, 60, 50, 80), fill=(0, 0, 200))
+        draw.rectangle((45, 70, 60, 90), fill=(200, 0, 0))                     # 間で重なる別の色
+        draw.rectangle((51, 60, 90, 80), fill=(0, 0, 200))                     # 接するが前には移せない
+        draw.rectangle((10, 100, 50, 120), fill=(0, 0, 200, 128))              # 半透明はまとめない
+        draw.rectangle((51, 100, 90, 120), fill=(0, 0, 200, 128))
+
+    plain, optimized = record(paint)
+    assert optimized.stats['merged'] == 9
+    assert optimized.ops[0].bounds == (10, 10, 190, 41)
+    assert len(optimized.ops) == 6
+    assert rendered(optimized) == rendered(plain)
@@ -0,0 +1,36 @@
+import pytest
+from PIL import Image, ImageChops
+
+from design_kit.coverage import covering_face
+from design_kit.emoji import ZWJ, _render_mono, split_runs
+
+SUN, CLOUD = '☀', '☁'
+UNCOVERED = '\U000F0000'  # どのフォントにもない私用領域の文字
+needs_symbols = pytest.mark.skipif(covering_face(ord(SUN)) is None or covering_face(ord(CLOUD)) is None,
+                                   reason="☀ と ☁ を含むフォントがない")
+
+
+def test_sequences_stay_in_one_cluster():
+    assert split_runs(f'a{SUN}{ZWJ}{CLOUD}️b🇯🇵👍🏽') == [
+        (False, 'a'), (True, f'{SUN}{ZWJ}{CLOUD}️'), (False, 'b'), (True, '🇯🇵'), (True, '👍🏽')]
+
+
+@needs_symbols
+def test_mono_zwj_sequence_draws_every_component():
+    sun, cloud = _render_mono(SUN, 32), _render_mono(CLOUD, 32)
+    image, left, top, advance, color = _render_mono(f'{SUN}{ZWJ}{CLOUD}️', 32)
+    assert advance == sun[3] + cloud[3] and not color
+
+    # 要素を送り幅だけずらして並べたものと同じ
+    expected = Image.new('L', image.size, 0)
+    for (part, part_left, part_top, *_), x in ((sun, 0), (cloud, round(sun[3]))):
+        expected.paste(part.getchannel('A'), (x + part_left - left, part_top - top))
+    assert ImageChops.difference(image.getchannel('A'), expected).getbbox() is None
+
+
+@needs_symbols
+def test_mono_skips_modifiers_and_uncovered_components():
+    sun = _render_mono(SUN, 32)
+    for cluster in (f'{SUN}️', f'{SUN}\U0001F3FD', f'{SUN}{ZWJ}{UNCOVERED}'):
+        image, *rest = _render_mono(cluster, 32)
+        assert rest == list(sun[1:]) and image.tobytes() == sun[0].tobytes()
@@ -0,0 +1,45 @@
+import os
+import shutil
+
+import pytest
+
+from design_kit.font_index import FontIndex
+
+DEJAVU = '/usr/share/fonts/truetype/dejavu'
+pytestmark = pytest.mark.skipif(not os.path.isdir(DEJAVU), reason="DejaVu フォントがない")
+
+
+@pytest.fixture
+def fonts(tmp_path):
+    directory = tmp_path / 'fonts'
+    directory.mkdir()
+    shutil.copy(os.path.join(DEJAVU, 'DejaVuSans.ttf'), directory / 'Body.ttf')
+    return directory
+
+
+def open_index(fonts):
+    return FontIndex(str(fonts.parent / 'font_index.json'), [str(fonts)]).load_or_build()
+
+
+def test_unchanged_fonts_reuse_the_index(fonts):
+    assert open_index(fonts).rebuilt
+    index = open_index(fonts)
+    assert not index.rebuilt and index.families() == ['DejaVu Sans']
+
+
+def test_added_font_is_indexed(fonts):
+    open_index(fonts)
+    shutil.copy(os.path.join(DEJAVU, 'DejaVuSansMono.ttf'), fonts / 'Code.ttf')
+    index = open_index(fonts)
+    assert index.rebuilt and index.families() == ['DejaVu Sans', 'DejaVu Sans Mono']
+
+
+def test_font_overwritten_in_place_is_rescanned(fonts):
+    open_index(fonts)
+    directory_mtime = fonts.stat().st_mtime_ns
+    # 同じファイル名への上書きではディレクトリの更新時刻は変わらない
+    with open(fonts / 'Body.ttf', 'wb') as f:
+        f.write(open(os.path.join(DEJAVU, 'DejaVuSerif.ttf'), 'rb').read())
+    assert fonts.stat().st_mtime_ns == directory_mtime
+    index = open_index(fonts)
+    assert index.rebuilt and index.families() == ['DejaVu Serif']
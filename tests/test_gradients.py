@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from design_kit import gradients
+from design_kit.gradients import GradientCache, conic_gradient, linear_gradient, radial_gradient
+
+STOPS = ['#ff0000', '#0000ff']
+
+
+@pytest.mark.filterwarnings('error')
+@pytest.mark.parametrize('size, center, radius', [
+    ((1, 1), None, None),        # 既定の半径（中心から角まで）が 0
+    ((5, 3), (2, 1), 0),
+    ((5, 3), (2, 1), 0.0),
+])
+def test_degenerate_radius_paints_first_stop_at_center(size, center, radius):
+    pixels = np.asarray(radial_gradient(*size, STOPS, center, radius))
+    cx, cy = center or (0, 0)
+    assert tuple(pixels[cy, cx]) == (255, 0, 0)
+    others = np.delete(pixels.reshape(-1, 3), cy * size[0] + cx, axis=0)
+    assert (others == (0, 0, 255)).all()
+
+
+def test_radius_spans_first_to_last_stop():
+    pixels = np.asarray(radial_gradient(21, 1, STOPS, (0, 0), 10))
+    assert tuple(pixels[0, 0]) == (255, 0, 0)
+    assert tuple(pixels[0, 10]) == tuple(pixels[0, 20]) == (0, 0, 255)
+    assert 0 < pixels[0, 5, 2] < 255
+
+
+def test_linear_gradient_is_broadcast_from_a_cached_ramp():
+    vertical = np.asarray(linear_gradient(4, 10, STOPS, 'vertical'))
+    assert (vertical == vertical[:, :1]).all()
+    assert tuple(vertical[0, 0]) == (255, 0, 0) and tuple(vertical[5, 3]) == (127, 0, 127)
+    horizontal = np.asarray(linear_gradient(10, 4, STOPS, 'horizontal'))
+    assert (horizontal == vertical.transpose(1, 0, 2)).all()
+    # 返した画像を書き換えても次の呼び出しに影響しない
+    image = linear_gradient(4, 10, STOPS, 'vertical')
+    image.putpixel((0, 0), (0, 255, 0))
+    assert (np.asarray(linear_gradient(4, 10, STOPS, 'vertical')) == vertical).all()
+
+
+def test_full_canvas_gradients_stay_within_the_byte_budget(monkeypatch):
+    cache = GradientCache(budget=3 * 1170 * 2532 * 4)
+    monkeypatch.setattr(gradients, 'images', cache)
+    for angle in range(10):
+        linear_gradient(1170, 2532, STOPS, 30 + angle)
+    radial_gradient(1170, 2532, STOPS)
+    conic_gradient(1170, 2532, STOPS)
+    stats = cache.stats()
+    assert stats['entries'] == 3 and stats['bytes'] <= cache.budget
+    assert stats['evictions'] == 9
+    radial_gradient(1170, 2532, STOPS)
+    assert cache.stats()['hits'] == 1
+
+
+def test_image_larger_than_the_budget_is_not_stored():
+    cache = GradientCache(budget=100)
+    image = cache.get('big', lambda: linear_gradient(10, 10, STOPS, 45))
+    assert image.size == (10, 10)
+    assert cache.stats()['entries'] == 0 and cache.nbytes == 0
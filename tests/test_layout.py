@@ -0,0 +1,26 @@
+from design_kit.layout import LayoutCache, flow
+
+
+def test_block_heights_are_measured_once():
+    cache = LayoutCache()
+    assert cache.get(('bubble', 'こんにちは', 300), lambda: 48) == 48
+    assert cache.get(('bubble', 'こんにちは', 300), lambda: 0) == 48
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['blocks']) == (1, 1, 1)
+
+
+def test_least_recently_used_heights_are_evicted():
+    cache = LayoutCache(maxsize=3)
+    for index in range(3):
+        cache.get(index, lambda: 10)
+    cache.get(0, None)
+    cache.get(3, lambda: 10)
+    assert list(cache._heights) == [2, 0, 3]
+    for index in range(100):
+        cache.get(('other', index), lambda: 10)
+    assert cache.stats()['blocks'] == 3
+
+
+def test_flow_moves_blocks_that_do_not_fit_to_the_next_page():
+    pages = flow([40, 40, 40], [10, 10, 10], 0, 100)
+    assert pages == [[(0, 0), (1, 50)], [(2, 0)]]
@@ -0,0 +1,90 @@
+import pytest
+
+from design_kit.fonts import get_font
+from design_kit.linebreak import NO_END, NO_START, break_lines, break_opportunities
+from design_kit.metrics import get_metrics
+
+# (テキスト, 行幅, 期待する行)。幅は1文字1として測る
+CASES = [
+    # 行頭禁則：句読点・閉じ括弧は前の文字と一緒に送る
+    ('これはテストです、そして。次の文です。', 7, ['これはテストで', 'す、そして。次', 'の文です。']),
+    ('東京都、大阪府。', 2, ['東京', '都、', '大阪', '府。']),
+    ('すごい！？ですね', 4, ['すご', 'い！？で', 'すね']),
+    ('今日は（晴れ）です', 5, ['今日は（晴', 'れ）です']),
+    # 行末禁則：開き括弧は次の文字と一緒に送る
+    ('「引用」と（注）', 3, ['「引', '用」と', '（注）']),
+    ('ホテル「ニューオータニ」です', 6, ['ホテル', '「ニューオー', 'タニ」です']),
+    # 英単語と URL は途中で分けない（URL はハイフンの後でも改行しない）
+    ('The quick brown fox', 10, ['The quick', 'brown fox']),
+    ('ab-cd ef', 4, ['ab-', 'cd', 'ef']),
+    ('see https://ex.com/long-path now', 25, ['see', 'https://ex.com/long-path', 'now']),
+    ('詳細は https://ex.jp/a-b を参照', 18, ['詳細は', 'https://ex.jp/a-b', 'を参照']),
+    # 1行に収まらない語は文字単位で分ける（そのときも禁則はできるだけ守る）
+    ('internationalization', 8, ['internat', 'ionaliza', 'tion']),
+    ('abc、def（ghi', 3, ['ab', 'c、d', 'ef', '（gh', 'i']),
+    # 強制改行と空の段落
+    ('一行目\n\n二行目', 10, ['一行目', '', '二行目']),
+]
+
+
+@pytest.mark.parametrize('text, width, expected', CASES)
+def test_break_lines(text, width, expected):
+    lines = break_lines(text, None, width, measure=len)
+    assert lines == expected
+    for line in lines:
+        assert len(line) <= width
+    for line in filter(None, lines):
+        assert line[0] not in NO_START and line[-1] not in NO_END
+
+
+def test_lines_fit_the_measured_font_width():
+    font = get_font(16)
+    measure = get_metrics(font).width
+    text = '通知が届かないときは、設定の手順 https://mindbridge.example/help-center/notifications を確認してください。'
+    lines = break_lines(text, font, 420)
+    assert len(lines) > 1 and ''.join(lines).replace(' ', '') == text.replace(' ', '')
+    assert all(measure(line) <= 420 for line in lines)
+    assert 'https://mindbridge.example/help-center/notifications' in lines
+
+
+PARAGRAPH = '設定画面から「通知」を開き、Temperature と Top-p を調整してください。The quick brown fox jumps over AVA. ' * 8
+
+
+def greedy(text, width, measure):
+    """各行を、実際の幅が収まる最後の改行可能位置で終える素朴な分割（比較用）"""
+    lines, start = [], 0
+    while start < len(text):
+        ends = [end for end in break_opportunities(text) if end > start]
+        end = [end for end in ends if measure(text[start:end].rstrip()) <= width][-1]
+        lines.append(text[start:end].rstrip())
+        start = end + len(text[end:]) - len(text[end:].lstrip())
+    return lines
+
+
+@pytest.mark.parametrize('width', [160, 240, 420])
+def test_prefix_sums_match_measuring_each_line(width):
+    font = get_font(16)
+    assert break_lines(PARAGRAPH, font, width) == greedy(PARAGRAPH, width, get_metrics(font).width)
+
+
+def test_each_character_is_measured_a_bounded_number_of_times():
+    measured = []
+
+    def measure(text):
+        measured.append(len(text))
+        return len(text)
+
+    lines = break_lines(PARAGRAPH * 4, None, 40, measure)
+    assert len(lines) > 50
+    # 1文字ずつの計測と、選んだ行ごとの確認だけ（行ごとに段落の残りを測り直さない）
+    assert sum(measured) <= 2 * len(PARAGRAPH * 4)
+
+
+def test_chosen_break_is_confirmed_with_the_exact_measure():
+    # 1文字ずつの合計より広くなる組（シェーピングの合字・カーニングの代わり）
+    def measure(text):
+        return len(text) + text.count('AV') * 3
+
+    lines = break_lines('AVAVAVAV AVAVAV AV AVAVAVAVAV', None, 10, measure)
+    assert all(measure(line) <= 10 for line in lines)
+    assert ''.join(lines) == 'AVAVAVAVAVAVAVAVAVAVAVAVAV'
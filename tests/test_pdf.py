@@ -0,0 +1,147 @@
+import re
+
+import pytest
+from PIL import ImageFont
+
+from design_kit.pdf import EmbeddedFont, PdfWriter
+from design_kit.sfnt import cff_cids, read_tables
+from design_kit.vector import VectorCanvas
+from fontdata import ENDCHAR, RETURN, build_cff, number, write_otf
+
+MAPPING = {ord('A'): 1, ord('B'): 2, ord('C'): 3}
+CIDS = [500, 700, 900]
+
+# A はグローバルサブルーチン 0、B は hintmask の後でローカルサブルーチン 0 を呼ぶ。
+# 使わない C だけがグローバルサブルーチン 1 を呼び、アウトラインも大きい
+CHARSTRINGS = [
+    ENDCHAR,
+    number(100) + number(100) + bytes([21]) + number(-107) + bytes([29]) + ENDCHAR,
+    number(10) + number(20) + bytes([18]) + number(5) + number(6) + bytes([19, 0xC0])
+    + number(100) + number(100) + bytes([21]) + number(-107) + bytes([10]) + ENDCHAR,
+    number(0) + number(0) + bytes([21]) + (number(1) + number(1) + bytes([5])) * 200
+    + number(-106) + bytes([29]) + ENDCHAR,
+]
+# サブルーチンは三角形を描く（閉じた輪郭なので Pillow で描くと塗りが出る）
+GLOBAL_SUBRS = [
+    number(50) + number(0) + bytes([5]) + number(0) + number(50) + bytes([5]) + RETURN,
+    number(0) + number(50) + bytes([5]) + number(-50) + number(0) + bytes([5]) + RETURN,
+]
+LOCAL_SUBRS = [
+    number(0) + number(40) + bytes([5]) + number(40) + number(0) + bytes([5]) + RETURN,
+    number(5) + number(5) + bytes([5]) + number(5) + number(-5) + bytes([5]) + RETURN,
+]
+
+
+@pytest.fixture(params=[True, False], ids=['cid-keyed', 'name-keyed'])
+def cff_font(request, tmp_path):
+    cids = CIDS if request.param else None
+    cff = build_cff(CHARSTRINGS, GLOBAL_SUBRS, LOCAL_SUBRS, cids)
+    return write_otf(str(tmp_path / 'test.otf'), cff, len(CHARSTRINGS), MAPPING), cids
+
+
+def subset_font(font, tmp_path):
+    path = tmp_path / 'subset.otf'
+    path.write_bytes(font.font_file())
+    return read_tables(str(path))
+
+
+def test_cid_keyed_cff_is_encoded_with_charset_cids(cff_font):
+    path, cids = cff_font
+    font = EmbeddedFont(path, 0, 'Test')
+    codes = font.encode('AB')
+    expected = [cids[0], cids[1]] if cids else [1, 2]
+    assert codes == ''.join(f'{code:04X}' for code in expected)
+
+
+def test_cff_subset_round_trips_glyph_ids(cff_font, tmp_path):
+    path, cids = cff_font
+    font = EmbeddedFont(path, 0, 'Test')
+    codes = font.encode('AB')
+    subset = subset_font(font, tmp_path)['CFF ']
+
+    # PDF の文字コード → (charset) → グリフ ID が元のフォントの cmap のグリフに戻る
+    subset_cids = cff_cids(subset)
+    for i, ch in enumerate('AB'):
+        code = int(codes[i * 4:i * 4 + 4], 16)
+        glyph = subset_cids.index(code) if cids else code
+        assert glyph == MAPPING[ord(ch)]
+    assert subset_cids == ([0] + CIDS if cids else None)
+
+
+def test_cff_subset_renders_like_the_original(cff_font, tmp_path):
+    path, _ = cff_font
+    font = EmbeddedFont(path, 0, 'Test')
+    font.encode('AB')
+    subset_path = tmp_path / 'subset.otf'
+    subset_path.write_bytes(font.font_file())
+
+    # FreeType で読み直し、使ったグリフは元と同じ形・使わないグリフは空になる
+    original = ImageFont.truetype(path, 100)
+    subset = ImageFont.truetype(str(subset_path), 100)
+    for ch in 'AB':
+        assert subset.getmask(ch).getbbox() is not None
+        assert bytes(subset.getmask(ch)) == bytes(original.getmask(ch))
+    assert original.getmask('C').getbbox() is not None
+    assert subset.getmask('C').getbbox() is None
+
+
+def test_cff_subset_keeps_used_glyphs_and_subroutines(cff_font, tmp_path):
+    path, _ = cff_font
+    font = EmbeddedFont(path, 0, 'Test')
+    font.encode('AB')
+    original = read_tables(path)['CFF ']
+    subset = subset_font(font, tmp_path)['CFF ']
+
+    for data in (original, subset):
+        assert data.count(CHARSTRINGS[1]) == 1
+        assert data.count(CHARSTRINGS[2]) == 1
+        assert data.count(GLOBAL_SUBRS[0]) == 1
+        assert data.count(LOCAL_SUBRS[0]) == 1
+    # 使わないグリフ C と、C だけが呼ぶサブルーチン・どこからも呼ばれないサブルーチンは空になる
+    assert CHARSTRINGS[3] not in subset
+    assert GLOBAL_SUBRS[1] not in subset
+    assert LOCAL_SUBRS[1] not in subset
+    assert len(subset) < len(original)
+
+
+def test_cff_font_object_uses_codes_for_widths_and_to_unicode(cff_font):
+    path, cids = cff_font
+    font = EmbeddedFont(path, 0, 'Test')
+    font.encode('AB')
+    writer = PdfWriter(VectorCanvas((10, 10)))
+    writer._font_object(font)
+    body = b'\n'.join(writer.objects)
+    code_a, code_b = (cids[0], cids[1]) if cids else (1, 2)
+    assert b'/Subtype /CIDFontType0' in body
+    assert b'/CIDToGIDMap' not in body
+    assert re.search(rb'/W \[%d \[500\] %d \[500\]\]' % (code_a, code_b), body)
+    assert b'/FontFile3' in body and b'/Subtype /OpenType' in body
+    to_unicode = PdfWriter._to_unicode(font)
+    assert f'<{code_a:04X}> <0041>' in to_unicode
+    assert f'<{code_b:04X}> <0042>' in to_unicode
+
+
+def test_xref_offsets_point_at_objects(vector_canvas):
+    data = vector_canvas.to_pdf()
+    assert data.startswith(b'%PDF-1.6\n') and data.endswith(b'%%EOF\n')
+
+    startxref = int(re.search(rb'startxref\n(\d+)\n%%EOF\n$', data).group(1))
+    assert data[startxref:].startswith(b'xref\n')
+    header, count = re.match(rb'xref\n0 (\d+)\n', data[startxref:]).group(0, 1)
+    count = int(count)
+    entries = data[startxref + len(header):].split(b'\n')[:count]
+    assert entries[0] == b'0000000000 65535 f '
+    for number, entry in enumerate(entries[1:], 1):
+        offset, generation, kind = entry.split()
+        assert (generation, kind, len(entry)) == (b'00000', b'n', 19)
+        assert data[int(offset):].startswith(f'{number} 0 obj\n'.encode())
+    assert re.search(rb'trailer\n<< /Size %d /Root \d+ 0 R >>' % count, data)
+
+
+def test_stream_lengths_match_their_data(vector_canvas):
+    data = vector_canvas.to_pdf()
+    streams = list(re.finditer(rb'/Length (\d+)[^>]*>>\nstream\n', data))
+    assert streams
+    for match in streams:
+        end = match.end() + int(match.group(1))
+        assert data[end:end + len(b'\nendstream')] == b'\nendstream'
@@ -0,0 +1,59 @@
+import os
+
+import pytest
+from PIL import ImageFont
+
+from design_kit.sfnt import build_sfnt, glyph_map, read_faces, read_tables, subset_truetype
+from fontdata import ENDCHAR, build_cff, build_cmap, build_tables
+
+DEJAVU = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
+needs_dejavu = pytest.mark.skipif(not os.path.exists(DEJAVU), reason="DejaVu Sans がない")
+
+# BMP の文字と、サロゲートペアになる絵文字・CJK 拡張 B の文字
+MAPPING = {ord('A'): 1, ord('B'): 2, ord('あ'): 3, 0x1F600: 4, 0x20B9F: 5}
+
+
+@pytest.mark.parametrize('format12, expected', [
+    (True, MAPPING),
+    (False, {code: glyph for code, glyph in MAPPING.items() if code <= 0xFFFF}),
+], ids=['format12', 'format4'])
+def test_glyph_map_reads_bmp_and_non_bmp_codepoints(format12, expected):
+    assert glyph_map(build_cmap(MAPPING, format12)) == expected
+
+
+@pytest.mark.parametrize('format12, coverage', [
+    (True, [(ord('A'), ord('B')), (ord('あ'), ord('あ')), (0x1F600, 0x1F600), (0x20B9F, 0x20B9F)]),
+    (False, [(ord('A'), ord('B')), (ord('あ'), ord('あ'))]),
+], ids=['format12', 'format4'])
+def test_read_faces_coverage(tmp_path, format12, coverage):
+    tables = build_tables(6, MAPPING, format12)
+    tables['CFF '] = build_cff([ENDCHAR] * 6, [], [])
+    path = tmp_path / 'face.otf'
+    path.write_bytes(build_sfnt(tables, cff=True))
+    [face] = read_faces(str(path))
+    assert face['coverage'] == coverage
+
+
+@needs_dejavu
+def test_truetype_subset_reparses_with_freetype(tmp_path):
+    tables = read_tables(DEJAVU)
+    cmap = glyph_map(tables['cmap'])
+    # Ä は A とダイエレシスの複合グリフ、✂ は cmap の idRangeOffset で引くセグメントにある
+    used = 'AgÄ✂'
+    path = tmp_path / 'subset.ttf'
+    path.write_bytes(subset_truetype(tables, {cmap[ord(ch)] for ch in used}))
+
+    subset_tables = read_tables(str(path))
+    assert {'cmap', 'head', 'hhea', 'hmtx', 'maxp', 'glyf', 'loca'} <= set(subset_tables)
+    assert subset_tables['maxp'] == tables['maxp']
+    assert len(subset_tables['glyf']) < len(tables['glyf']) // 10
+
+    # FreeType で読み直し、使ったグリフは元と同じ形・使わないグリフは空になる
+    original = ImageFont.truetype(DEJAVU, 48)
+    subset = ImageFont.truetype(str(path), 48)
+    for ch in used:
+        assert subset.getmask(ch).getbbox() is not None
+        assert bytes(subset.getmask(ch)) == bytes(original.getmask(ch))
+    for ch in 'BZ✁':
+        assert original.getmask(ch).getbbox() is not None
+        assert subset.getmask(ch).getbbox() is None
@@ -0,0 +1,29 @@
+import xml.etree.ElementTree as ET
+
+SVG = '{http://www.w3.org/2000/svg}'
+
+
+def test_svg_is_well_formed(vector_canvas):
+    root = ET.fromstring(vector_canvas.to_svg())
+    assert root.tag == f'{SVG}svg'
+    assert (root.get('width'), root.get('height'), root.get('viewBox')) == ('320', '240', '0 0 320 240')
+
+    # 記号はエスケープされ、複数行のテキストは1行ずつ text 要素になる
+    texts = [element.text for element in root.iter(f'{SVG}text')]
+    assert texts == ['a < b && "c" > \'d\'', '設定', 'MindBridge']
+
+    # グラデーションの参照先が defs にある
+    ids = {element.get('id') for element in root.iter() if element.tag.endswith('Gradient')}
+    refs = {element.get('fill')[5:-1] for element in root.iter(f'{SVG}rect')
+            if element.get('fill', '').startswith('url(')}
+    assert len(ids) == 2 and refs == ids
+
+    [image] = root.iter(f'{SVG}image')
+    assert image.get('href').startswith('data:image/png;base64,')
+
+
+def test_save_picks_format_by_extension(vector_canvas, tmp_path):
+    vector_canvas.save(str(tmp_path / 'out.svg'))
+    vector_canvas.save(str(tmp_path / 'out.pdf'))
+    ET.parse(tmp_path / 'out.svg')
+    assert (tmp_path / 'out.pdf').read_bytes().startswith(b'%PDF-')